@@ -5,6 +5,8 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
+from agent_factory.observability.tracing import traced
+
 logger = logging.getLogger(__name__)
 
 
@@ -103,6 +105,7 @@ class JudgeAgent:
                 raise ImportError("litellm not installed")
         return self._llm
     
+    @traced("llm.call")
     def _call_llm(self, prompt: str, system_prompt: str = "") -> str:
         """Call LLM with the given prompt."""
         llm = self._get_llm()
@@ -6,6 +6,12 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
+from agent_factory.observability.tracing import traced
+from agent_factory.observability.hooks import HOOKS, FILE_SCAN
+from agent_factory.files import PatternSet, get_file_index, get_symbol_index, pack_context
+from agent_factory.llm.budget import BudgetManager
+from agent_factory.llm.router import BudgetExceededError, budgeted_completion
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,8 +42,8 @@ PLANNER_ANALYSIS_PROMPT = """Analyze this codebase and generate {max_suggestions
 ## Repository Structure
 {file_list}
 
-## Sample File Contents
-{sample_files}
+## Code Context
+{code_context}
 
 ## Your Task
 Generate exactly {max_suggestions} improvement suggestions. For each suggestion, provide:
@@ -69,7 +75,7 @@ class PlannerAgent:
     
     The Planner's job is to:
     1. Analyze the target codebase structure
-    2. Read sample files to understand patterns
+    2. Pack ranked code context (signatures, central modules) to understand patterns
     3. Generate specific, actionable improvement suggestions
     4. Prioritize suggestions by impact
     """
@@ -81,12 +87,20 @@ class PlannerAgent:
         target_repo: str = ".",
         ollama_base_url: str = "http://localhost:11434",
         num_ctx: int = 32768,
+        context_tokens: int = 4000,
+        index_cache_path: Optional[str] = None,
+        budget: Optional[BudgetManager] = None,
     ):
         self.agent_name = agent_name
         self.model = model
         self.target_repo = Path(target_repo).resolve()
         self.ollama_base_url = ollama_base_url
         self.num_ctx = num_ctx
+        # Prompt budget for packed code context (never more than a quarter of the window)
+        self.context_tokens = min(context_tokens, num_ctx // 4)
+        self.index_cache_path = index_cache_path
+        # Shared spend limits, checked under the "agent:<agent_name>" tag
+        self.budget = budget
         self.planning_interval = 60
         
         self._llm = None
@@ -106,6 +120,7 @@ class PlannerAgent:
                 raise ImportError("litellm not installed. Run: pip install litellm")
         return self._llm
     
+    @traced("llm.call")
     def _call_llm(self, prompt: str, system_prompt: str = "") -> str:
         """Call LLM with the given prompt."""
         llm = self._get_llm()
@@ -115,11 +130,17 @@ class PlannerAgent:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
         
-        response = llm.completion(
-            model=f"ollama/{self.model}",
-            messages=messages,
-            api_base=self.ollama_base_url,
-            num_ctx=self.num_ctx,
+        response = budgeted_completion(
+            self.budget,
+            messages,
+            self.model,
+            lambda model: llm.completion(
+                model=f"ollama/{model}",
+                messages=messages,
+                api_base=self.ollama_base_url,
+                num_ctx=self.num_ctx,
+            ),
+            tags=[f"agent:{self.agent_name}"],
         )
         
         return response.choices[0].message.content
@@ -127,50 +148,25 @@ class PlannerAgent:
     def _scan_files(self, max_files: int = 50) -> List[str]:
         """Scan repository for code files."""
         extensions = {'.py', '.ts', '.js', '.tsx', '.jsx', '.go', '.rs', '.java'}
-        exclude_dirs = {'node_modules', '__pycache__', '.git', 'venv', '.venv', 'dist', 'build'}
-        
-        files = []
-        for path in self.target_repo.rglob('*'):
-            if path.is_file() and path.suffix in extensions:
-                # Skip excluded directories
-                if any(ex in path.parts for ex in exclude_dirs):
-                    continue
-                rel_path = str(path.relative_to(self.target_repo))
-                files.append(rel_path)
-                if len(files) >= max_files:
-                    break
+        exclude_dirs = PatternSet(['dist/', 'build/'])
+        with HOOKS.hook(FILE_SCAN, root=str(self.target_repo)) as hook_ctx:
+            # Shared .gitignore-aware index (cached across scans)
+            index = get_file_index(self.target_repo)
+            files = index.list_source_files(extensions, exclude=exclude_dirs)[:max_files]
+            if hook_ctx is not None:
+                hook_ctx.result = files
         
         return sorted(files)
     
-    def _read_sample_files(self, files: List[str], max_chars: int = 15000) -> str:
-        """Read sample file contents for analysis."""
-        samples = []
-        chars_used = 0
-        
-        # Prioritize important files
-        priority_files = ['main.py', 'app.py', 'index.ts', 'index.js', '__init__.py', 'cli.py']
-        sorted_files = sorted(files, key=lambda f: (
-            0 if any(p in f for p in priority_files) else 1,
-            f
-        ))
-        
-        for file_path in sorted_files[:10]:  # Max 10 files
-            full_path = self.target_repo / file_path
-            try:
-                content = full_path.read_text(encoding='utf-8')
-                if len(content) > 3000:
-                    content = content[:3000] + "\n... (truncated)"
-                
-                sample = f"### {file_path}\n```\n{content}\n```\n"
-                if chars_used + len(sample) > max_chars:
-                    break
-                    
-                samples.append(sample)
-                chars_used += len(sample)
-            except Exception:
-                continue
+    def _build_context(self) -> str:
+        """
+        Pack ranked repository context (signatures, key files) for the prompt.
         
-        return "\n".join(samples)
+        Uses the symbol index, rebuilt only when the tree changes, and
+        stays within context_tokens.
+        """
+        index = get_symbol_index(self.target_repo, cache_path=self.index_cache_path)
+        return pack_context(index, budget_tokens=self.context_tokens)
     
     def generate_suggestions(self, max_count: int = 5) -> List[Dict[str, Any]]:
         """
@@ -181,6 +177,9 @@ class PlannerAgent:
         Returns:
             List of suggestion dictionaries with title, description, affected_files,
             priority, acceptance_criteria, and reasoning.
+            
+        Raises:
+            BudgetExceededError: If the shared budget rejects the LLM call
         """
         logger.info(f"Planner analyzing {self.target_repo}...")
         
@@ -192,14 +191,14 @@ class PlannerAgent:
         
         file_list = "\n".join(f"- {f}" for f in files)
         
-        # 2. Read sample files
-        sample_content = self._read_sample_files(files)
+        # 2. Pack the most relevant code context under the token budget
+        code_context = self._build_context()
         
         # 3. Build analysis prompt
         prompt = PLANNER_ANALYSIS_PROMPT.format(
             max_suggestions=max_count,
             file_list=file_list,
-            sample_files=sample_content
+            code_context=code_context
         )
         
         # 4. Call LLM
@@ -234,6 +233,8 @@ class PlannerAgent:
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response: {e}")
             return []
+        except BudgetExceededError:
+            raise
         except Exception as e:
             logger.error(f"Planner LLM call failed: {e}")
             return []
@@ -8,6 +8,7 @@ Planner → Worker → Judge pipeline powered by local Ollama models via OpenHan
 from .models import (
     Suggestion,
     SuggestionStatus,
+    IterationRecord,
     SuggestionCategory,
     Verdict,
     VerdictStatus,
@@ -16,12 +17,16 @@ from .models import (
 )
 from .config import AutonomousConfig
 from .suggestion_generator import SuggestionGenerator
+from .analysis_cache import AnalysisCache
+from .journal import RunJournal
+from .history_store import SQLiteHistoryStore
 from .autonomous_runner import AutonomousRunner
 
 __all__ = [
     # Models
     "Suggestion",
     "SuggestionStatus",
+    "IterationRecord",
     "SuggestionCategory",
     "Verdict",
     "VerdictStatus",
@@ -31,5 +36,8 @@ __all__ = [
     "AutonomousConfig",
     # Core
     "SuggestionGenerator",
+    "AnalysisCache",
+    "RunJournal",
+    "SQLiteHistoryStore",
     "AutonomousRunner",
 ]
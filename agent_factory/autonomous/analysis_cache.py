@@ -0,0 +1,170 @@
+"""
+Analysis Cache - Content-hash incremental cache for file analysis.
+
+Persists per-file LLM analysis results under the history directory, keyed
+by (content hash, analysis type, model, prompt version). Unchanged files
+reuse their prior improvements on re-runs; only changed files are sent to
+the LLM.
+
+Layout:
+    <history_dir>/analysis_cache/<key[:2]>/<key>.json
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+CACHE_DIRNAME = "analysis_cache"
+
+
+def hash_content(content: str) -> str:
+    """SHA-256 of file content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class AnalysisCache:
+    """
+    On-disk cache of per-file analysis results.
+
+    Each entry is one small JSON file written atomically (temp file +
+    os.replace), so concurrent analysis workers can read and write
+    without locking.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(content_hash: str, analysis_type: str, model: str, prompt_version: str) -> str:
+        """Cache key for one (content, analysis type, model, prompt version)."""
+        raw = f"{content_hash}\0{analysis_type}\0{model}\0{prompt_version}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(
+        self,
+        content_hash: str,
+        analysis_type: str,
+        model: str,
+        prompt_version: str
+    ) -> Optional[List[dict]]:
+        """
+        Look up cached improvements.
+
+        Returns:
+            A copy of the cached improvements, or None on a miss
+        """
+        path = self._entry_path(self.make_key(content_hash, analysis_type, model, prompt_version))
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            improvements = entry["improvements"]
+        except FileNotFoundError:
+            improvements = None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring corrupt analysis cache entry {path}: {e}")
+            improvements = None
+
+        with self._lock:
+            if improvements is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return copy.deepcopy(improvements) if improvements is not None else None
+
+    def put(
+        self,
+        content_hash: str,
+        analysis_type: str,
+        model: str,
+        prompt_version: str,
+        improvements: List[dict],
+        file_path: str = ""
+    ) -> None:
+        """
+        Store improvements for one file and analysis type.
+
+        Args:
+            content_hash: hash_content() of the analyzed source
+            analysis_type: Analysis category
+            model: Model that produced the result
+            prompt_version: Version of the analysis prompts
+            improvements: Parsed improvements (file-specific fields are stripped)
+            file_path: Source path, recorded for inspection only
+        """
+        key = self.make_key(content_hash, analysis_type, model, prompt_version)
+        path = self._entry_path(key)
+        entry = {
+            "file_path": file_path,
+            "analysis_type": analysis_type,
+            "model": model,
+            "prompt_version": prompt_version,
+            "content_hash": content_hash,
+            "created_at": time.time(),
+            "improvements": [
+                {k: v for k, v in imp.items() if k != "affected_files"}
+                for imp in improvements
+            ],
+        }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp_", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, default=str)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write analysis cache entry for {file_path}: {e}")
+
+    def clear(self) -> int:
+        """
+        Delete all cache entries.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        if not self.cache_dir.exists():
+            return removed
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def get_stats(self) -> dict:
+        """Hit/miss counters for this process."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
@@ -8,15 +8,26 @@ Manages the complete autonomous code improvement cycle:
 4. Loop until success or max iterations reached
 """
 
+import os
 import time
 import logging
 import json
+import tempfile
+import threading
+import contextlib
+import contextvars
+import functools
+import sqlite3
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable, List, Dict, Any
+from typing import TYPE_CHECKING, Optional, Callable, List, Dict, Any, Set
 
 from .models import (
+    IterationRecord,
     Suggestion,
     SuggestionStatus,
     Verdict,
@@ -26,9 +37,35 @@ from .models import (
 )
 from .config import AutonomousConfig
 from .suggestion_generator import SuggestionGenerator
+from .git_scope import git_head
+from .history_store import SQLiteHistoryStore, create_history_store
+from .journal import RunJournal, run_summary
+from .pipeline import SuggestionPipeline
+from .scheduler import ConflictScheduler, files_conflict, normalize_path, suggestion_files
+from .verification import PrecheckReport, check_commands, run_prechecks
+from .worktree import (
+    MergeConflict,
+    Worktree,
+    WorktreeError,
+    git_toplevel,
+    merge_worktree,
+    snapshot_commit,
+    working_tree_diff,
+)
+from ..llm.budget import BudgetAction
+from ..llm.router import BudgetExceededError, budgeted_completion
+from ..observability.tracing import get_tracer, traced, set_span_attributes
+
+if TYPE_CHECKING:
+    from ..llm.budget import BudgetManager
+    from ..llm.metrics import LLMMetrics
 
 logger = logging.getLogger(__name__)
 
+# Budget tags for the Worker and Judge stages (see BudgetManager scopes)
+WORKER_BUDGET_TAGS = ["agent:worker"]
+JUDGE_BUDGET_TAGS = ["agent:judge"]
+
 
 class AutonomousRunner:
     """
@@ -53,6 +90,8 @@ class AutonomousRunner:
         on_implementation: Optional[Callable[[Suggestion, str], None]] = None,
         on_verdict: Optional[Callable[[Verdict], None]] = None,
         on_status_change: Optional[Callable[[str], None]] = None,
+        metrics: Optional["LLMMetrics"] = None,
+        budget: Optional["BudgetManager"] = None,
     ):
         """
         Initialize the autonomous runner.
@@ -63,20 +102,41 @@ class AutonomousRunner:
             on_implementation: Callback when implementation completes (suggestion, logs)
             on_verdict: Callback when judge provides verdict
             on_status_change: Callback when run status changes
+            metrics: Optional LLMMetrics receiving work-queue depths
+            budget: Optional BudgetManager shared by the planner, worker and judge;
+                a rejected call pauses the run
         """
         self.config = config
+        self.metrics = metrics
+        self.budget = budget
         self.on_suggestion = on_suggestion
         self.on_implementation = on_implementation
         self.on_verdict = on_verdict
         self.on_status_change = on_status_change
         
         # Initialize components
-        self.generator = SuggestionGenerator(config)
+        self.generator = SuggestionGenerator(config, budget=budget)
         self._worker = None  # Lazy loaded
         self._llm = None     # Lazy loaded for judge
         
         # Current run state
         self.current_run: Optional[AutonomousRun] = None
+        
+        # Serializes merges of worktree results into the main checkout
+        self._merge_lock = threading.Lock()
+        
+        # Checkpoints may be written from worker and judge threads
+        self._counts_lock = threading.Lock()
+        self._checkpoint_lock = threading.Lock()
+        self._checkpoint_parent: Optional["AutonomousRunner"] = None
+        
+        # Per-suggestion state for verification: the Worker's latest result
+        # and a snapshot of the workspace before the first attempt
+        self._worker_results: Dict[str, Any] = {}
+        self._baselines: Dict[str, Optional[str]] = {}
+        
+        # Run history: append-only journals + index, or SQLite (config.history_backend)
+        self.history = create_history_store(config.get_history_path(), config.history_backend)
     
     def _get_worker(self):
         """Lazy-load OpenHands worker."""
@@ -89,9 +149,30 @@ class AutonomousRunner:
                 use_ollama=True,
                 ollama_base_url=self.config.ollama_base_url,
                 verbose=self.config.verbose,
+                exclude_paths=self._workspace_excludes(),
             )
         return self._worker
     
+    def _workspace_excludes(self) -> List[str]:
+        """
+        Directories the runner writes to while the worker runs, relative to
+        the workspace if inside it (never a worker change).
+        
+        Covers the history directory (checkpoints from the judge thread) and
+        the analysis cache (written by run_streaming's analysis).
+        """
+        workspace = self.config.get_workspace_path().resolve()
+        written = [self.config.get_history_path()]
+        if self.generator.analysis_cache is not None:
+            written.append(self.generator.analysis_cache.cache_dir)
+        excludes = []
+        for path in written:
+            try:
+                excludes.append(path.resolve().relative_to(workspace).as_posix())
+            except ValueError:
+                continue  # Outside the workspace
+        return excludes
+    
     def _get_llm(self):
         """Lazy-load LLM for judge."""
         if self._llm is None:
@@ -100,23 +181,38 @@ class AutonomousRunner:
             self._llm = litellm
         return self._llm
     
+    @traced("llm.call")
     def _call_llm(self, prompt: str, system_prompt: str = "") -> str:
         """Call LLM for judge reasoning."""
         llm = self._get_llm()
+        set_span_attributes(model=self.config.model, prompt_chars=len(prompt) + len(system_prompt))
         
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
         
-        response = llm.completion(
-            model=f"ollama/{self.config.model}",
-            messages=messages,
-            api_base=self.config.ollama_base_url,
-            num_ctx=self.config.num_ctx,
+        response = budgeted_completion(
+            self.budget,
+            messages,
+            self.config.model,
+            lambda model: llm.completion(
+                model=f"ollama/{model}",
+                messages=messages,
+                api_base=self.config.ollama_base_url,
+                num_ctx=self.config.num_ctx,
+            ),
+            tags=JUDGE_BUDGET_TAGS,
         )
         
-        return response.choices[0].message.content
+        content = response.choices[0].message.content
+        set_span_attributes(response_chars=len(content or ""))
+        return content
+    
+    def _publish_queue_depth(self, queue_name: str, depth: int) -> None:
+        """Report a work queue's depth to the metrics, if configured."""
+        if self.metrics is not None:
+            self.metrics.set_queue_depth(queue_name, depth)
     
     def _emit_status(self, status: str):
         """Emit status change callback."""
@@ -125,6 +221,7 @@ class AutonomousRunner:
         if self.config.verbose:
             logger.info(f"[Runner] {status}")
     
+    @traced("autonomous.generate_suggestions")
     def generate_suggestions(self) -> List[Suggestion]:
         """
         Generate improvement suggestions for the target codebase.
@@ -145,6 +242,7 @@ class AutonomousRunner:
         self._emit_status(f"Generated {len(suggestions)} suggestions")
         return suggestions
     
+    @traced("autonomous.implement_suggestion")
     def implement_suggestion(self, suggestion: Suggestion) -> str:
         """
         Have the worker implement a suggestion using OpenHands.
@@ -157,6 +255,7 @@ class AutonomousRunner:
         """
         self._emit_status(f"Implementing: {suggestion.title}")
         suggestion.status = SuggestionStatus.IN_PROGRESS
+        set_span_attributes(suggestion_id=suggestion.id, title=suggestion.title)
         
         worker = self._get_worker()
         
@@ -191,11 +290,77 @@ Working directory: {workspace}
 
 IMPORTANT: You MUST use the file_editor tool to actually modify the files. Do not just describe the changes - implement them."""
 
-        # Execute via OpenHands
-        result = worker.run_task(task_prompt, timeout=300)
+        if suggestion.id not in self._baselines:
+            # Pre-checks and the judge diff against the state before the first attempt
+            self._baselines[suggestion.id] = self._snapshot(workspace)
+        
+        session_id = suggestion.id if self.config.reuse_worker_sessions else None
+        verdict = suggestion.last_verdict
+        retry = (
+            suggestion.iterations > 1
+            and verdict is not None
+            and verdict.status != VerdictStatus.PASS
+        )
+        if retry:
+            feedback = self._retry_feedback(verdict)
+            if session_id and worker.has_session(session_id):
+                # Same conversation: the agent already knows the code and its plan
+                task_prompt = f"""The reviewer rejected your last attempt.
+Your changes are still in the workspace - fix the issues below instead of starting over.
+
+{feedback}
+
+Keep what already works. Use the file_editor tool to make the fixes."""
+            else:
+                # Fresh conversation (e.g. resumed run): carry a condensed state of earlier attempts
+                changed_list = '\n'.join(f'  - {f}' for f in suggestion.files_changed) or '  (none)'
+                task_prompt += f"""
+
+## Previous Attempts
+This is attempt {suggestion.iterations}. Changes from earlier attempts are still in the
+workspace; build on them instead of starting over.
+
+Files already changed:
+{changed_list}
+
+{feedback}"""
+        
+        # Execute via OpenHands; its spend counts against the shared budget
+        set_span_attributes(retry=retry)
+        decision = None
+        if self.budget is not None:
+            messages = [{"role": "user", "content": task_prompt}]
+            decision = self.budget.admit(messages, self.config.model, tags=WORKER_BUDGET_TAGS)
+            if decision.action == BudgetAction.REJECT:
+                raise BudgetExceededError(decision.reason, decision)
+        try:
+            result = worker.run_task(task_prompt, timeout=300, session_id=session_id)
+        except BaseException:
+            if decision is not None:
+                self.budget.release(decision)
+            raise
+        if decision is not None:
+            self.budget.commit(decision, result.cost or 0.0)
+        self._worker_results[suggestion.id] = result
+        set_span_attributes(
+            success=result.success,
+            files_changed=len(result.files_changed),
+            execution_time_s=result.execution_time,
+        )
         
         logs = result.logs if result.success else f"Error: {result.message}\n{result.logs}"
         
+        record = self._iteration_record(suggestion)
+        record.worker_seconds = result.execution_time
+        record.cost = result.cost
+        usage = result.token_usage or {}
+        record.prompt_tokens = usage.get("prompt_tokens", 0)
+        record.completion_tokens = usage.get("completion_tokens", 0)
+        
+        # Record the real footprint for conflict-aware scheduling
+        changed = self._target_relative(workspace, result.files_changed)
+        suggestion.files_changed = sorted(set(suggestion.files_changed) | set(changed))
+        
         # Log files changed
         if result.files_changed:
             self._emit_status(f"Modified {len(result.files_changed)} files: {result.files_changed}")
@@ -203,8 +368,186 @@ IMPORTANT: You MUST use the file_editor tool to actually modify the files. Do no
         if self.on_implementation:
             self.on_implementation(suggestion, logs)
         
+        self.checkpoint(suggestion=suggestion)
         return logs
     
+    @staticmethod
+    def _retry_feedback(verdict: Verdict) -> str:
+        """Prompt section carrying a failed verdict into the next attempt."""
+        lines = [
+            f"## Review of Attempt {verdict.iteration} (score {verdict.score:.2f})",
+            verdict.feedback.strip(),
+        ]
+        for heading, items in (
+            ("Criteria not met", verdict.criteria_failed),
+            ("Suggested fixes", verdict.suggested_fixes),
+            ("Criteria already met (keep them)", verdict.criteria_met),
+        ):
+            if items:
+                lines.append(f"\n### {heading}")
+                lines.extend(f"  - {item}" for item in items)
+        return "\n".join(line for line in lines if line)
+    
+    def _close_worker_session(self, suggestion: Suggestion) -> None:
+        """Drop the worker conversation kept for a suggestion's retries."""
+        close = getattr(self._worker, "close_session", None)
+        if close is not None:
+            close(suggestion.id)
+    
+    def _history_excludes(self, repo: Path) -> List[str]:
+        """History directory relative to repo's top-level, if inside it (kept out of snapshots)."""
+        try:
+            history = self.config.get_history_path().resolve()
+            return [history.relative_to(git_toplevel(repo)).as_posix()]
+        except (ValueError, WorktreeError):
+            return []
+    
+    def _snapshot(self, workspace: Path) -> Optional[str]:
+        """Snapshot commit of the workspace, or None if it is not a git checkout."""
+        try:
+            return snapshot_commit(workspace, exclude=self._history_excludes(workspace))
+        except WorktreeError as e:
+            logger.debug(f"No snapshot of {workspace}: {e}")
+            return None
+    
+    def precheck(self, suggestion: Suggestion) -> PrecheckReport:
+        """
+        Run the static checks on the latest attempt (see verification.run_prechecks).
+        
+        Args:
+            suggestion: The implemented suggestion
+            
+        Returns:
+            PrecheckReport; the judge LLM only runs if it passed
+        """
+        workspace = self.config.get_workspace_path()
+        baseline = self._baselines.get(suggestion.id)
+        commands = self.config.precheck_commands
+        # Pipelined: the Worker is editing the shared workspace for another suggestion
+        isolate = bool(commands) and self.config.pipelined
+        report = run_prechecks(
+            workspace,
+            result=self._worker_results.get(suggestion.id),
+            base_commit=baseline,
+            commands=() if isolate else commands,
+            max_diff_lines=self.config.max_diff_lines,
+            command_timeout=self.config.precheck_timeout,
+            exclude=self._history_excludes(workspace),
+        )
+        if isolate and report.passed:
+            self._isolated_commands(suggestion, report, workspace, baseline)
+        return report
+    
+    def _isolated_commands(
+        self,
+        suggestion: Suggestion,
+        report: PrecheckReport,
+        workspace: Path,
+        baseline: Optional[str]
+    ) -> None:
+        """
+        Run precheck commands in a worktree of the suggestion's baseline plus
+        only the files it changed, so another suggestion's in-progress edits
+        in the shared workspace cannot fail them.
+        """
+        target = self.config.get_target_path()
+        try:
+            if baseline is None:
+                raise WorktreeError("workspace is not a git checkout")
+            toplevel = git_toplevel(workspace)
+            name = f"check-{suggestion.id}"
+            with Worktree.create(toplevel, name=name, base=baseline) as worktree:
+                for rel_path in suggestion.files_changed:
+                    top_rel = (target / rel_path).relative_to(toplevel)
+                    source, destination = toplevel / top_rel, worktree.path / top_rel
+                    if source.exists():
+                        destination.parent.mkdir(parents=True, exist_ok=True)
+                        shutil.copy2(source, destination)
+                    else:
+                        destination.unlink(missing_ok=True)
+                check_commands(
+                    report,
+                    self.config.precheck_commands,
+                    worktree.path / workspace.resolve().relative_to(toplevel),
+                    self.config.precheck_timeout,
+                )
+        except (WorktreeError, ValueError) as e:
+            logger.warning(f"Skipping precheck commands for '{suggestion.title}': {e}")
+            report.add("commands", True, f"skipped, no isolated checkout ({e})")
+    
+    def _judge_diff(self, suggestion: Suggestion) -> Optional[str]:
+        """
+        Unified diff of the suggestion's changes since its first attempt.
+        
+        Limited to the suggestion's files (all files if none are known),
+        with judge_diff_context lines of context and new files included.
+        
+        Returns:
+            The diff, or None without a baseline snapshot (not a git checkout)
+        """
+        base = self._baselines.get(suggestion.id)
+        if not base:
+            return None
+        target = self.config.get_target_path()
+        try:
+            toplevel = git_toplevel(target)
+            paths = []
+            for path in sorted(suggestion_files(suggestion)):
+                try:
+                    paths.append((target / path).resolve().relative_to(toplevel).as_posix())
+                except ValueError:
+                    continue
+            diff = working_tree_diff(
+                toplevel,
+                base,
+                paths,
+                args=[f"-U{self.config.judge_diff_context}"],
+                exclude=self._history_excludes(toplevel),
+            )
+        except WorktreeError as e:
+            logger.debug(f"No judge diff for {suggestion.id}: {e}")
+            return None
+        
+        limit = self.config.judge_max_diff_chars
+        if len(diff) > limit:
+            diff = diff[:limit] + f"\n... (diff truncated, {len(diff) - limit} more characters)"
+        return diff
+    
+    def _judge_activity(self, suggestion: Suggestion, implementation_logs: str) -> str:
+        """Worker activity for the judge: structured event summary, else the log tail."""
+        result = self._worker_results.get(suggestion.id)
+        summary = getattr(result, "events_summary", None)
+        if summary:
+            from ..workers.openhands_worker import format_events_summary
+            return format_events_summary(summary)
+        # The end of the log has the final edits and the change statistics
+        return implementation_logs[-3000:]
+    
+    @staticmethod
+    def _iteration_record(suggestion: Suggestion) -> IterationRecord:
+        """Timing and cost record of the suggestion's current iteration."""
+        log = suggestion.iteration_log
+        if not log or log[-1].iteration != suggestion.iterations:
+            log.append(IterationRecord(iteration=suggestion.iterations))
+        return log[-1]
+    
+    def _target_relative(self, workspace: Path, paths: List[str]) -> List[str]:
+        """Map worker-reported paths (absolute or workspace-relative) to target-relative ones."""
+        target = self.config.get_target_path()
+        history = self.config.get_history_path().resolve()
+        result = []
+        for path in paths:
+            full_path = Path(path) if Path(path).is_absolute() else workspace / path
+            try:
+                resolved = full_path.resolve()
+                if resolved == history or history in resolved.parents:
+                    continue  # Checkpoints and caches written while the worker ran
+                result.append(normalize_path(resolved.relative_to(target).as_posix()))
+            except (ValueError, OSError):
+                continue  # Outside the target repository
+        return result
+    
+    @traced("autonomous.judge_implementation")
     def judge_implementation(
         self,
         suggestion: Suggestion,
@@ -221,17 +564,47 @@ IMPORTANT: You MUST use the file_editor tool to actually modify the files. Do no
             Judge's verdict
         """
         self._emit_status(f"Verifying: {suggestion.title}")
+        set_span_attributes(suggestion_id=suggestion.id)
+        start_time = time.time()
         
-        # Read current state of affected files
-        files_content = {}
-        target = self.config.get_target_path()
-        for file_path in suggestion.affected_files:
-            full_path = target / file_path
-            if full_path.exists():
-                try:
-                    files_content[file_path] = full_path.read_text()[:10000]
-                except Exception:
-                    files_content[file_path] = "[Could not read file]"
+        # Cheap deterministic checks first; obvious failures skip the LLM
+        checks_section = ""
+        if self.config.precheck:
+            report = self.precheck(suggestion)
+            set_span_attributes(precheck_passed=report.passed, prechecks=len(report.checks))
+            if not report.passed:
+                failed = ", ".join(c.name for c in report.failures)
+                self._emit_status(f"Static checks failed: {failed}")
+                verdict = report.to_verdict(suggestion.id)
+                self._iteration_record(suggestion).judge_seconds = time.time() - start_time
+                if self.on_verdict:
+                    self.on_verdict(verdict)
+                return verdict
+            checks_section = f"## Static Checks (all passed)\n{report.summary()}\n\n"
+        
+        # Review the change itself: a diff of only the changed hunks
+        diff = self._judge_diff(suggestion)
+        if diff is not None:
+            changes = f"""## Changes (unified diff since the first attempt)
+```diff
+{diff or "(no changes)"}
+```"""
+        else:
+            # Not a git checkout: fall back to the current state of affected files
+            files_content = {}
+            target = self.config.get_target_path()
+            for file_path in suggestion.affected_files:
+                full_path = target / file_path
+                if full_path.exists():
+                    try:
+                        files_content[file_path] = full_path.read_text()[:10000]
+                    except Exception:
+                        files_content[file_path] = "[Could not read file]"
+            changes = "## Current File States\n" + chr(10).join(
+                f'### {path}{chr(10)}```{chr(10)}{content}{chr(10)}```'
+                for path, content in files_content.items()
+            )
+        set_span_attributes(judge_diff_chars=len(diff) if diff is not None else -1)
         
         system_prompt = """You are a code review judge. Evaluate if an implementation meets the acceptance criteria.
 
@@ -256,13 +629,12 @@ Description: {suggestion.description}
 ## Acceptance Criteria
 {chr(10).join(f'- {c}' for c in suggestion.acceptance_criteria)}
 
-## Implementation Logs
+## Worker Activity
 ```
-{implementation_logs[:5000]}
+{self._judge_activity(suggestion, implementation_logs)}
 ```
 
-## Current File States
-{chr(10).join(f'### {path}{chr(10)}```{chr(10)}{content}{chr(10)}```' for path, content in files_content.items())}
+{checks_section}{changes}
 
 Provide your verdict as JSON."""
 
@@ -288,6 +660,8 @@ Provide your verdict as JSON."""
                 suggested_fixes=verdict_data.get("suggested_fixes", []),
             )
             
+        except BudgetExceededError:
+            raise
         except Exception as e:
             logger.warning(f"Could not parse judge response: {e}")
             verdict = Verdict(
@@ -296,11 +670,15 @@ Provide your verdict as JSON."""
                 feedback=f"Could not parse verdict: {e}",
             )
         
+        set_span_attributes(verdict=verdict.status, score=verdict.score)
+        self._iteration_record(suggestion).judge_seconds = time.time() - start_time
+        
         if self.on_verdict:
             self.on_verdict(verdict)
         
         return verdict
     
+    @traced("autonomous.run_suggestion")
     def run_suggestion(self, suggestion: Suggestion) -> bool:
         """
         Run the complete Worker → Judge loop for a single suggestion.
@@ -311,30 +689,193 @@ Provide your verdict as JSON."""
         Returns:
             True if implementation succeeded, False otherwise
         """
-        for iteration in range(self.config.max_iterations):
-            suggestion.iterations = iteration + 1
-            
-            # Worker implements
-            logs = self.implement_suggestion(suggestion)
-            
-            # Judge verifies
-            verdict = self.judge_implementation(suggestion, logs)
+        set_span_attributes(suggestion_id=suggestion.id, title=suggestion.title)
+        tracer = get_tracer()
+        
+        for iteration in range(self._first_iteration(suggestion), self.config.max_iterations + 1):
+            suggestion.iterations = iteration
             
-            if verdict.status == VerdictStatus.PASS:
-                suggestion.status = SuggestionStatus.COMPLETED
-                suggestion.implementation_notes = f"Completed after {iteration + 1} iteration(s)"
-                return True
+            with tracer.span("autonomous.iteration", iteration=iteration):
+                # Worker implements
+                logs = self.implement_suggestion(suggestion)
+                
+                # Judge verifies
+                verdict = self.judge_implementation(suggestion, logs)
             
-            if iteration < self.config.max_iterations - 1:
-                self._emit_status(f"Iteration {iteration + 1} failed, retrying with feedback...")
-                # Add judge feedback to next iteration context
-                suggestion.implementation_notes = f"Previous attempt feedback: {verdict.feedback}"
+            outcome = self._apply_verdict(suggestion, verdict, iteration)
+            if outcome is not None:
+                return outcome
         
-        # Max iterations reached
+        # No iterations left (max_iterations < 1, or resumed after the last one)
         suggestion.status = SuggestionStatus.FAILED
         suggestion.implementation_notes = f"Failed after {self.config.max_iterations} iterations"
         return False
     
+    def _apply_verdict(
+        self, suggestion: Suggestion, verdict: Verdict, iteration: int
+    ) -> Optional[bool]:
+        """
+        Update a suggestion after the judge's verdict on one attempt.
+        
+        Shared by run_suggestion and the pipelined scheduler.
+        
+        Args:
+            suggestion: The judged suggestion
+            verdict: Judge's verdict
+            iteration: 1-based attempt number
+            
+        Returns:
+            True if it passed, False if the last allowed attempt failed,
+            None if it should be retried with the verdict's feedback
+        """
+        verdict.iteration = iteration
+        suggestion.last_verdict = verdict
+        
+        if verdict.status == VerdictStatus.PASS:
+            suggestion.status = SuggestionStatus.COMPLETED
+            suggestion.implementation_notes = f"Completed after {iteration} iteration(s)"
+            outcome = True
+        elif iteration < self.config.max_iterations:
+            self._emit_status(f"Iteration {iteration} failed, retrying with feedback...")
+            # Add judge feedback to next iteration context
+            suggestion.implementation_notes = f"Previous attempt feedback: {verdict.feedback}"
+            outcome = None
+        else:
+            # Max iterations reached
+            suggestion.status = SuggestionStatus.FAILED
+            suggestion.implementation_notes = (
+                f"Failed after {self.config.max_iterations} iterations"
+            )
+            outcome = False
+        
+        if outcome is not None:
+            # Final verdict: per-attempt verification state is no longer needed
+            self._worker_results.pop(suggestion.id, None)
+            self._baselines.pop(suggestion.id, None)
+            self._close_worker_session(suggestion)
+        
+        self.checkpoint(suggestion=suggestion)
+        return outcome
+    
+    @staticmethod
+    def _first_iteration(suggestion: Suggestion) -> int:
+        """Iteration to start at: 1, or the one after a resumed suggestion's last verdict."""
+        resumable = (SuggestionStatus.ACCEPTED, SuggestionStatus.IN_PROGRESS)
+        if suggestion.last_verdict is not None and suggestion.status in resumable:
+            return suggestion.last_verdict.iteration + 1
+        return 1
+    
+    # ========== PARALLEL EXECUTION ==========
+    
+    def _parallel_workers(self) -> int:
+        """
+        Number of suggestions to run concurrently.
+        
+        Parallel runs need a git checkout and a workspace inside the target
+        repository (so it can be mapped into each worktree); otherwise 1.
+        """
+        workers = max(1, self.config.parallel_suggestions)
+        if workers == 1:
+            return 1
+        target = self.config.get_target_path()
+        try:
+            git_toplevel(target)
+            self.config.get_workspace_path().relative_to(target)
+        except (WorktreeError, ValueError) as e:
+            logger.warning(f"Parallel suggestions disabled, running sequentially: {e}")
+            return 1
+        return workers
+    
+    def _child_runner(self, worktree: Worktree, suggestion: Suggestion) -> "AutonomousRunner":
+        """Runner whose target and workspace point into a worktree."""
+        target = self.config.get_target_path()
+        child_target = worktree.path / target.relative_to(worktree.repo)
+        workspace_dir = None
+        if self.config.workspace_dir:
+            workspace_dir = str(child_target / self.config.get_workspace_path().relative_to(target))
+        
+        child_config = replace(
+            self.config,
+            target_repo=str(child_target),
+            workspace_dir=workspace_dir,
+            parallel_suggestions=1,
+            pipelined=False,
+            use_analysis_cache=False,
+        )
+        label = suggestion.title[:30]
+        child = AutonomousRunner(
+            child_config,
+            on_implementation=self.on_implementation,
+            on_verdict=self.on_verdict,
+            on_status_change=lambda status: self._emit_status(f"[{label}] {status}"),
+            metrics=self.metrics,
+            budget=self.budget,
+        )
+        # Steps in the worktree checkpoint this runner's run
+        child._checkpoint_parent = self
+        return child
+    
+    def _save_patch(self, suggestion: Suggestion, patch: str) -> Path:
+        """Keep an unmergeable worktree patch in the history directory."""
+        patch_dir = self.config.ensure_history_dir() / "patches"
+        patch_dir.mkdir(exist_ok=True)
+        filepath = patch_dir / f"{suggestion.id}.patch"
+        filepath.write_text(patch, errors="surrogateescape")
+        return filepath
+    
+    def _run_in_worktree(self, suggestion: Suggestion) -> bool:
+        """
+        Run the Worker → Judge loop in an isolated worktree and merge the result back.
+        
+        A passing suggestion whose changes conflict with ones already merged
+        is marked failed and its patch saved under history_dir/patches.
+        """
+        target = self.config.get_target_path()
+        with self._merge_lock:
+            # Base on the current checkout so earlier merged results are visible
+            base = snapshot_commit(target, exclude=self._history_excludes(target))
+        
+        with Worktree.create(target, name=suggestion.id, base=base) as worktree:
+            success = self._child_runner(worktree, suggestion).run_suggestion(suggestion)
+            if not success:
+                return False
+            
+            with self._merge_lock:
+                try:
+                    merged = merge_worktree(worktree)
+                except MergeConflict as e:
+                    patch_path = self._save_patch(suggestion, worktree.diff())
+                    suggestion.status = SuggestionStatus.FAILED
+                    suggestion.implementation_notes = (
+                        f"{suggestion.implementation_notes or ''} "
+                        f"(not merged: {e}; patch saved to {patch_path})"
+                    ).strip()
+                    self._emit_status(
+                        f"Merge conflict for {suggestion.title}: patch saved to {patch_path}"
+                    )
+                    return False
+            
+            self._emit_status(f"Merged {len(merged)} files from: {suggestion.title}")
+            return True
+    
+    def _execute(self, suggestion: Suggestion, isolated: bool) -> bool:
+        """
+        Run one suggestion, in a worktree when isolated; exceptions count as failure.
+        
+        A budget rejection propagates instead, leaving the suggestion resumable.
+        """
+        try:
+            if isolated:
+                return self._run_in_worktree(suggestion)
+            return self.run_suggestion(suggestion)
+        except BudgetExceededError:
+            raise
+        except Exception as e:
+            logger.warning(f"Suggestion '{suggestion.title}' failed: {e}")
+            suggestion.status = SuggestionStatus.FAILED
+            suggestion.implementation_notes = f"Error: {e}"
+            return False
+    
     def create_run(self, suggestions: List[Suggestion]) -> AutonomousRun:
         """
         Create a new autonomous run with the given suggestions.
@@ -351,14 +892,26 @@ Provide your verdict as JSON."""
             total_suggestions=len(suggestions),
             model=self.config.model,
             max_iterations=self.config.max_iterations,
+            base_commit=git_head(self.config.get_target_path()),
         )
         self.current_run = run
         return run
     
+    @traced("autonomous.run_all")
     def run_all(self, accepted_suggestions: List[Suggestion]) -> AutonomousRun:
         """
         Run the complete pipeline for all accepted suggestions.
         
+        With parallel_suggestions > 1, suggestions run concurrently in
+        isolated git worktrees, ordered by a file-conflict scheduler so
+        suggestions sharing files never overlap, and passing ones are
+        merged back as they finish (see _run_in_worktree). Otherwise, with
+        pipelined set, the next suggestion is implemented while the
+        previous one is judged (see SuggestionPipeline).
+        
+        Progress is checkpointed after every Worker and Judge step, so an
+        interrupted run can be continued with resume_run().
+        
         Args:
             accepted_suggestions: Suggestions that have been accepted for implementation
             
@@ -366,7 +919,6 @@ Provide your verdict as JSON."""
             Completed AutonomousRun with results
         """
         run = self.create_run(accepted_suggestions)
-        run.status = RunStatus.RUNNING
         run.started_at = datetime.utcnow()
         
         for suggestion in accepted_suggestions:
@@ -375,19 +927,100 @@ Provide your verdict as JSON."""
         run.accepted_count = len(accepted_suggestions)
         
         self._emit_status(f"Starting autonomous run with {len(accepted_suggestions)} suggestions")
-        
-        for i, suggestion in enumerate(accepted_suggestions):
-            self._emit_status(f"Processing suggestion {i + 1}/{len(accepted_suggestions)}")
-            
-            success = self.run_suggestion(suggestion)
-            
+        return self._execute_run(run, accepted_suggestions)
+    
+    def _record_result(self, run: AutonomousRun, suggestion: Suggestion, success: bool) -> None:
+        """Count a finished suggestion and checkpoint (safe from worker threads)."""
+        with self._counts_lock:
             if success:
                 run.completed_count += 1
             else:
                 run.failed_count += 1
+        self.checkpoint(run, suggestion)
+    
+    def _execute_run(self, run: AutonomousRun, suggestions: List[Suggestion]) -> AutonomousRun:
+        """
+        Implement suggestions for a run with the configured execution mode.
+        
+        A KeyboardInterrupt or budget rejection marks the run PAUSED and
+        checkpoints it before propagating.
+        """
+        run.status = RunStatus.RUNNING
+        self.checkpoint(run)
+        
+        try:
+            workers = min(self._parallel_workers(), len(suggestions))
+            if workers > 1:
+                # Suggestions sharing files never run at the same time
+                scheduler = ConflictScheduler(suggestions)
+                self._emit_status(
+                    f"Running up to {workers} suggestions in parallel worktrees "
+                    f"({len(scheduler.batches)} conflict-free batches)"
+                )
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="suggestion"
+                ) as executor:
+                    running = {}
+                    rejected: Optional[BudgetExceededError] = None
+                    while running or (rejected is None and not scheduler.finished):
+                        while rejected is None and len(running) < workers:
+                            suggestion = scheduler.next_ready()
+                            if suggestion is None:
+                                break
+                            # Copy context so each suggestion's spans nest under this run
+                            future = executor.submit(
+                                contextvars.copy_context().run, self._execute, suggestion, True
+                            )
+                            running[future] = suggestion
+                        
+                        done, _ = wait(running, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            suggestion = running.pop(future)
+                            scheduler.mark_done(suggestion)
+                            try:
+                                success = future.result()
+                            except BudgetExceededError as e:
+                                # Start nothing new; running suggestions finish first
+                                rejected = e
+                                continue
+                            self._record_result(run, suggestion, success)
+                    if rejected is not None:
+                        raise rejected
+            elif self.config.pipelined and len(suggestions) > 1:
+                self._emit_status("Overlapping worker and judge stages across suggestions")
+                pipeline = SuggestionPipeline(
+                    self,
+                    self.config.pipeline_queue_size,
+                    on_finished=functools.partial(self._record_result, run),
+                ).start()
+                for suggestion in suggestions:
+                    pipeline.submit(suggestion)
+                pipeline.close()
+                try:
+                    pipeline.join()
+                except BaseException:
+                    pipeline.stop()
+                    raise
+                if pipeline.error is not None:
+                    raise pipeline.error
+            else:
+                for i, suggestion in enumerate(suggestions):
+                    self._emit_status(f"Processing suggestion {i + 1}/{len(suggestions)}")
+                    
+                    success = self.run_suggestion(suggestion)
+                    self._record_result(run, suggestion, success)
+        except (KeyboardInterrupt, BudgetExceededError) as e:
+            run.status = RunStatus.PAUSED
+            self.checkpoint(run)
+            reason = f" ({e})" if isinstance(e, BudgetExceededError) else ""
+            self._emit_status(
+                f"Run {run.id} paused{reason}; continue it with resume_run('{run.id}')"
+            )
+            raise
         
         run.status = RunStatus.COMPLETED
         run.completed_at = datetime.utcnow()
+        self.checkpoint(run)
         
         self._emit_status(
             f"Run completed: {run.completed_count} succeeded, {run.failed_count} failed"
@@ -395,6 +1028,208 @@ Provide your verdict as JSON."""
         
         return run
     
+    def resume_run(self, run_id: Optional[str] = None) -> Optional[AutonomousRun]:
+        """
+        Continue a checkpointed run.
+        
+        Completed, failed and rejected suggestions are skipped. Suggestions
+        that were in progress restart at the iteration after their last
+        verdict, with that verdict's feedback.
+        
+        Args:
+            run_id: Run to resume (None = state_file, or the latest unfinished run)
+            
+        Returns:
+            The resumed run, or None if there is nothing to resume
+        """
+        run = self.load_checkpoint(run_id)
+        if run is None:
+            self._emit_status("No run to resume")
+            return None
+        
+        remaining = [
+            s for s in run.suggestions
+            if s.status in (SuggestionStatus.ACCEPTED, SuggestionStatus.IN_PROGRESS)
+        ]
+        self._emit_status(
+            f"Resuming run {run.id}: {len(remaining)} of {run.accepted_count} suggestions left"
+        )
+        if not remaining and run.status == RunStatus.COMPLETED:
+            return run
+        return self._execute_run(run, remaining)
+    
+    @traced("autonomous.run_streaming")
+    def run_streaming(
+        self,
+        accept: Optional[Callable[[Suggestion], bool]] = None,
+        max_suggestions: Optional[int] = None,
+    ) -> AutonomousRun:
+        """
+        Generate and implement suggestions concurrently.
+        
+        Suggestions are streamed from the generator on the calling thread
+        as files complete; accepted ones are queued to Worker threads that
+        start implementing while analysis continues (parallel_suggestions
+        threads, each suggestion in its own worktree when > 1). A suggestion
+        whose files overlap a running one waits for it, so parallel worktrees
+        do not end in merge conflicts. accept runs on the calling thread, so
+        it may prompt the user.
+        
+        Args:
+            accept: Decides whether to implement a suggestion (None = accept all)
+            max_suggestions: Maximum suggestions to generate
+            
+        Returns:
+            Completed AutonomousRun with results
+        """
+        run = self.create_run([])
+        run.status = RunStatus.RUNNING
+        run.started_at = datetime.utcnow()
+        
+        # Accepted suggestions wait until their files do not overlap a running one
+        cond = threading.Condition()
+        accepted: List[Suggestion] = []
+        running: Dict[str, Set[str]] = {}   # suggestion id -> file footprint
+        stop = threading.Event()
+        closed = threading.Event()
+        rejections: List[BudgetExceededError] = []   # raised on worker threads
+        workers = self._parallel_workers()
+        # Analysis keeps writing cache entries while workers run; they are
+        # excluded from changed files through _workspace_excludes()
+        
+        def next_ready() -> Optional[Suggestion]:
+            """First accepted suggestion not conflicting with a running one (caller holds cond)."""
+            for i, suggestion in enumerate(accepted):
+                files = suggestion_files(suggestion)
+                if not any(files_conflict(files, held) for held in running.values()):
+                    return accepted.pop(i)
+            return None
+        
+        def work():
+            while True:
+                with cond:
+                    suggestion = None
+                    while not stop.is_set():
+                        suggestion = next_ready()
+                        if suggestion is not None or (closed.is_set() and not accepted):
+                            break
+                        cond.wait()
+                    if suggestion is None:
+                        return
+                    running[suggestion.id] = suggestion_files(suggestion)
+                    self._publish_queue_depth("streaming_accepted", len(accepted))
+                try:
+                    success = self._execute(suggestion, isolated=workers > 1)
+                except BudgetExceededError as e:
+                    # Stop the other workers; the suggestion stays resumable
+                    with cond:
+                        rejections.append(e)
+                        stop.set()
+                    return
+                else:
+                    self._record_result(run, suggestion, success)
+                finally:
+                    with cond:
+                        running.pop(suggestion.id, None)
+                        cond.notify_all()
+        
+        pipeline = None
+        threads = []
+        if workers == 1 and self.config.pipelined:
+            pipeline = SuggestionPipeline(
+                self,
+                self.config.pipeline_queue_size,
+                on_finished=functools.partial(self._record_result, run),
+            ).start()
+        else:
+            # Copy context so worker spans nest under this run's span
+            threads = [
+                threading.Thread(
+                    target=contextvars.copy_context().run,
+                    args=(work,),
+                    name=f"autonomous-worker-{i}",
+                    daemon=True,
+                )
+                for i in range(workers)
+            ]
+            for thread in threads:
+                thread.start()
+        
+        def enqueue(suggestion: Suggestion) -> None:
+            with cond:
+                accepted.append(suggestion)
+                self._publish_queue_depth("streaming_accepted", len(accepted))
+                cond.notify_all()
+        
+        submit = pipeline.submit if pipeline else enqueue
+        
+        def rejection() -> Optional[BudgetExceededError]:
+            """Budget rejection that stopped the worker side, if any."""
+            if pipeline is not None:
+                return pipeline.error
+            with cond:
+                return rejections[0] if rejections else None
+        
+        self._emit_status("Streaming suggestions...")
+        try:
+            for suggestion in self.generator.stream_suggestions(
+                max_suggestions or self.config.max_suggestions
+            ):
+                error = rejection()
+                if error is not None:
+                    raise error
+                run.suggestions.append(suggestion)
+                run.total_suggestions += 1
+                if self.on_suggestion:
+                    self.on_suggestion(suggestion)
+                
+                if accept is not None and not accept(suggestion):
+                    suggestion.status = SuggestionStatus.REJECTED
+                    continue
+                
+                suggestion.status = SuggestionStatus.ACCEPTED
+                run.accepted_count += 1
+                self.checkpoint(run)
+                submit(suggestion)
+            
+            self._emit_status(
+                f"Generated {run.total_suggestions} suggestions, waiting for the worker"
+            )
+        except BaseException:
+            # Let the in-flight suggestion finish, skip the rest
+            with cond:
+                stop.set()
+                cond.notify_all()
+            if pipeline:
+                pipeline.stop()
+            run.status = RunStatus.PAUSED
+            raise
+        finally:
+            if pipeline:
+                pipeline.close()
+                pipeline.join()
+            with cond:
+                closed.set()
+                cond.notify_all()
+            for thread in threads:
+                thread.join()
+            run.completed_at = datetime.utcnow()
+            self.checkpoint(run)
+        
+        error = rejection()
+        if error is not None:
+            run.status = RunStatus.PAUSED
+            self.checkpoint(run)
+            self._emit_status(f"Run {run.id} paused ({error})")
+            raise error
+        
+        run.status = RunStatus.COMPLETED
+        self.checkpoint(run)
+        self._emit_status(
+            f"Run completed: {run.completed_count} succeeded, {run.failed_count} failed"
+        )
+        return run
+    
     def run_single(self) -> Optional[Suggestion]:
         """
         Generate one suggestion and run it (for testing).
@@ -417,10 +1252,55 @@ Provide your verdict as JSON."""
     
     # ========== PERSISTENCE METHODS ==========
     
+    def _state_file(self) -> Optional[Path]:
+        """Optional full-snapshot checkpoint file (config.state_file)."""
+        if self.config.state_file:
+            return Path(self.config.state_file).expanduser().resolve()
+        return None
+    
+    def _legacy_files(self, run_id: str = "*") -> List[Path]:
+        """Whole-run JSON files written before runs were journaled."""
+        history_dir = self.config.get_history_path()
+        if not history_dir.exists():
+            return []
+        return sorted(history_dir.glob(f"run_{run_id}_*.json"), reverse=True)
+    
+    @staticmethod
+    def _write_run(run: AutonomousRun, filepath: Path) -> None:
+        """Atomically write a run as JSON (readers never see a partial file)."""
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(run.model_dump(mode="json"), indent=2)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{filepath.name}.", suffix=".tmp", dir=filepath.parent
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(payload)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+    
+    @staticmethod
+    def _run_from_dict(data: Dict[str, Any]) -> AutonomousRun:
+        """Rebuild a run from saved JSON."""
+        # Parse dates back
+        if data.get('started_at'):
+            data['started_at'] = datetime.fromisoformat(data['started_at'])
+        if data.get('completed_at'):
+            data['completed_at'] = datetime.fromisoformat(data['completed_at'])
+        for s in data.get('suggestions', []):
+            if s.get('created_at'):
+                s['created_at'] = datetime.fromisoformat(s['created_at'])
+        return AutonomousRun(**data)
+    
     def save_run(self, run: Optional[AutonomousRun] = None) -> Path:
         """
         Save run state to history directory.
         
+        Compacts the run's journal to one event per suggestion.
+        
         Args:
             run: Run to save (defaults to current_run)
             
@@ -431,51 +1311,87 @@ Provide your verdict as JSON."""
         if not run:
             raise ValueError("No run to save")
         
-        history_dir = self.config.ensure_history_dir()
-        filename = f"run_{run.id}_{run.started_at.strftime('%Y%m%d_%H%M%S') if run.started_at else 'pending'}.json"
-        filepath = history_dir / filename
+        self.config.ensure_history_dir()
+        filepath = self.history.compact(run)
+        state_file = self._state_file()
+        if state_file is not None:
+            with self._checkpoint_lock:
+                self._write_run(run, state_file)
+        self._emit_status(f"Saved run to {filepath}")
+        return filepath
+    
+    def checkpoint(
+        self,
+        run: Optional[AutonomousRun] = None,
+        suggestion: Optional[Suggestion] = None
+    ) -> Optional[Path]:
+        """
+        Persist run progress (called after every Worker and Judge step).
         
-        # Convert to dict for JSON serialization
-        run_dict = run.model_dump()
-        run_dict['started_at'] = run_dict['started_at'].isoformat() if run_dict['started_at'] else None
-        run_dict['completed_at'] = run_dict['completed_at'].isoformat() if run_dict['completed_at'] else None
+        Appends the run header and the changed suggestion to the run's
+        journal, so the cost is independent of run size; finished runs are
+        compacted. With config.state_file set, a full JSON snapshot is also
+        written there atomically.
         
-        # Handle suggestion dates
-        for s in run_dict['suggestions']:
-            if s['created_at']:
-                s['created_at'] = s['created_at'].isoformat()
+        Runners working inside a worktree checkpoint their parent's run.
+        Failures are logged, never raised, so checkpointing cannot break a run.
         
-        filepath.write_text(json.dumps(run_dict, indent=2, default=str))
-        self._emit_status(f"Saved run to {filepath}")
+        Args:
+            run: Run to save (defaults to current_run)
+            suggestion: Suggestion whose state changed, if any
+            
+        Returns:
+            Journal path, or None if there was nothing to save
+        """
+        if self._checkpoint_parent is not None:
+            return self._checkpoint_parent.checkpoint(suggestion=suggestion)
+        run = run or self.current_run
+        if run is None:
+            return None
+        
+        try:
+            if run.status in (RunStatus.COMPLETED, RunStatus.FAILED):
+                filepath = self.history.compact(run)
+            else:
+                filepath = self.history.append(run, [suggestion] if suggestion else [])
+            state_file = self._state_file()
+            if state_file is not None:
+                with self._checkpoint_lock:
+                    self._write_run(run, state_file)
+        except Exception as e:
+            logger.warning(f"Could not checkpoint run {run.id}: {e}")
+            return None
         return filepath
     
     def load_run(self, run_id: str) -> Optional[AutonomousRun]:
         """
         Load a run from history by ID.
         
+        Reads the configured history backend, falling back to the run's
+        journal (SQLite backend) and then to a legacy whole-run file.
+        
         Args:
             run_id: The run ID to load
             
         Returns:
             Loaded AutonomousRun or None if not found
         """
-        history_dir = self.config.get_history_path()
-        if not history_dir.exists():
-            return None
+        stores = [self.history]
+        if isinstance(self.history, SQLiteHistoryStore):
+            stores.append(RunJournal(self.config.get_history_path()))
+        for store in stores:
+            try:
+                data = store.replay(run_id)
+                if data is not None:
+                    run = self._run_from_dict(data)
+                    self.current_run = run
+                    return run
+            except Exception as e:
+                logger.warning(f"Failed to load run {run_id} from {type(store).__name__}: {e}")
         
-        for filepath in history_dir.glob(f"run_{run_id}_*.json"):
+        for filepath in self._legacy_files(run_id):
             try:
-                data = json.loads(filepath.read_text())
-                # Parse dates back
-                if data.get('started_at'):
-                    data['started_at'] = datetime.fromisoformat(data['started_at'])
-                if data.get('completed_at'):
-                    data['completed_at'] = datetime.fromisoformat(data['completed_at'])
-                for s in data.get('suggestions', []):
-                    if s.get('created_at'):
-                        s['created_at'] = datetime.fromisoformat(s['created_at'])
-                
-                run = AutonomousRun(**data)
+                run = self._run_from_dict(json.loads(filepath.read_text()))
                 self.current_run = run
                 return run
             except Exception as e:
@@ -483,38 +1399,187 @@ Provide your verdict as JSON."""
         
         return None
     
-    def list_runs(self) -> List[Dict[str, Any]]:
+    def load_checkpoint(self, run_id: Optional[str] = None) -> Optional[AutonomousRun]:
         """
-        List all saved runs.
+        Load the run to resume.
         
+        Args:
+            run_id: Run ID (None = state_file if set, else the most recent
+                unfinished run in history)
+            
         Returns:
-            List of run summaries (id, status, date, suggestion counts)
+            The run (also set as current_run), or None if not found
+        """
+        state_file = self._state_file()
+        if state_file is not None and state_file.exists():
+            try:
+                run = self._run_from_dict(json.loads(state_file.read_text()))
+                if run_id is None or run.id == run_id:
+                    self.current_run = run
+                    return run
+            except Exception as e:
+                logger.warning(f"Failed to load state file {state_file}: {e}")
+        
+        if run_id is None:
+            unfinished = [
+                r for r in self.list_runs()
+                if r["status"] in (RunStatus.RUNNING.value, RunStatus.PAUSED.value)
+            ]
+            if not unfinished:
+                return None
+            run_id = max(unfinished, key=lambda r: r["started_at"] or "")["id"]
+        return self.load_run(run_id)
+    
+    def _migrate_history(self) -> None:
+        """
+        Bring runs saved in older formats into the history backend.
+        
+        Legacy whole-run files are summarized into the journal index, or
+        imported into the SQLite database together with journaled runs.
+        Each run is migrated once.
         """
         history_dir = self.config.get_history_path()
         if not history_dir.exists():
-            return []
+            return
+        sqlite_backend = isinstance(self.history, SQLiteHistoryStore)
+        known = {run["id"] for run in self.history.list_runs()}
         
-        runs = []
-        for filepath in sorted(history_dir.glob("run_*.json"), reverse=True):
+        legacy = []  # (run data, source file)
+        for filepath in self._legacy_files():
+            # run_<id>_<started>.json
+            if filepath.stem[len("run_"):].split("_", 1)[0] in known:
+                continue
             try:
-                data = json.loads(filepath.read_text())
-                runs.append({
-                    "id": data.get("id"),
-                    "status": data.get("status"),
-                    "target_repo": data.get("target_repo"),
-                    "started_at": data.get("started_at"),
-                    "total": data.get("total_suggestions", 0),
-                    "completed": data.get("completed_count", 0),
-                    "failed": data.get("failed_count", 0),
-                    "filepath": str(filepath),
-                })
+                legacy.append((json.loads(filepath.read_text()), filepath))
             except Exception:
                 continue
+        if sqlite_backend:
+            journal = RunJournal(history_dir)
+            for summary in journal.list_runs():
+                if summary["id"] in known:
+                    continue
+                data = journal.replay(summary["id"])
+                if data is not None:
+                    legacy.append((data, journal.journal_path(summary["id"])))
+        if not legacy:
+            return
+        
+        try:
+            if sqlite_backend:
+                for data, _ in legacy:
+                    self.history.import_run(data)
+            else:
+                self.history.add_to_index(run_summary(data, filepath) for data, filepath in legacy)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not migrate {len(legacy)} runs into the history backend: {e}")
+    
+    def list_runs(
+        self,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        List saved runs, newest first.
+        
+        Reads only the history index (or database), after migrating runs
+        saved in older formats.
+        
+        Args:
+            status: Only runs with this RunStatus value
+            since: Only runs started at or after this time
+            limit: Page size (None = all)
+            offset: Runs to skip
+            
+        Returns:
+            List of run summaries (id, status, date, suggestion counts)
+        """
+        self._migrate_history()
+        if isinstance(self.history, SQLiteHistoryStore):
+            return self.history.list_runs(status=status, since=since, limit=limit, offset=offset)
+        
+        runs = self.history.list_runs()
+        if status:
+            runs = [r for r in runs if r["status"] == status]
+        if since:
+            runs = [r for r in runs if (r["started_at"] or "") >= since.isoformat()]
+        return runs[offset:None if limit is None else offset + limit]
+    
+    def find_suggestions(
+        self,
+        status: Optional[str] = None,
+        file: Optional[str] = None,
+        since: Optional[datetime] = None,
+        run_id: Optional[str] = None,
+        limit: Optional[int] = 50,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Search suggestions across runs, most recently updated first.
+        
+        An indexed query with the SQLite backend; the journal backend has
+        to replay every run.
+        
+        Args:
+            status: Only suggestions with this SuggestionStatus value
+            file: Only suggestions touching this path (or a path ending in /file)
+            since: Only suggestions last updated at or after this time
+            run_id: Only suggestions of this run
+            limit: Page size (None = all)
+            offset: Suggestions to skip
+            
+        Returns:
+            Rows with run_id, id, title, category, priority, status,
+            iterations, updated_at, files, cost and duration_s
+        """
+        self._migrate_history()
+        if isinstance(self.history, SQLiteHistoryStore):
+            return self.history.find_suggestions(
+                status=status, file=file, since=since, run_id=run_id, limit=limit, offset=offset
+            )
         
-        return runs
+        rows = []
+        for summary in self.history.list_runs():
+            if run_id and summary["id"] != run_id:
+                continue
+            data = self.history.replay(summary["id"]) or {}
+            for s in data.get("suggestions", []):
+                verdict = s.get("last_verdict") or {}
+                updated_at = verdict.get("created_at") or s.get("created_at") or ""
+                files = sorted({
+                    normalize_path(path)
+                    for path in [*s.get("affected_files", []), *s.get("files_changed", [])]
+                    if path
+                })
+                if status and s.get("status") != status:
+                    continue
+                if since and updated_at < since.isoformat():
+                    continue
+                if file and not any(path == file or path.endswith(f"/{file}") for path in files):
+                    continue
+                log = s.get("iteration_log", [])
+                rows.append({
+                    "run_id": summary["id"],
+                    "id": s.get("id"),
+                    "title": s.get("title"),
+                    "category": s.get("category"),
+                    "priority": s.get("priority"),
+                    "status": s.get("status"),
+                    "iterations": s.get("iterations", 0),
+                    "updated_at": updated_at,
+                    "files": ", ".join(files),
+                    "cost": sum(r.get("cost", 0.0) for r in log),
+                    "duration_s": sum(
+                        r.get("worker_seconds", 0.0) + r.get("judge_seconds", 0.0) for r in log
+                    ),
+                })
+        rows.sort(key=lambda r: r["updated_at"], reverse=True)
+        return rows[offset:None if limit is None else offset + limit]
     
     # ========== DIFF METHODS ==========
     
+    @traced("git.diff")
     def get_git_diff(self) -> str:
         """
         Get git diff of changes in target repository.
@@ -535,6 +1600,7 @@ Provide your verdict as JSON."""
         except Exception as e:
             return f"(Could not get diff: {e})"
     
+    @traced("git.diff")
     def get_file_diff(self, file_path: str) -> str:
         """
         Get git diff for a specific file.
@@ -0,0 +1,253 @@
+"""
+Chunker - Split large source files at syntactic boundaries.
+
+Python files are split between top-level functions and classes (and
+between methods of oversized classes) using the ast module. Other
+languages fall back to splitting at blank-line-separated, unindented
+block starts, then at fixed line windows.
+
+Each chunk carries the file's import block as context, so the LLM can
+resolve names without seeing the whole file.
+
+Usage:
+    >>> budget = chunk_budget_chars(num_ctx=32768, chunk_tokens=6000)
+    >>> for chunk in chunk_source(content, "app/models.py", budget):
+    ...     analyze(chunk.context + chunk.text)
+"""
+
+import ast
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+# Rough token estimate, same heuristic as agent_factory.llm.budget
+CHARS_PER_TOKEN = 4
+
+# Tokens kept free in the context window for instructions and the reply
+PROMPT_OVERHEAD_TOKENS = 1024
+OUTPUT_RESERVE_TOKENS = 2048
+
+# Import-block context is capped so it never crowds out the chunk itself
+MAX_CONTEXT_CHARS = 2000
+
+# Unindented lines that usually start a new block in C-like / scripting languages
+_BLOCK_START = re.compile(
+    r"^(export\s+|async\s+|public\s+|private\s+|protected\s+|static\s+)*"
+    r"(def|class|function|interface|type|enum|const|let|var|func|fn|impl|struct|trait|module)\b"
+)
+
+
+@dataclass
+class Chunk:
+    """A contiguous slice of a source file."""
+    file_path: str
+    index: int
+    total: int
+    start_line: int   # 1-based, inclusive
+    end_line: int     # 1-based, inclusive
+    text: str
+    context: str = ""                                  # imports shared by all chunks
+    symbols: List[str] = field(default_factory=list)   # top-level names defined in the chunk
+
+    @property
+    def is_whole_file(self) -> bool:
+        return self.total == 1
+
+    def describe(self) -> str:
+        """Human-readable location, e.g. "lines 120-340, part 2/4"."""
+        if self.is_whole_file:
+            return "whole file"
+        return f"lines {self.start_line}-{self.end_line}, part {self.index + 1}/{self.total}"
+
+
+def chunk_budget_chars(num_ctx: int, chunk_tokens: Optional[int] = None) -> int:
+    """
+    Maximum characters of source per chunk.
+
+    Args:
+        num_ctx: Model context window in tokens
+        chunk_tokens: Optional smaller per-chunk cap in tokens
+
+    Returns:
+        Character budget (at least 1000)
+    """
+    tokens = num_ctx - PROMPT_OVERHEAD_TOKENS - OUTPUT_RESERVE_TOKENS
+    if chunk_tokens:
+        tokens = min(tokens, chunk_tokens)
+    return max(1000, tokens * CHARS_PER_TOKEN)
+
+
+# ========== SEGMENTATION ==========
+
+# A segment is (start_line, end_line, symbol) with 1-based inclusive lines
+
+
+def _node_start(node: ast.AST) -> int:
+    """First line of a statement, including decorators."""
+    return min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+
+
+def _python_segments(
+    content: str, lines: List[str], max_chars: int
+) -> Optional[Tuple[List[Tuple[int, int, str]], int]]:
+    """
+    Top-level segments of a Python module.
+
+    Returns:
+        (segments, import_end_line), or None if the source does not parse
+    """
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return None
+
+    body = tree.body
+    if not body:
+        return [], 0
+
+    # Leading docstring/imports form the shared context
+    import_end = 0
+    for node in body:
+        is_docstring = (
+            isinstance(node, ast.Expr)
+            and isinstance(getattr(node, "value", None), ast.Constant)
+            and isinstance(node.value.value, str)
+        )
+        if isinstance(node, (ast.Import, ast.ImportFrom)) or (is_docstring and import_end == 0):
+            import_end = node.end_lineno
+        else:
+            break
+
+    starts = [_node_start(node) for node in body]
+    segments = []
+    for i, node in enumerate(body):
+        start = starts[i]
+        # Extend to the line before the next node so comments stay attached
+        end = starts[i + 1] - 1 if i + 1 < len(body) else len(lines)
+        name = getattr(node, "name", "")
+
+        size = sum(len(line) for line in lines[start - 1:end])
+        if isinstance(node, ast.ClassDef) and size > max_chars and node.body:
+            # Split oversized classes between methods; the class line goes with the first part
+            members = node.body
+            member_starts = [_node_start(member) for member in members]
+            part_start = start
+            for j, member in enumerate(members):
+                member_end = member_starts[j + 1] - 1 if j + 1 < len(members) else end
+                member_name = f"{name}.{getattr(member, 'name', '')}".rstrip(".")
+                segments.append((part_start, member_end, member_name))
+                part_start = member_end + 1
+        else:
+            segments.append((start, end, name))
+
+    return segments, import_end
+
+
+def _generic_segments(lines: List[str]) -> List[Tuple[int, int, str]]:
+    """Segments split before unindented block starts that follow a blank line."""
+    boundaries = [1]
+    for i, line in enumerate(lines[1:], start=2):
+        if _BLOCK_START.match(line) and not lines[i - 2].strip():
+            boundaries.append(i)
+    boundaries.append(len(lines) + 1)
+    return [
+        (boundaries[i], boundaries[i + 1] - 1, "")
+        for i in range(len(boundaries) - 1)
+        if boundaries[i] <= boundaries[i + 1] - 1
+    ]
+
+
+def _split_oversized(
+    segments: List[Tuple[int, int, str]],
+    lines: List[str],
+    max_chars: int
+) -> List[Tuple[int, int, str]]:
+    """Break any segment larger than max_chars into line windows."""
+    result = []
+    for start, end, name in segments:
+        size = sum(len(line) for line in lines[start - 1:end])
+        if size <= max_chars:
+            result.append((start, end, name))
+            continue
+        window_start, window_size = start, 0
+        for line_no in range(start, end + 1):
+            line_len = len(lines[line_no - 1])
+            if window_size and window_size + line_len > max_chars:
+                result.append((window_start, line_no - 1, name))
+                window_start, window_size = line_no, 0
+            window_size += line_len
+        result.append((window_start, end, name))
+    return result
+
+
+# ========== CHUNKING ==========
+
+def chunk_source(content: str, file_path: str, max_chars: int) -> List[Chunk]:
+    """
+    Split a file into chunks of at most max_chars, at syntactic boundaries.
+
+    Files that fit return a single whole-file chunk with no context.
+
+    Args:
+        content: File content
+        file_path: Path used for language detection and chunk labels
+        max_chars: Character budget per chunk (see chunk_budget_chars)
+
+    Returns:
+        Chunks in file order
+    """
+    lines = content.splitlines(keepends=True)
+    if len(content) <= max_chars or len(lines) <= 1:
+        return [Chunk(file_path, 0, 1, 1, max(1, len(lines)), content)]
+
+    parsed = _python_segments(content, lines, max_chars) if file_path.endswith(".py") else None
+    if parsed is not None:
+        segments, import_end = parsed
+    else:
+        segments, import_end = _generic_segments(lines), 0
+
+    context = "".join(lines[:import_end])
+    if len(context) > MAX_CONTEXT_CHARS:
+        context = context[:MAX_CONTEXT_CHARS] + "\n# ... (imports truncated)\n"
+    # The import block is already in every chunk's context; leading
+    # comments before the first segment stay with it
+    segments = [(max(s, import_end + 1), e, n) for s, e, n in segments if e > import_end]
+    if segments and segments[0][0] > import_end + 1:
+        first = segments[0]
+        segments[0] = (import_end + 1, first[1], first[2])
+
+    budget = max(1, max_chars - len(context))
+    segments = _split_oversized(segments, lines, budget)
+
+    # Greedily pack consecutive segments into chunks
+    groups: List[List[Tuple[int, int, str]]] = []
+    current: List[Tuple[int, int, str]] = []
+    current_size = 0
+    for start, end, name in segments:
+        size = sum(len(line) for line in lines[start - 1:end])
+        if current and current_size + size > budget:
+            groups.append(current)
+            current, current_size = [], 0
+        current.append((start, end, name))
+        current_size += size
+    if current:
+        groups.append(current)
+
+    chunks = []
+    for i, group in enumerate(groups):
+        start, end = group[0][0], group[-1][1]
+        symbols = []
+        for _, _, name in group:
+            if name and name not in symbols:
+                symbols.append(name)
+        chunks.append(Chunk(
+            file_path=file_path,
+            index=i,
+            total=len(groups),
+            start_line=start,
+            end_line=end,
+            text="".join(lines[start - 1:end]),
+            context=context,
+            symbols=symbols,
+        ))
+    return chunks
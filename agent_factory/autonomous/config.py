@@ -37,12 +37,61 @@ class AutonomousConfig:
         "performance",
     ])
     
+    # Send each file once with all analysis types (per-type calls on parse failure)
+    combined_analysis: bool = True
+    
+    # Only analyze files changed since this git ref ("last-run" = HEAD of previous run)
+    changed_since: Optional[str] = None
+    
+    # Reuse prior analysis of unchanged files (stored under history_dir)
+    use_analysis_cache: bool = True
+    
+    # Large files are split at function/class boundaries to fit num_ctx
+    chunk_tokens: Optional[int] = 6000   # Per-chunk cap (None = fill num_ctx)
+    max_file_bytes: int = 1_000_000      # Files above this are skipped entirely
+    
+    # Merge near-duplicate suggestions into multi-file ones (1.0 disables)
+    dedup_threshold: float = 0.6
+    dedup_max_files: int = 8
+    
+    # Concurrent analysis
+    analysis_workers: int = 4          # Parallel LLM analysis calls (1 = sequential)
+    high_priority_threshold: int = 8   # Stop early once max_suggestions reach this priority
+    
+    # Run up to N suggestions at once, each in its own git worktree (1 = sequential)
+    parallel_suggestions: int = 1
+    
+    # Implement the next suggestion while the judge evaluates the previous one
+    pipelined: bool = False
+    pipeline_queue_size: int = 2       # Implementations allowed to wait for the judge
+    
+    # Streaming: yield suggestions as files complete and start Workers during analysis
+    stream: bool = False
+    # Yield at once at or above this priority; the rest wait for the final top-K
+    stream_min_priority: int = 7
+    
+    # Static checks before the LLM judge; failures go straight back to the worker
+    precheck: bool = True
+    # e.g. ["pytest -q", "ruff check ."]; run in an isolated worktree when pipelined
+    precheck_commands: List[str] = field(default_factory=list)
+    precheck_timeout: int = 300        # Seconds per command
+    max_diff_lines: Optional[int] = 2000  # Reject larger diffs (None = no cap)
+    
+    # Judge input: unified diff of the suggestion's changes instead of whole files
+    judge_diff_context: int = 3        # Context lines around each hunk
+    judge_max_diff_chars: int = 20000  # Longer diffs are truncated
+    
+    # Retries continue the worker's conversation with the verdict instead of starting over
+    reuse_worker_sessions: bool = True
+    
     # File patterns to include/exclude
     include_patterns: List[str] = field(default_factory=lambda: ["*.py", "*.ts", "*.js"])
     exclude_patterns: List[str] = field(default_factory=lambda: [
         "__pycache__/*",
         "node_modules/*",
         ".git/*",
+        ".venv/*",
+        "venv/*",
         "*.pyc",
         ".env*",
     ])
@@ -50,9 +99,10 @@ class AutonomousConfig:
     # Workspace for file operations
     workspace_dir: Optional[str] = None
     
-    # Persistence - save run history
+    # Persistence - save run history (per-run JSONL journals + index.json)
     history_dir: str = ".autonomous_history"  # Directory for run history
-    state_file: Optional[str] = None  # Path to save/resume run state
+    state_file: Optional[str] = None  # Also keep a full JSON snapshot here to resume from
+    history_backend: str = "journal"  # "journal" or "sqlite" (indexed, queryable history.db)
     
     # Headless mode (for CI/automation)
     headless: bool = False  # Run without interactive prompts
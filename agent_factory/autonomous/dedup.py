@@ -0,0 +1,295 @@
+"""
+Dedup - Cluster near-duplicate improvements before ranking.
+
+File-by-file analysis produces many near-identical improvements ("Add
+docstrings to a.py", "Add docstrings to b.py"). Each would cost a full
+Worker/Judge loop, so they are clustered and merged into multi-file
+suggestions before the top N are picked.
+
+Similarity between two improvements of the same category is the larger of:
+    - Jaccard similarity of normalized title tokens (file names and
+      stopwords removed)
+    - MinHash-estimated Jaccard similarity of description word shingles
+
+Candidate pairs come from LSH banding over the MinHash signatures plus
+prefix filtering of titles: two titles reaching the threshold must share
+one of their rarest tokens, so common tokens ("error", "docstrings") never
+pull every improvement into one bucket. Identical normalized titles are
+merged directly, and each improvement is compared with at most
+BUCKET_WINDOW neighbours per bucket, so clustering stays near-linear.
+
+Usage:
+    >>> merged = cluster_improvements(improvements, threshold=0.6, max_files=8)
+
+Streaming callers, which cannot wait for the full list, use DuplicateFilter
+to look up each new improvement against the ones seen so far.
+"""
+
+import hashlib
+import math
+import random
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+NUM_PERMUTATIONS = 32
+LSH_BANDS = 8            # 8 bands x 4 rows
+SHINGLE_SIZE = 3
+# Members of a candidate bucket compared with each one (caps O(n^2) buckets)
+BUCKET_WINDOW = 64
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+_TOKEN = re.compile(r"[a-z0-9_]+")
+_STOPWORDS = {
+    "a", "an", "the", "to", "of", "in", "for", "and", "or", "on", "with", "by",
+    "is", "are", "be", "this", "that", "it", "from", "into", "at", "as",
+    "add", "improve", "missing", "file", "module", "function", "functions", "code",
+}
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def _file_tokens(files: Sequence[str]) -> Set[str]:
+    """Tokens of file names, ignored when comparing titles."""
+    tokens = set()
+    for path in files:
+        name = path.rsplit("/", 1)[-1]
+        tokens.update(_tokens(name))
+        tokens.update(_tokens(name.rsplit(".", 1)[0]))
+    return tokens
+
+
+def title_tokens(improvement: dict) -> Set[str]:
+    """Normalized title tokens without stopwords and file names."""
+    ignored = _STOPWORDS | _file_tokens(improvement.get("affected_files", []))
+    return {t for t in _tokens(str(improvement.get("title", ""))) if t not in ignored}
+
+
+def minhash(text: str) -> List[int]:
+    """MinHash signature over word shingles of text."""
+    words = _tokens(text)
+    if len(words) < SHINGLE_SIZE:
+        shingles = {" ".join(words)} if words else {""}
+    else:
+        starts = range(len(words) - SHINGLE_SIZE + 1)
+        shingles = {" ".join(words[i:i + SHINGLE_SIZE]) for i in starts}
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+        for s in shingles
+    ]
+    return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def jaccard(left: Set[str], right: Set[str]) -> float:
+    if not left and not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+def _signature_similarity(left: List[int], right: List[int]) -> float:
+    return sum(1 for a, b in zip(left, right, strict=True) if a == b) / NUM_PERMUTATIONS
+
+
+def _similarity(
+    left: Tuple[Set[str], List[int]],
+    right: Tuple[Set[str], List[int]]
+) -> float:
+    """Larger of title-token Jaccard and description MinHash similarity."""
+    return max(jaccard(left[0], right[0]), _signature_similarity(left[1], right[1]))
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            # Lower index stays root so clusters keep their first member's position
+            self.parent[max(root_i, root_j)] = min(root_i, root_j)
+
+
+def find_clusters(improvements: Sequence[dict], threshold: float) -> List[List[int]]:
+    """
+    Group indices of near-duplicate improvements.
+
+    Args:
+        improvements: Improvement dicts (title, description, category, affected_files)
+        threshold: Minimum similarity (0-1) to merge two improvements
+
+    Returns:
+        Clusters of indices, ordered by first member
+    """
+    n = len(improvements)
+    titles = [title_tokens(imp) for imp in improvements]
+    signatures = [minhash(str(imp.get("description", ""))) for imp in improvements]
+    categories = [imp.get("category") for imp in improvements]
+
+    uf = _UnionFind(n)
+
+    # Identical normalized titles (Jaccard 1.0) merge without pairwise checks
+    same_title: Dict[Tuple, int] = {}
+    for i in range(n):
+        if titles[i] and threshold <= 1.0:
+            uf.union(same_title.setdefault((categories[i], frozenset(titles[i])), i), i)
+
+    # Candidate pairs: shared LSH band, or a shared token among the rarest
+    # len - ceil(threshold * len) + 1 title tokens (any pair with title
+    # Jaccard >= threshold shares one; common tokens sort last and drop out)
+    frequency = Counter(token for tokens in titles for token in tokens)
+    buckets: Dict[Tuple, List[int]] = defaultdict(list)
+    rows = NUM_PERMUTATIONS // LSH_BANDS
+    for i in range(n):
+        for band in range(LSH_BANDS):
+            band_key = tuple(signatures[i][band * rows:(band + 1) * rows])
+            buckets[(categories[i], band, band_key)].append(i)
+        ordered = sorted(titles[i], key=lambda token: (frequency[token], token))
+        prefix = len(ordered) - math.ceil(threshold * len(ordered)) + 1
+        for token in ordered[:max(prefix, 0)]:
+            buckets[(categories[i], "token", token)].append(i)
+
+    checked = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for x in range(len(members)):
+            for y in range(x + 1, min(len(members), x + 1 + BUCKET_WINDOW)):
+                i, j = members[x], members[y]
+                if (i, j) in checked or uf.find(i) == uf.find(j):
+                    continue
+                checked.add((i, j))
+                similarity = _similarity((titles[i], signatures[i]), (titles[j], signatures[j]))
+                if similarity >= threshold:
+                    uf.union(i, j)
+
+    clusters: Dict[int, List[int]] = defaultdict(list)
+    for i in range(n):
+        clusters[uf.find(i)].append(i)
+    return [clusters[root] for root in sorted(clusters)]
+
+
+def merge_cluster(members: Sequence[dict]) -> dict:
+    """
+    Merge a cluster into one multi-file improvement.
+
+    The highest-priority member supplies title and description; files and
+    acceptance criteria are unioned in order.
+    """
+    lead = max(members, key=lambda imp: imp.get("priority", 5))
+    merged = dict(lead)
+
+    files: List[str] = []
+    criteria: List[str] = []
+    for imp in members:
+        for path in imp.get("affected_files", []):
+            if path not in files:
+                files.append(path)
+        for criterion in imp.get("acceptance_criteria", []):
+            if criterion not in criteria:
+                criteria.append(criterion)
+
+    merged["affected_files"] = files
+    merged["acceptance_criteria"] = criteria
+    if len(members) > 1:
+        merged["merged_count"] = len(members)
+        lead_files = set(lead.get("affected_files", []))
+        others = [path for path in files if path not in lead_files]
+        if others:
+            merged["description"] = (
+                f"{lead.get('description', '')}\n\nApply the same change to: {', '.join(others)}"
+            ).strip()
+    return merged
+
+
+def cluster_improvements(
+    improvements: Sequence[dict],
+    threshold: float = 0.6,
+    max_files: int = 8
+) -> List[dict]:
+    """
+    Collapse near-duplicate improvements into multi-file suggestions.
+
+    Args:
+        improvements: Raw improvement dicts from file analysis
+        threshold: Similarity needed to merge (>= 1.0 disables merging)
+        max_files: Largest number of files per merged suggestion; bigger
+            clusters are split so each Worker task stays tractable
+
+    Returns:
+        Merged improvements, in order of each cluster's first member
+    """
+    if threshold >= 1.0 or len(improvements) < 2:
+        return list(improvements)
+
+    merged = []
+    for cluster in find_clusters(improvements, threshold):
+        members = [improvements[i] for i in cluster]
+        group: List[dict] = []
+        group_files: Set[str] = set()
+        for imp in members:
+            files = set(imp.get("affected_files", []))
+            if group and len(group_files | files) > max_files:
+                merged.append(merge_cluster(group))
+                group, group_files = [], set()
+            group.append(imp)
+            group_files |= files
+        if group:
+            merged.append(merge_cluster(group))
+    return merged
+
+
+_Entry = Tuple[Hashable, Set[str], List[int]]
+
+
+class DuplicateFilter:
+    """
+    Incremental near-duplicate lookup.
+
+    Each new improvement is compared with the registered ones of the same
+    category (linear, which is fine for the few dozen a streamed run keeps).
+
+    Example:
+        >>> seen = DuplicateFilter(threshold=0.6)
+        >>> if seen.match(improvement) is None:
+        ...     seen.add(improvement, key=len(emitted))
+    """
+
+    def __init__(self, threshold: float = 0.6):
+        self.threshold = threshold
+        # category -> [(key, title tokens, description signature)]
+        self._entries: Dict[Hashable, List[_Entry]] = defaultdict(list)
+
+    @staticmethod
+    def _features(improvement: dict) -> Tuple[Set[str], List[int]]:
+        return title_tokens(improvement), minhash(str(improvement.get("description", "")))
+
+    def match(self, improvement: dict) -> Optional[Hashable]:
+        """Key of the most similar registered improvement at or above threshold."""
+        if self.threshold >= 1.0:
+            return None
+        features = self._features(improvement)
+        best_key, best = None, self.threshold
+        for key, titles, signature in self._entries[improvement.get("category")]:
+            similarity = _similarity(features, (titles, signature))
+            if similarity >= best:
+                best_key, best = key, similarity
+        return best_key
+
+    def add(self, improvement: dict, key: Hashable) -> None:
+        """Register an improvement under a caller-chosen key."""
+        titles, signature = self._features(improvement)
+        self._entries[improvement.get("category")].append((key, titles, signature))
@@ -0,0 +1,227 @@
+"""
+Git Scope - Limit analysis to files changed since a git ref.
+
+Used by SuggestionGenerator when AutonomousConfig.changed_since is set,
+e.g. in CI on pull requests:
+
+    python autonomous_cli.py --headless --changed-since origin/main
+    python autonomous_cli.py --headless --changed-since last-run
+
+"last-run" resolves to the HEAD commit recorded by the most recent run in
+the history directory. Binary and large files are dropped based on git
+attributes (binary, -diff, filter=lfs, linguist-generated) and git's own
+binary detection, so no file contents need to be read.
+"""
+
+import json
+import logging
+import sqlite3
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .history_store import HISTORY_DB, SQLiteHistoryStore
+from .journal import RunJournal
+
+logger = logging.getLogger(__name__)
+
+
+# Sentinel ref: HEAD recorded by the most recent run in the history directory
+LAST_RUN_REF = "last-run"
+
+# Attributes consulted by filter_by_attributes()
+SKIP_ATTRIBUTES = ("binary", "diff", "filter", "linguist-generated", "linguist-vendored")
+
+
+class GitScopeError(Exception):
+    """Git could not resolve the requested change set."""
+    pass
+
+
+def _git(repo: Path, args: List[str], input: Optional[str] = None, timeout: int = 30) -> str:
+    """Run a git command in repo and return stdout."""
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=repo,
+            input=input,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise GitScopeError(f"git {args[0]} failed: {e}") from e
+    if result.returncode != 0:
+        raise GitScopeError(f"git {args[0]} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def _split_z(output: str) -> List[str]:
+    return [item for item in output.split("\0") if item]
+
+
+def git_head(repo: Path) -> Optional[str]:
+    """
+    Current HEAD commit of repo.
+
+    Returns:
+        Full commit SHA, or None if repo is not a git checkout
+    """
+    try:
+        return _git(Path(repo), ["rev-parse", "HEAD"]).strip() or None
+    except GitScopeError:
+        return None
+
+
+def last_recorded_head(history_dir: Path) -> Optional[str]:
+    """
+    HEAD recorded by the most recently started run in the history directory.
+
+    Args:
+        history_dir: AutonomousConfig.get_history_path()
+
+    Returns:
+        Commit SHA, or None if no run recorded one
+    """
+    history_dir = Path(history_dir)
+    if not history_dir.exists():
+        return None
+
+    # Journaled runs are summarized in the index, SQLite-backed runs in
+    # history.db; legacy runs are whole JSON files
+    summaries = RunJournal(history_dir).list_runs()
+    if (history_dir / HISTORY_DB).exists():
+        store = SQLiteHistoryStore(history_dir / HISTORY_DB)
+        try:
+            summaries.extend(store.list_runs())
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read {store.db_path}: {e}")
+        finally:
+            store.close()
+    indexed = {summary.get("id") for summary in summaries}
+    for filepath in history_dir.glob("run_*_*.json"):
+        if filepath.stem[len("run_"):].split("_", 1)[0] in indexed:
+            continue
+        try:
+            summaries.append(json.loads(filepath.read_text()))
+        except Exception:
+            continue
+
+    latest = None
+    for data in summaries:
+        commit = data.get("base_commit")
+        if not commit:
+            continue
+        started = data.get("started_at") or ""
+        if latest is None or started > latest[0]:
+            latest = (started, commit)
+
+    return latest[1] if latest else None
+
+
+def resolve_ref(repo: Path, ref: str, history_dir: Optional[Path] = None) -> str:
+    """
+    Resolve a user-supplied ref (or LAST_RUN_REF) to a commit SHA.
+
+    Raises:
+        GitScopeError: If the ref cannot be resolved
+    """
+    if ref == LAST_RUN_REF:
+        commit = last_recorded_head(history_dir) if history_dir else None
+        if not commit:
+            raise GitScopeError("No previous run with a recorded commit")
+        ref = commit
+    try:
+        return _git(Path(repo), ["rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"]).strip()
+    except GitScopeError:
+        raise GitScopeError(f"Unknown git ref '{ref}' in {repo}") from None
+
+
+def filter_by_attributes(repo: Path, paths: Iterable[str]) -> List[str]:
+    """
+    Drop paths git attributes mark as binary, LFS-stored, or generated.
+
+    Args:
+        repo: Repository (or subdirectory) the paths are relative to
+        paths: Relative paths
+
+    Returns:
+        Paths worth sending to the LLM, in input order
+    """
+    paths = list(paths)
+    if not paths:
+        return []
+
+    output = _git(
+        Path(repo),
+        ["check-attr", "-z", "--stdin", *SKIP_ATTRIBUTES],
+        input="\0".join(paths) + "\0",
+    )
+
+    # -z output is a flat sequence of (path, attribute, value) triples
+    fields = output.split("\0")
+    attributes: Dict[str, Dict[str, str]] = {}
+    for i in range(0, len(fields) - 2, 3):
+        path, attribute, value = fields[i:i + 3]
+        attributes.setdefault(path, {})[attribute] = value
+
+    kept = []
+    for path in paths:
+        attrs = attributes.get(path, {})
+        if attrs.get("binary") == "set" or attrs.get("diff") == "unset":
+            continue
+        if attrs.get("filter") == "lfs":
+            continue
+        if attrs.get("linguist-generated") == "set" or attrs.get("linguist-vendored") == "set":
+            continue
+        kept.append(path)
+
+    skipped = len(paths) - len(kept)
+    if skipped:
+        logger.info(f"Skipped {skipped} binary/large/generated files by git attributes")
+    return kept
+
+
+def changed_files(
+    repo: Path,
+    since: str,
+    history_dir: Optional[Path] = None,
+    include_untracked: bool = True
+) -> List[str]:
+    """
+    Files added or modified since a ref, including uncommitted changes.
+
+    Args:
+        repo: Target repository (may be a subdirectory of the git checkout)
+        since: Git ref, or LAST_RUN_REF
+        history_dir: History directory used to resolve LAST_RUN_REF
+        include_untracked: Also include new files not yet added to git
+
+    Returns:
+        Sorted paths relative to repo, excluding deleted, binary, and
+        LFS/generated files
+
+    Raises:
+        GitScopeError: If repo is not a git checkout or the ref is unknown
+    """
+    repo = Path(repo)
+    commit = resolve_ref(repo, since, history_dir)
+
+    # --numstat reports "-" for files git considers binary
+    numstat = _git(
+        repo,
+        ["diff", "--numstat", "-z", "--no-renames", "--relative", "--diff-filter=ACMT", commit],
+    )
+    files = set()
+    for entry in _split_z(numstat):
+        added, deleted, path = entry.split("\t", 2)
+        if added == "-" and deleted == "-":
+            continue
+        files.add(path)
+
+    if include_untracked:
+        untracked = _git(repo, ["ls-files", "--others", "--exclude-standard", "-z"])
+        files.update(_split_z(untracked))
+
+    files = [f for f in sorted(files) if (repo / f).is_file()]
+    return filter_by_attributes(repo, files)
@@ -0,0 +1,486 @@
+"""
+History Store - Optional SQLite backend for run history.
+
+The JSONL journal (see journal.py) is cheap to write but can only be
+searched by replaying runs. With AutonomousConfig.history_backend set to
+"sqlite", runs are stored in <history_dir>/history.db instead, with
+indexed tables that answer questions such as "failed suggestions touching
+auth.py in the last 30 days" without loading any run:
+
+    runs              one row per run (status, dates, counts, header JSON)
+    suggestions       latest state of each suggestion (full JSON in data)
+    suggestion_files  affected and changed files per suggestion
+    verdicts          every judge verdict, one row per iteration
+    iterations        worker/judge timings, cost and tokens per iteration
+
+Every checkpoint upserts the run header and the changed suggestion in one
+transaction, so writes stay O(event) like the journal. Uses only the
+standard library sqlite3 module.
+
+Usage:
+    >>> store = SQLiteHistoryStore(config.get_history_path() / HISTORY_DB)
+    >>> store.append(run, [suggestion])
+    >>> store.find_suggestions(status="failed", file="auth.py", since=last_month)
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .journal import RunJournal, run_summary
+from .models import AutonomousRun, Suggestion
+from .scheduler import normalize_path
+
+logger = logging.getLogger(__name__)
+
+
+HISTORY_DB = "history.db"
+
+HISTORY_BACKENDS = ("journal", "sqlite")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    status TEXT,
+    target_repo TEXT,
+    started_at TEXT,
+    completed_at TEXT,
+    base_commit TEXT,
+    model TEXT,
+    total INTEGER DEFAULT 0,
+    completed INTEGER DEFAULT 0,
+    failed INTEGER DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status, started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_at);
+
+CREATE TABLE IF NOT EXISTS suggestions (
+    run_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT,
+    category TEXT,
+    priority INTEGER,
+    status TEXT,
+    iterations INTEGER DEFAULT 0,
+    created_at TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (run_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_suggestions_run ON suggestions(run_id, position);
+CREATE INDEX IF NOT EXISTS idx_suggestions_status ON suggestions(status, updated_at);
+CREATE INDEX IF NOT EXISTS idx_suggestions_updated ON suggestions(updated_at);
+
+CREATE TABLE IF NOT EXISTS suggestion_files (
+    run_id TEXT NOT NULL,
+    suggestion_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (run_id, suggestion_id, path)
+);
+CREATE INDEX IF NOT EXISTS idx_suggestion_files_path ON suggestion_files(path);
+
+CREATE TABLE IF NOT EXISTS verdicts (
+    run_id TEXT NOT NULL,
+    suggestion_id TEXT NOT NULL,
+    iteration INTEGER NOT NULL,
+    status TEXT,
+    score REAL,
+    feedback TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (run_id, suggestion_id, iteration)
+);
+CREATE INDEX IF NOT EXISTS idx_verdicts_status ON verdicts(status, created_at);
+
+CREATE TABLE IF NOT EXISTS iterations (
+    run_id TEXT NOT NULL,
+    suggestion_id TEXT NOT NULL,
+    iteration INTEGER NOT NULL,
+    started_at TEXT,
+    worker_seconds REAL DEFAULT 0,
+    judge_seconds REAL DEFAULT 0,
+    cost REAL DEFAULT 0,
+    prompt_tokens INTEGER DEFAULT 0,
+    completion_tokens INTEGER DEFAULT 0,
+    PRIMARY KEY (run_id, suggestion_id, iteration)
+);
+"""
+
+
+class SQLiteHistoryStore:
+    """
+    Run history in an indexed SQLite database.
+
+    Same write/read interface as RunJournal (append, compact, list_runs,
+    replay), plus filtered, paginated queries. One connection is shared
+    and serialized with a lock, so worker and judge threads may checkpoint
+    concurrently.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize the store (the database is created on first use).
+
+        Args:
+            db_path: Database file, usually <history_dir>/history.db
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._stored: Dict[str, Set[str]] = {}  # run id -> suggestion ids already stored
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Shared connection, opened lazily (caller holds _lock)."""
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._connection = conn
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    # ========== WRITING ==========
+
+    def _upsert_run(self, header: Dict[str, Any]) -> None:
+        summary = run_summary(header, self.db_path)
+        self._conn.execute(
+            """INSERT INTO runs (id, status, target_repo, started_at, completed_at, base_commit,
+                                 model, total, completed, failed, data)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(id) DO UPDATE SET
+                   status=excluded.status, target_repo=excluded.target_repo,
+                   started_at=excluded.started_at, completed_at=excluded.completed_at,
+                   base_commit=excluded.base_commit, model=excluded.model,
+                   total=excluded.total, completed=excluded.completed,
+                   failed=excluded.failed, data=excluded.data""",
+            (
+                summary["id"], summary["status"], summary["target_repo"],
+                summary["started_at"], summary["completed_at"], summary["base_commit"],
+                header.get("model"), summary["total"], summary["completed"],
+                summary["failed"], json.dumps(header),
+            ),
+        )
+
+    def _upsert_suggestion(
+        self, run_id: str, position: int, data: Dict[str, Any], updated_at: str
+    ) -> None:
+        """Store a suggestion's latest state, files, verdict and iteration stats."""
+        suggestion_id = data["id"]
+        self._conn.execute(
+            """INSERT INTO suggestions (run_id, id, position, title, category, priority, status,
+                                        iterations, created_at, updated_at, data)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(run_id, id) DO UPDATE SET
+                   title=excluded.title, category=excluded.category,
+                   priority=excluded.priority, status=excluded.status,
+                   iterations=excluded.iterations, updated_at=excluded.updated_at,
+                   data=excluded.data""",
+            (
+                run_id, suggestion_id, position, data.get("title"), data.get("category"),
+                data.get("priority"), data.get("status"), data.get("iterations", 0),
+                data.get("created_at"), updated_at, json.dumps(data),
+            ),
+        )
+
+        files = {
+            normalize_path(path)
+            for path in [*data.get("affected_files", []), *data.get("files_changed", [])]
+            if path
+        }
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO suggestion_files (run_id, suggestion_id, path) VALUES (?, ?, ?)",
+            [(run_id, suggestion_id, path) for path in files],
+        )
+
+        verdict = data.get("last_verdict")
+        if verdict:
+            # Each verdict is checkpointed as last_verdict, so every iteration gets a row
+            self._conn.execute(
+                """INSERT OR REPLACE INTO verdicts (run_id, suggestion_id, iteration, status,
+                                                    score, feedback, created_at, data)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    run_id, suggestion_id, verdict.get("iteration", 0), verdict.get("status"),
+                    verdict.get("score"), verdict.get("feedback"), verdict.get("created_at"),
+                    json.dumps(verdict),
+                ),
+            )
+
+        self._conn.executemany(
+            """INSERT OR REPLACE INTO iterations (run_id, suggestion_id, iteration, started_at,
+                                                 worker_seconds, judge_seconds, cost,
+                                                 prompt_tokens, completion_tokens)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    run_id, suggestion_id, record.get("iteration", 0), record.get("started_at"),
+                    record.get("worker_seconds", 0.0), record.get("judge_seconds", 0.0),
+                    record.get("cost", 0.0), record.get("prompt_tokens", 0),
+                    record.get("completion_tokens", 0),
+                )
+                for record in data.get("iteration_log", [])
+            ],
+        )
+
+    def _write(self, header: Dict[str, Any], suggestions: List[Tuple[int, Dict[str, Any]]]) -> None:
+        """Upsert a run header and suggestions in one transaction (caller holds _lock)."""
+        updated_at = datetime.utcnow().isoformat()
+        with self._conn:
+            self._upsert_run(header)
+            for position, data in suggestions:
+                self._upsert_suggestion(header["id"], position, data, updated_at)
+
+    def append(self, run: AutonomousRun, suggestions: Iterable[Suggestion] = ()) -> Path:
+        """
+        Record a checkpoint: the run header, the given suggestions, and any
+        suggestion of the run not stored yet.
+
+        Args:
+            run: Run being checkpointed
+            suggestions: Suggestions whose state changed
+
+        Returns:
+            Database path
+        """
+        with self._lock:
+            stored = self._stored.setdefault(run.id, set())
+            changed = {s.id for s in suggestions}
+            rows = [
+                (position, s.model_dump(mode="json"))
+                for position, s in enumerate(run.suggestions)
+                if s.id in changed or s.id not in stored
+            ]
+            self._write(run.model_dump(mode="json", exclude={"suggestions"}), rows)
+            stored.update(data["id"] for _, data in rows)
+        return self.db_path
+
+    def compact(self, run: AutonomousRun) -> Path:
+        """Store the complete run state (rows are upserted, so nothing accumulates)."""
+        with self._lock:
+            rows = [
+                (position, s.model_dump(mode="json")) for position, s in enumerate(run.suggestions)
+            ]
+            self._write(run.model_dump(mode="json", exclude={"suggestions"}), rows)
+            self._stored[run.id] = {s.id for s in run.suggestions}
+        return self.db_path
+
+    def import_run(self, data: Dict[str, Any]) -> None:
+        """Store a run saved by another backend (JSON dump with suggestions)."""
+        header = {k: v for k, v in data.items() if k != "suggestions"}
+        with self._lock:
+            self._write(header, list(enumerate(data.get("suggestions", []))))
+
+    # ========== READING ==========
+
+    @staticmethod
+    def _run_filters(
+        status: Optional[str],
+        since: Optional[datetime],
+        until: Optional[datetime]
+    ) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if since:
+            clauses.append("started_at >= ?")
+            params.append(since.isoformat())
+        if until:
+            clauses.append("started_at < ?")
+            params.append(until.isoformat())
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def list_runs(
+        self,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Run summaries, newest first.
+
+        Args:
+            status: Only runs with this RunStatus value
+            since: Only runs started at or after this time
+            until: Only runs started before this time
+            limit: Page size (None = all)
+            offset: Rows to skip
+
+        Returns:
+            Summaries in the same shape as RunJournal.list_runs()
+        """
+        where, params = self._run_filters(status, since, until)
+        query = f"SELECT data FROM runs{where} ORDER BY started_at DESC LIMIT ? OFFSET ?"
+        params = [*params, -1 if limit is None else limit, offset]
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [run_summary(json.loads(row["data"]), self.db_path) for row in rows]
+
+    def count_runs(
+        self,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> int:
+        """Number of runs matching list_runs() filters."""
+        where, params = self._run_filters(status, since, until)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM runs{where}", params).fetchone()[0]
+
+    def replay(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a run's latest state.
+
+        Returns:
+            Run data as saved by AutonomousRun.model_dump(mode="json"), or None
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM runs WHERE id = ?", (run_id,)).fetchone()
+            if row is None:
+                return None
+            suggestions = self._conn.execute(
+                "SELECT id, data FROM suggestions WHERE run_id = ? ORDER BY position", (run_id,)
+            ).fetchall()
+            self._stored[run_id] = {s["id"] for s in suggestions}
+        data = json.loads(row["data"])
+        data["suggestions"] = [json.loads(s["data"]) for s in suggestions]
+        return data
+
+    @staticmethod
+    def _suggestion_filters(
+        status: Optional[str],
+        file: Optional[str],
+        since: Optional[datetime],
+        until: Optional[datetime],
+        run_id: Optional[str]
+    ) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if status:
+            clauses.append("s.status = ?")
+            params.append(status)
+        if run_id:
+            clauses.append("s.run_id = ?")
+            params.append(run_id)
+        if since:
+            clauses.append("s.updated_at >= ?")
+            params.append(since.isoformat())
+        if until:
+            clauses.append("s.updated_at < ?")
+            params.append(until.isoformat())
+        if file:
+            # Exact path, or any path ending in /file
+            clauses.append(
+                "EXISTS (SELECT 1 FROM suggestion_files f WHERE f.run_id = s.run_id "
+                "AND f.suggestion_id = s.id AND (f.path = ? OR f.path LIKE ? ESCAPE '\\'))"
+            )
+            escaped = file.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.extend([file, f"%/{escaped}"])
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def find_suggestions(
+        self,
+        status: Optional[str] = None,
+        file: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        run_id: Optional[str] = None,
+        limit: Optional[int] = 50,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Suggestions across runs, most recently updated first.
+
+        Args:
+            status: Only suggestions with this SuggestionStatus value
+            file: Only suggestions touching this path (or a path ending in /file)
+            since: Only suggestions last updated at or after this time
+            until: Only suggestions last updated before this time
+            run_id: Only suggestions of this run
+            limit: Page size (None = all)
+            offset: Rows to skip
+
+        Returns:
+            Rows with run_id, id, title, category, priority, status,
+            iterations, updated_at, files, cost and duration_s
+        """
+        where, params = self._suggestion_filters(status, file, since, until, run_id)
+        query = f"""
+            SELECT s.run_id, s.id, s.title, s.category, s.priority, s.status, s.iterations,
+                   s.updated_at,
+                   (SELECT group_concat(f.path, ', ') FROM suggestion_files f
+                     WHERE f.run_id = s.run_id AND f.suggestion_id = s.id) AS files,
+                   (SELECT COALESCE(SUM(i.cost), 0) FROM iterations i
+                     WHERE i.run_id = s.run_id AND i.suggestion_id = s.id) AS cost,
+                   (SELECT COALESCE(SUM(i.worker_seconds + i.judge_seconds), 0) FROM iterations i
+                     WHERE i.run_id = s.run_id AND i.suggestion_id = s.id) AS duration_s
+            FROM suggestions s{where}
+            ORDER BY s.updated_at DESC
+            LIMIT ? OFFSET ?"""
+        params = [*params, -1 if limit is None else limit, offset]
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def count_suggestions(
+        self,
+        status: Optional[str] = None,
+        file: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        run_id: Optional[str] = None
+    ) -> int:
+        """Number of suggestions matching find_suggestions() filters."""
+        where, params = self._suggestion_filters(status, file, since, until, run_id)
+        query = f"SELECT COUNT(*) FROM suggestions s{where}"
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def verdicts(self, run_id: str, suggestion_id: str) -> List[Dict[str, Any]]:
+        """Every verdict recorded for a suggestion, by iteration."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM verdicts WHERE run_id = ? AND suggestion_id = ?"
+                " ORDER BY iteration",
+                (run_id, suggestion_id),
+            ).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+
+def create_history_store(
+    history_dir: Path, backend: str = "journal"
+) -> Union[RunJournal, SQLiteHistoryStore]:
+    """
+    History backend for a history directory.
+
+    Args:
+        history_dir: AutonomousConfig.get_history_path()
+        backend: "journal" (JSONL files + index.json) or "sqlite" (history.db)
+
+    Raises:
+        ValueError: If backend is unknown
+    """
+    if backend == "journal":
+        return RunJournal(history_dir)
+    if backend == "sqlite":
+        return SQLiteHistoryStore(Path(history_dir) / HISTORY_DB)
+    raise ValueError(
+        f"Unknown history backend '{backend}' (expected one of {', '.join(HISTORY_BACKENDS)})"
+    )
@@ -0,0 +1,266 @@
+"""
+Journal - Append-only run history with a summary index.
+
+Rewriting a whole AutonomousRun on every checkpoint costs O(run size), and
+listing runs used to parse every run file. Instead each run is an
+append-only JSONL journal of small events, and the history directory
+keeps a summary index:
+
+    <history_dir>/run_<id>.jsonl   one JSON event per line
+    <history_dir>/index.json       {run id: summary}, replaced atomically
+
+Events:
+    {"type": "run", "data": {...}}         run fields without suggestions
+    {"type": "suggestion", "data": {...}}  full state of one suggestion
+
+Replaying a journal takes the last "run" event and the last event of each
+suggestion, in order of first appearance. A torn final line (crash
+mid-append) is ignored. Finished runs are compacted to one event per
+suggestion.
+
+Usage:
+    >>> journal = RunJournal(config.get_history_path())
+    >>> journal.append(run, [suggestion])   # after each Worker/Judge step
+    >>> journal.list_runs()                 # reads only index.json
+    >>> run = journal.replay(run_id)
+"""
+
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .models import AutonomousRun, Suggestion
+
+logger = logging.getLogger(__name__)
+
+
+INDEX_FILENAME = "index.json"
+
+
+def run_summary(data: Dict[str, Any], filepath: Path) -> Dict[str, Any]:
+    """Index entry for a run, from its JSON dump (with or without suggestions)."""
+    return {
+        "id": data.get("id"),
+        "status": data.get("status"),
+        "target_repo": data.get("target_repo"),
+        "started_at": data.get("started_at"),
+        "completed_at": data.get("completed_at"),
+        "base_commit": data.get("base_commit"),
+        "total": data.get("total_suggestions", 0),
+        "completed": data.get("completed_count", 0),
+        "failed": data.get("failed_count", 0),
+        "filepath": str(filepath),
+    }
+
+
+def _atomic_write(filepath: Path, payload: str) -> None:
+    """Replace filepath with payload (readers never see a partial file)."""
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{filepath.name}.", suffix=".tmp", dir=filepath.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+class RunJournal:
+    """
+    Per-run JSONL journals plus the summary index of a history directory.
+
+    Thread-safe within a process: appends and index updates are serialized.
+    """
+
+    def __init__(self, history_dir: Path):
+        """
+        Initialize the journal.
+
+        Args:
+            history_dir: AutonomousConfig.get_history_path() (created on first write)
+        """
+        self.history_dir = Path(history_dir)
+        self.index_path = self.history_dir / INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._journaled: Dict[str, Set[str]] = {}        # run id -> suggestion ids already written
+        self._summaries: Dict[str, Dict[str, Any]] = {}  # run id -> last indexed summary
+        self._tail_checked: Set[str] = set()             # run ids whose journal ends cleanly
+
+    def journal_path(self, run_id: str) -> Path:
+        """Journal file of a run."""
+        return self.history_dir / f"run_{run_id}.jsonl"
+
+    @staticmethod
+    def _header(run: AutonomousRun) -> Dict[str, Any]:
+        return run.model_dump(mode="json", exclude={"suggestions"})
+
+    @staticmethod
+    def _event(kind: str, data: Dict[str, Any]) -> str:
+        return json.dumps({"type": kind, "data": data}) + "\n"
+
+    # ========== WRITING ==========
+
+    def append(self, run: AutonomousRun, suggestions: Iterable[Suggestion] = ()) -> Path:
+        """
+        Record a checkpoint event.
+
+        Writes the run header, the given suggestions, and any suggestion of
+        the run not journaled yet (all of them for a new journal).
+
+        Args:
+            run: Run being checkpointed
+            suggestions: Suggestions whose state changed
+
+        Returns:
+            Journal path
+        """
+        filepath = self.journal_path(run.id)
+        with self._lock:
+            written = self._journaled.get(run.id)
+            if written is None or not filepath.exists():
+                written = self._journaled[run.id] = set()
+
+            changed = {s.id: s for s in suggestions}
+            for suggestion in run.suggestions:
+                if suggestion.id not in written:
+                    changed.setdefault(suggestion.id, suggestion)
+
+            header = self._header(run)
+            lines = [self._event("suggestion", s.model_dump(mode="json")) for s in changed.values()]
+            lines.append(self._event("run", header))
+
+            if run.id not in self._tail_checked:
+                if self._torn(filepath):
+                    # Terminate a torn final line so new events stay parseable
+                    lines.insert(0, "\n")
+                self._tail_checked.add(run.id)
+
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            with open(filepath, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+            written.update(changed)
+
+            self._update_index(run_summary(header, filepath))
+        return filepath
+
+    @staticmethod
+    def _torn(filepath: Path) -> bool:
+        """Whether a journal's last append was cut off before its newline."""
+        try:
+            with open(filepath, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b"\n"
+        except FileNotFoundError:
+            return False
+
+    def compact(self, run: AutonomousRun) -> Path:
+        """
+        Rewrite a run's journal as one event per suggestion plus the header.
+
+        Args:
+            run: Complete run state
+
+        Returns:
+            Journal path
+        """
+        filepath = self.journal_path(run.id)
+        with self._lock:
+            header = self._header(run)
+            lines = [self._event("suggestion", s.model_dump(mode="json")) for s in run.suggestions]
+            lines.append(self._event("run", header))
+            _atomic_write(filepath, "".join(lines))
+            self._journaled[run.id] = {s.id for s in run.suggestions}
+            self._tail_checked.add(run.id)
+            self._update_index(run_summary(header, filepath))
+        return filepath
+
+    def _update_index(self, summary: Dict[str, Any]) -> None:
+        """Store a summary in the index if it changed (caller holds _lock)."""
+        if self._summaries.get(summary["id"]) == summary:
+            return
+        index = self._read_index()
+        index[summary["id"]] = summary
+        _atomic_write(self.index_path, json.dumps(index, indent=2))
+        self._summaries[summary["id"]] = summary
+
+    def add_to_index(self, summaries: Iterable[Dict[str, Any]]) -> None:
+        """Add summaries of runs stored elsewhere (e.g. legacy JSON files)."""
+        with self._lock:
+            index = self._read_index()
+            for summary in summaries:
+                index[summary["id"]] = summary
+            _atomic_write(self.index_path, json.dumps(index, indent=2))
+
+    # ========== READING ==========
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring corrupt run index {self.index_path}: {e}")
+            return {}
+
+    def list_runs(self) -> List[Dict[str, Any]]:
+        """
+        Run summaries from the index, newest first.
+
+        Returns:
+            Summaries (id, status, target_repo, started_at, counts, filepath)
+        """
+        runs = list(self._read_index().values())
+        runs.sort(key=lambda r: r.get("started_at") or "", reverse=True)
+        return runs
+
+    def replay(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild a run's latest state from its journal.
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            Run data as saved by AutonomousRun.model_dump(mode="json"), or
+            None if the run has no journal
+        """
+        filepath = self.journal_path(run_id)
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return None
+
+        header: Optional[Dict[str, Any]] = None
+        suggestions: Dict[str, Dict[str, Any]] = {}   # insertion order = first appearance
+        for number, line in enumerate(lines, 1):
+            try:
+                event = json.loads(line)
+            except ValueError:
+                if number == len(lines):
+                    break  # Torn final append
+                logger.warning(f"Skipping corrupt event at {filepath}:{number}")
+                continue
+            data = event.get("data", {})
+            if event.get("type") == "run":
+                header = data
+            elif event.get("type") == "suggestion":
+                suggestions[data["id"]] = data
+
+        if header is None:
+            return None
+        with self._lock:
+            self._journaled[run_id] = set(suggestions)
+        return {**header, "suggestions": list(suggestions.values())}
@@ -33,6 +33,17 @@ class SuggestionCategory(str, Enum):
     FEATURE = "feature"
 
 
+class IterationRecord(BaseModel):
+    """Timing and cost of one worker-judge iteration."""
+    iteration: int
+    started_at: datetime = Field(default_factory=datetime.utcnow)
+    worker_seconds: float = Field(default=0.0, description="OpenHands execution time")
+    judge_seconds: float = Field(default=0.0, description="Judge verification time")
+    cost: float = Field(default=0.0, description="Worker LLM cost reported by OpenHands")
+    prompt_tokens: int = Field(default=0)
+    completion_tokens: int = Field(default=0)
+
+
 class Suggestion(BaseModel):
     """A code improvement suggestion generated by the Planner."""
     id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
@@ -51,6 +62,12 @@ class Suggestion(BaseModel):
     files_changed: List[str] = Field(default_factory=list)
     implementation_notes: str = Field(default="")
     iterations: int = Field(default=0, description="Number of worker-judge iterations")
+    last_verdict: Optional["Verdict"] = Field(
+        default=None, description="Most recent judge verdict (resume point)"
+    )
+    iteration_log: List[IterationRecord] = Field(
+        default_factory=list, description="Per-iteration timings and costs"
+    )
 
     class Config:
         use_enum_values = True
@@ -72,6 +89,7 @@ class Verdict(BaseModel):
     criteria_met: List[str] = Field(default_factory=list, description="Which acceptance criteria passed")
     criteria_failed: List[str] = Field(default_factory=list, description="Which acceptance criteria failed")
     suggested_fixes: List[str] = Field(default_factory=list, description="Specific fixes to try")
+    iteration: int = Field(default=0, description="Worker-judge iteration this verdict judged")
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     class Config:
@@ -111,6 +129,9 @@ class AutonomousRun(BaseModel):
     # Config snapshot
     model: str = Field(default="qwen2.5-coder:latest")
     max_iterations: int = Field(default=3)
+    base_commit: Optional[str] = Field(
+        default=None, description="HEAD of target repo when the run was created"
+    )
     
     class Config:
         use_enum_values = True
@@ -125,3 +146,7 @@ class AutonomousRun(BaseModel):
         """Move to next suggestion. Returns False if no more suggestions."""
         self.current_suggestion_index += 1
         return self.current_suggestion_index < len(self.suggestions)
+
+
+# Suggestion.last_verdict refers to Verdict, defined after Suggestion
+Suggestion.model_rebuild()
@@ -0,0 +1,243 @@
+"""
+Pipeline - Overlap Worker and Judge stages across suggestions.
+
+Run sequentially, the Worker (OpenHands) sits idle while the Judge LLM
+evaluates a suggestion, and vice versa. SuggestionPipeline runs each stage
+on its own thread:
+
+    submit() → [ready list] → WORKER thread → [judge queue] → JUDGE thread
+                    ↑                                            │
+                    └──────────── retry (failed verdict) ────────┘
+
+The judge queue is bounded (queue_size), so the Worker cannot run far
+ahead of the Judge. A suggestion holds its file footprint (affected_files,
+widened by the files it actually changed) from the start of its first
+implementation until its final verdict; suggestions whose files overlap a
+held set wait, so the Worker never edits files the Judge is reading or
+that an unfinished suggestion may still retry. Suggestions without a
+known footprint run exclusively. A budget rejection in either stage stops
+the pipeline and is kept in error for the caller to raise.
+
+Usage:
+    >>> pipeline = SuggestionPipeline(runner, on_finished=record)
+    >>> pipeline.start()
+    >>> for suggestion in accepted:
+    ...     pipeline.submit(suggestion)
+    >>> pipeline.close()
+    >>> pipeline.join()
+"""
+
+import contextvars
+import logging
+import queue
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from ..llm.router import BudgetExceededError
+from .models import Suggestion, SuggestionStatus
+from .scheduler import files_conflict, suggestion_files
+
+if TYPE_CHECKING:
+    from .autonomous_runner import AutonomousRunner
+
+logger = logging.getLogger(__name__)
+
+
+_DONE = None  # Judge-queue sentinel
+
+
+class SuggestionPipeline:
+    """Two-stage Worker → Judge pipeline with file-overlap dependency tracking."""
+
+    def __init__(
+        self,
+        runner: "AutonomousRunner",
+        queue_size: int = 2,
+        on_finished: Optional[Callable[[Suggestion, bool], None]] = None
+    ):
+        """
+        Initialize the pipeline (threads start with start()).
+
+        Args:
+            runner: Runner providing implement_suggestion, judge_implementation,
+                _apply_verdict and _publish_queue_depth
+            queue_size: Implementations that may wait for the Judge
+            on_finished: Callback(suggestion, success) after the final verdict,
+                called on the Judge thread
+        """
+        self.runner = runner
+        self.on_finished = on_finished
+        self._judge_queue: "queue.Queue[Optional[Tuple[Suggestion, str, int]]]" = queue.Queue(
+            maxsize=max(1, queue_size)
+        )
+        self._cond = threading.Condition()
+        self._pending: List[Suggestion] = []        # submitted, not yet started
+        self._retries: Deque[Suggestion] = deque()  # failed verdicts awaiting another attempt
+        self._held: Dict[str, Set[str]] = {}        # id -> files held until the final verdict
+        self._attempts: Dict[str, int] = {}
+        self._unfinished = 0
+        self._closed = False
+        self._stopped = False
+        self._threads: List[threading.Thread] = []
+        # First budget rejection; it stops the pipeline like stop()
+        self.error: Optional[BudgetExceededError] = None
+
+    # ========== CONTROL ==========
+
+    def start(self) -> "SuggestionPipeline":
+        """Start the Worker and Judge threads."""
+        for name, loop in (("worker", self._worker_loop), ("judge", self._judge_loop)):
+            # Copy context so stage spans nest under the caller's span
+            thread = threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(loop,),
+                name=f"pipeline-{name}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def submit(self, suggestion: Suggestion) -> None:
+        """Queue a suggestion for implementation."""
+        with self._cond:
+            if self._stopped:
+                return  # Left ACCEPTED for a resumed run
+            if self._closed:
+                raise RuntimeError("Pipeline is closed")
+            self._pending.append(suggestion)
+            # Resumed suggestions continue after their last verdict
+            self._attempts[suggestion.id] = self.runner._first_iteration(suggestion) - 1
+            self._unfinished += 1
+            self._publish_depths()
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """No more submissions; threads exit once every suggestion has its final verdict."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stop(self) -> None:
+        """Abandon suggestions that have not started; in-flight stages finish."""
+        with self._cond:
+            self._stopped = True
+            self._closed = True
+            self._cond.notify_all()
+
+    def join(self) -> None:
+        """Wait for both stage threads to exit (check error afterwards)."""
+        for thread in self._threads:
+            thread.join()
+
+    # ========== SCHEDULING ==========
+
+    def _blocked(self, suggestion: Suggestion) -> bool:
+        """Whether suggestion overlaps files held by an unfinished suggestion."""
+        files = suggestion_files(suggestion)
+        return any(files_conflict(files, held) for held in self._held.values())
+
+    def _next_ready(self) -> Optional[Suggestion]:
+        """Next suggestion the Worker may start (caller holds _cond)."""
+        if self._retries:
+            return self._retries.popleft()  # Already holds its files
+        for i, suggestion in enumerate(self._pending):
+            if not self._blocked(suggestion):
+                del self._pending[i]
+                self._held[suggestion.id] = suggestion_files(suggestion)
+                return suggestion
+        return None
+
+    def _publish_depths(self) -> None:
+        """Report ready-list and judge-queue depths to the runner's metrics."""
+        self.runner._publish_queue_depth("pipeline_ready", len(self._pending) + len(self._retries))
+        self.runner._publish_queue_depth("pipeline_judge", self._judge_queue.qsize())
+
+    def _reject(self, error: BudgetExceededError) -> None:
+        """Stop on a budget rejection; the suggestion is left unfinished (resumable)."""
+        with self._cond:
+            if self.error is None:
+                self.error = error
+            self._stopped = True
+            self._closed = True
+            self._cond.notify_all()
+
+    def _finish(self, suggestion: Suggestion, success: bool) -> None:
+        with self._cond:
+            self._held.pop(suggestion.id, None)
+            self._unfinished -= 1
+            self._cond.notify_all()
+        if self.on_finished:
+            self.on_finished(suggestion, success)
+
+    # ========== STAGES ==========
+
+    def _worker_loop(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    suggestion = None
+                    while not self._stopped:
+                        suggestion = self._next_ready()
+                        if suggestion is not None or (self._closed and self._unfinished == 0):
+                            break
+                        self._cond.wait()
+                    if suggestion is None:
+                        return
+                    attempt = self._attempts.get(suggestion.id, 0) + 1
+                    self._attempts[suggestion.id] = attempt
+                    self._publish_depths()
+
+                suggestion.iterations = attempt
+                try:
+                    logs = self.runner.implement_suggestion(suggestion)
+                except BudgetExceededError as e:
+                    self._reject(e)
+                    continue
+                except Exception as e:
+                    logger.warning(f"Implementation of '{suggestion.title}' failed: {e}")
+                    suggestion.status = SuggestionStatus.FAILED
+                    suggestion.implementation_notes = f"Error: {e}"
+                    self._finish(suggestion, False)
+                    continue
+
+                with self._cond:
+                    # Hold what was actually edited, not just what was predicted
+                    if suggestion.id in self._held and self._held[suggestion.id]:
+                        self._held[suggestion.id] |= suggestion_files(suggestion)
+
+                # Blocks while queue_size implementations already await the Judge
+                self._judge_queue.put((suggestion, logs, attempt))
+                self._publish_depths()
+        finally:
+            self._judge_queue.put(_DONE)
+
+    def _judge_loop(self) -> None:
+        while True:
+            item = self._judge_queue.get()
+            if item is _DONE:
+                return
+            self._publish_depths()
+            suggestion, logs, attempt = item
+            try:
+                verdict = self.runner.judge_implementation(suggestion, logs)
+                outcome = self.runner._apply_verdict(suggestion, verdict, attempt)
+            except BudgetExceededError as e:
+                self._reject(e)
+                continue
+            except Exception as e:
+                logger.warning(f"Judging '{suggestion.title}' failed: {e}")
+                suggestion.status = SuggestionStatus.FAILED
+                suggestion.implementation_notes = f"Error: {e}"
+                outcome = False
+
+            if outcome is None:
+                with self._cond:
+                    if not self._stopped:
+                        self._retries.append(suggestion)
+                        self._publish_depths()
+                        self._cond.notify_all()
+                        continue
+                outcome = False
+            self._finish(suggestion, outcome)
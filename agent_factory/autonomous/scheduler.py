@@ -0,0 +1,200 @@
+"""
+Scheduler - File-conflict-aware ordering of suggestions.
+
+Two suggestions conflict when their file footprints overlap. A footprint
+is the suggestion's affected_files plus the files_changed recorded by
+earlier attempts. A suggestion with an empty footprint may touch
+anything, so it conflicts with every other suggestion.
+
+The conflict graph is coloured greedily (Welsh-Powell). Vertices are
+visited by priority, then by number of conflicts, then by estimated cost,
+and each takes the lowest colour none of its neighbours uses. Each colour
+is a batch of suggestions that are safe to run at the same time. Batches
+come out in colour order, so the highest-priority suggestion is always in
+the first batch.
+
+ConflictScheduler dispatches dynamically instead of batch-by-batch. A
+suggestion may start once every conflicting suggestion in an earlier
+batch has finished, so one slow suggestion only delays its own neighbours.
+
+Usage:
+    >>> for batch in schedule_batches(suggestions):
+    ...     run_concurrently(batch)
+    >>> scheduler = ConflictScheduler(suggestions)
+    >>> while (suggestion := scheduler.next_ready()) is not None:
+    ...     start(suggestion)  # call scheduler.mark_done(suggestion) when it finishes
+"""
+
+import posixpath
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+from .models import Suggestion
+
+
+def normalize_path(path: str) -> str:
+    """Comparable form of a repository-relative path."""
+    path = posixpath.normpath(path.replace("\\", "/"))
+    return path[2:] if path.startswith("./") else path
+
+
+def suggestion_files(suggestion: Suggestion) -> Set[str]:
+    """Known file footprint: affected_files plus files actually changed so far."""
+    return {
+        normalize_path(path)
+        for path in [*suggestion.affected_files, *suggestion.files_changed]
+        if path
+    }
+
+
+def files_conflict(left: Set[str], right: Set[str]) -> bool:
+    """Whether two footprints may touch the same file (empty = unknown = everything)."""
+    return not left or not right or bool(left & right)
+
+
+def estimate_cost(suggestion: Suggestion) -> float:
+    """
+    Rough relative cost of implementing a suggestion.
+
+    More files, more acceptance criteria and longer descriptions mean
+    longer Worker runs and more Judge iterations.
+    """
+    files = len(suggestion_files(suggestion)) or 1
+    return files + 0.5 * len(suggestion.acceptance_criteria) + len(suggestion.description) / 1000
+
+
+def build_conflict_graph(suggestions: Sequence[Suggestion]) -> Dict[str, Set[str]]:
+    """
+    Adjacency sets keyed by suggestion id.
+
+    Returns:
+        {suggestion_id: ids of suggestions sharing a file with it}
+    """
+    footprints = {s.id: suggestion_files(s) for s in suggestions}
+    graph: Dict[str, Set[str]] = {s.id: set() for s in suggestions}
+
+    # Index files so only suggestions sharing a file are compared
+    by_file: Dict[str, List[str]] = {}
+    unknown: List[str] = []
+    for suggestion in suggestions:
+        files = footprints[suggestion.id]
+        if not files:
+            unknown.append(suggestion.id)
+        for path in files:
+            by_file.setdefault(path, []).append(suggestion.id)
+
+    for ids in by_file.values():
+        for i, left in enumerate(ids):
+            for right in ids[i + 1:]:
+                graph[left].add(right)
+                graph[right].add(left)
+    for left in unknown:
+        for right in graph:
+            if right != left:
+                graph[left].add(right)
+                graph[right].add(left)
+    return graph
+
+
+def schedule_batches(
+    suggestions: Sequence[Suggestion],
+    max_batch_size: Optional[int] = None,
+    cost: Callable[[Suggestion], float] = estimate_cost
+) -> List[List[Suggestion]]:
+    """
+    Colour the conflict graph into batches of mutually non-conflicting suggestions.
+
+    Args:
+        suggestions: Suggestions to schedule
+        max_batch_size: Optional cap on batch size (e.g. the number of workers)
+        cost: Cost estimate; within a batch, costlier suggestions come first
+            so the longest ones start earliest
+
+    Returns:
+        Batches in execution order
+    """
+    graph = build_conflict_graph(suggestions)
+    costs = {s.id: cost(s) for s in suggestions}
+    order = sorted(
+        suggestions,
+        key=lambda s: (-s.priority, -len(graph[s.id]), -costs[s.id]),
+    )
+
+    colours: Dict[str, int] = {}
+    batches: List[List[Suggestion]] = []
+    for suggestion in order:
+        taken = {colours[n] for n in graph[suggestion.id] if n in colours}
+        colour = 0
+        while colour in taken or (
+            max_batch_size and colour < len(batches) and len(batches[colour]) >= max_batch_size
+        ):
+            colour += 1
+        if colour == len(batches):
+            batches.append([])
+        colours[suggestion.id] = colour
+        batches[colour].append(suggestion)
+
+    for batch in batches:
+        batch.sort(key=lambda s: (-costs[s.id], -s.priority))
+    return batches
+
+
+class ConflictScheduler:
+    """
+    Dynamic dispatcher over schedule_batches().
+
+    A suggestion is ready once every conflicting suggestion in an earlier
+    batch is done. Same-batch suggestions never conflict, so ready
+    suggestions are always safe to run alongside the running ones.
+    """
+
+    def __init__(
+        self,
+        suggestions: Sequence[Suggestion],
+        cost: Callable[[Suggestion], float] = estimate_cost
+    ):
+        """
+        Args:
+            suggestions: Suggestions to dispatch
+            cost: Cost estimate used to order each batch
+        """
+        self.graph = build_conflict_graph(suggestions)
+        self.batches = schedule_batches(suggestions, cost=cost)
+        self._rank: Dict[str, int] = {}
+        self._queue: List[Suggestion] = []
+        for rank, batch in enumerate(self.batches):
+            for suggestion in batch:
+                self._rank[suggestion.id] = rank
+                self._queue.append(suggestion)
+        self._started: Set[str] = set()
+        self._done: Set[str] = set()
+
+    @property
+    def finished(self) -> bool:
+        """Whether every suggestion has been marked done."""
+        return len(self._done) == len(self._rank)
+
+    def _ready(self, suggestion: Suggestion) -> bool:
+        rank = self._rank[suggestion.id]
+        return all(
+            neighbour in self._done
+            for neighbour in self.graph[suggestion.id]
+            if self._rank[neighbour] < rank
+        )
+
+    def next_ready(self) -> Optional[Suggestion]:
+        """
+        Start the next ready suggestion in batch order.
+
+        Returns:
+            The suggestion, or None if nothing can start until a running one finishes
+        """
+        for i, suggestion in enumerate(self._queue):
+            if self._ready(suggestion):
+                del self._queue[i]
+                self._started.add(suggestion.id)
+                return suggestion
+        return None
+
+    def mark_done(self, suggestion: Suggestion) -> None:
+        """Record that a started suggestion finished (passed or failed)."""
+        self._done.add(suggestion.id)
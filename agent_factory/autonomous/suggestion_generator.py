@@ -8,15 +8,36 @@ complex improvement opportunities into actionable suggestions.
 import os
 import json
 import logging
+import heapq
+import itertools
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
-from typing import List, Optional, Generator
+from typing import (
+    TYPE_CHECKING, Dict, List, Optional, Generator, Iterator, Tuple, Callable, Sequence
+)
 from fnmatch import fnmatch
 
 from .models import Suggestion, SuggestionCategory
 from .config import AutonomousConfig
+from .analysis_cache import AnalysisCache, CACHE_DIRNAME, hash_content
+from .git_scope import GitScopeError, changed_files
+from .chunker import Chunk, chunk_budget_chars, chunk_source
+from .dedup import DuplicateFilter, cluster_improvements, merge_cluster
+from ..files import PatternSet, get_file_index
+from ..llm.router import BudgetExceededError, budgeted_completion
+from ..observability.tracing import traced, set_span_attributes
+from ..observability.hooks import HOOKS, FILE_SCAN
+
+if TYPE_CHECKING:
+    from ..llm.budget import BudgetManager
 
 logger = logging.getLogger(__name__)
 
+# Budget tags for analysis calls (see BudgetManager scopes)
+PLANNER_BUDGET_TAGS = ["agent:planner"]
+
 
 # Default fallback suggestions when LLM fails or returns empty
 FALLBACK_SUGGESTIONS = [
@@ -59,6 +80,14 @@ FALLBACK_SUGGESTIONS = [
 ]
 
 
+# Source file extensions considered for analysis
+SOURCE_EXTENSIONS = ('.py', '.ts', '.js', '.tsx', '.jsx')
+
+
+# Bump when ANALYSIS_PROMPTS or the output format change (invalidates the analysis cache)
+PROMPT_VERSION = "2"
+
+
 # Analysis prompts for different improvement categories
 ANALYSIS_PROMPTS = {
     "maintainability": """Analyze the following code for maintainability improvements.
@@ -128,6 +157,65 @@ For each issue found, suggest a specific, actionable improvement.""",
 }
 
 
+ANALYSIS_SYSTEM_PROMPT = """You are an expert code reviewer. Analyze the provided code and \
+output improvement suggestions in JSON format.
+
+Output format (JSON array):
+[
+  {
+    "title": "Short title",
+    "description": "Detailed description of the improvement",
+    "priority": 1-10,
+    "acceptance_criteria": ["Criterion 1", "Criterion 2"],
+    "reasoning": "Why this improvement matters"
+  }
+]
+
+Only output valid JSON, no other text."""
+
+
+COMBINED_SYSTEM_PROMPT = """You are an expert code reviewer. Analyze the provided code for \
+several categories at once and output improvement suggestions grouped by category in JSON format.
+
+Output format (JSON object keyed by category):
+{
+  "<category>": [
+    {
+      "title": "Short title",
+      "description": "Detailed description of the improvement",
+      "priority": 1-10,
+      "acceptance_criteria": ["Criterion 1", "Criterion 2"],
+      "reasoning": "Why this improvement matters"
+    }
+  ]
+}
+
+Only output valid JSON, no other text."""
+
+
+def build_combined_prompt(analysis_types: Sequence[str]) -> str:
+    """
+    Merge the ANALYSIS_PROMPTS for several categories into one prompt.
+    
+    Args:
+        analysis_types: Categories to cover, in output order
+        
+    Returns:
+        Prompt text with one section per category
+    """
+    sections = []
+    for analysis_type in analysis_types:
+        analysis_prompt = ANALYSIS_PROMPTS.get(analysis_type, ANALYSIS_PROMPTS["maintainability"])
+        sections.append(f"## Category: {analysis_type}\n{analysis_prompt}")
+    
+    categories = ", ".join(f'"{t}"' for t in analysis_types)
+    return (
+        "Analyze the following code for each category below.\n\n"
+        + "\n\n".join(sections)
+        + f"\n\nReturn one JSON object whose keys are exactly: {categories}."
+    )
+
+
 class SuggestionGenerator:
     """
     Generates code improvement suggestions using LLM analysis.
@@ -138,15 +226,24 @@ class SuggestionGenerator:
     3. Generate prioritized, actionable suggestions
     """
 
-    def __init__(self, config: AutonomousConfig):
+    def __init__(self, config: AutonomousConfig, budget: Optional["BudgetManager"] = None):
         """
         Initialize the suggestion generator.
         
         Args:
             config: Autonomous configuration with model and analysis settings
+            budget: Optional BudgetManager admitting every analysis call
         """
         self.config = config
+        self.budget = budget
         self._llm = None
+        self._excludes = PatternSet(config.exclude_patterns)
+        self._chunk_chars = chunk_budget_chars(config.num_ctx, config.chunk_tokens)
+        # Bounds concurrent LLM calls across file and chunk thread pools
+        self._llm_slots = threading.BoundedSemaphore(max(1, config.analysis_workers))
+        self.analysis_cache: Optional[AnalysisCache] = None
+        if config.use_analysis_cache:
+            self.analysis_cache = AnalysisCache(config.get_history_path() / CACHE_DIRNAME)
     
     def _get_llm(self):
         """Lazy-load LLM client with Ollama."""
@@ -159,24 +256,36 @@ class SuggestionGenerator:
                 raise ImportError("litellm not installed. Run: pip install litellm")
         return self._llm
     
+    @traced("llm.call")
     def _call_llm(self, prompt: str, system_prompt: str = "") -> str:
         """Call LLM with the given prompt."""
         llm = self._get_llm()
+        set_span_attributes(model=self.config.model, prompt_chars=len(prompt) + len(system_prompt))
         
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
         
-        response = llm.completion(
-            model=f"ollama/{self.config.model}",
-            messages=messages,
-            api_base=self.config.ollama_base_url,
-            num_ctx=self.config.num_ctx,
-        )
+        with self._llm_slots:
+            response = budgeted_completion(
+                self.budget,
+                messages,
+                self.config.model,
+                lambda model: llm.completion(
+                    model=f"ollama/{model}",
+                    messages=messages,
+                    api_base=self.config.ollama_base_url,
+                    num_ctx=self.config.num_ctx,
+                ),
+                tags=PLANNER_BUDGET_TAGS,
+            )
         
-        return response.choices[0].message.content
+        content = response.choices[0].message.content
+        set_span_attributes(response_chars=len(content or ""))
+        return content
     
+    @traced("planner.scan_codebase")
     def scan_codebase(self) -> List[str]:
         """
         Scan the target repository for files to analyze, scoped to target_dir.
@@ -186,32 +295,59 @@ class SuggestionGenerator:
         """
         repo_root = self.config.get_target_path()
         target_dir = self.config.get_target_dir_path()
-        files = []
         
         # Ensure target_dir exists
         if not target_dir.exists():
             logger.warning(f"Target directory {target_dir} does not exist")
             return []
-            
-        # Use extension-based search
-        extensions = ['.py', '.ts', '.js', '.tsx', '.jsx']
         
-        for ext in extensions:
-            for path in target_dir.rglob(f'*{ext}'):
-                if path.is_file():
-                    rel_path = str(path.relative_to(repo_root))
-                    
-                    # Check exclusions
-                    excluded = False
-                    for exclude in self.config.exclude_patterns:
-                        if exclude.rstrip('/*') in rel_path:
-                            excluded = True
-                            break
-                    
-                    if not excluded:
-                        files.append(rel_path)
+        with HOOKS.hook(FILE_SCAN, root=str(target_dir)) as hook_ctx:
+            changed = self._scan_changed_files() if self.config.changed_since else None
+            if changed is not None:
+                files = changed
+            else:
+                # Shared .gitignore-aware index; excluded directories are never entered
+                files = get_file_index(repo_root).list_source_files(
+                    SOURCE_EXTENSIONS,
+                    under=target_dir.relative_to(repo_root).as_posix(),
+                    exclude=self._excludes,
+                )
+            files = sorted(set(files))
+            if hook_ctx is not None:
+                hook_ctx.result = files
+        
+        set_span_attributes(files=len(files))
+        return files
+    
+    def _scan_changed_files(self) -> Optional[List[str]]:
+        """
+        Source files under target_dir changed since config.changed_since.
         
-        return sorted(set(files))
+        Returns:
+            Repo-relative paths, or None if git cannot answer (full scan fallback)
+        """
+        repo_root = self.config.get_target_path()
+        try:
+            changed = changed_files(
+                repo_root,
+                self.config.changed_since,
+                history_dir=self.config.get_history_path(),
+            )
+        except GitScopeError as e:
+            logger.warning(f"Changed-files scan unavailable ({e}), scanning all files")
+            return None
+        
+        scope = self.config.get_target_dir_path().relative_to(repo_root).as_posix()
+        files = []
+        for rel_path in changed:
+            if scope != "." and not (rel_path == scope or rel_path.startswith(scope + "/")):
+                continue
+            if not rel_path.endswith(SOURCE_EXTENSIONS) or self._excludes.excludes(rel_path):
+                continue
+            files.append(rel_path)
+        
+        set_span_attributes(changed_since=self.config.changed_since, changed_files=len(files))
+        return files
     
     def _get_generic_improvements_for_codebase(self, files: List[str]) -> List[dict]:
         """Generate fallback generic improvements if LLM fails."""
@@ -222,91 +358,478 @@ class SuggestionGenerator:
             improvements.append(s)
         return improvements
     
-    def analyze_file(self, file_path: str, analysis_type: str) -> List[dict]:
+    def _read_source(self, file_path: str) -> Optional[str]:
         """
-        Analyze a single file for improvements.
+        Read a file for analysis.
         
-        Args:
-            file_path: Relative path to file (relative to repo root)
-            analysis_type: Type of analysis to perform
-            
         Returns:
-            List of improvement opportunities found
+            File content, or None if missing, unreadable, or over max_file_bytes
         """
-        repo_root = self.config.get_target_path()
-        full_path = repo_root / file_path
+        full_path = self.config.get_target_path() / file_path
         
         if not full_path.exists():
-            return []
-
+            return None
         
         try:
+            # Skip pathological files (generated bundles, data dumps)
+            if full_path.stat().st_size > self.config.max_file_bytes:
+                logger.info(f"Skipping large file: {file_path}")
+                return None
             content = full_path.read_text(encoding='utf-8')
         except Exception as e:
             logger.warning(f"Could not read {file_path}: {e}")
-            return []
+            return None
+        
+        return content
+    
+    def _content_hash(self, chunk: Chunk) -> Optional[str]:
+        """Cache key of a chunk's prompt content, or None without an analysis cache."""
+        if self.analysis_cache is None:
+            return None
+        return hash_content(chunk.context + chunk.text)
+    
+    def _cache_get(self, content_hash: Optional[str], analysis_type: str) -> Optional[List[dict]]:
+        """Cached improvements for unchanged content, or None."""
+        if self.analysis_cache is None or content_hash is None:
+            return None
+        return self.analysis_cache.get(
+            content_hash, analysis_type, self.config.model, PROMPT_VERSION
+        )
+    
+    def _cache_put(
+        self,
+        content_hash: Optional[str],
+        analysis_type: str,
+        improvements: List[dict],
+        file_path: str
+    ) -> None:
+        """Persist a successfully parsed analysis result."""
+        if self.analysis_cache is None or content_hash is None:
+            return
+        self.analysis_cache.put(
+            content_hash, analysis_type, self.config.model, PROMPT_VERSION, improvements, file_path
+        )
+    
+    @staticmethod
+    def _extract_json(response: str):
+        """
+        Parse JSON from an LLM response, unwrapping markdown code blocks.
+        
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON
+        """
+        if "```json" in response:
+            response = response.split("```json")[1].split("```")[0]
+        elif "```" in response:
+            response = response.split("```")[1].split("```")[0]
         
-        # Skip very large files
-        if len(content) > 50000:
-            logger.info(f"Skipping large file: {file_path}")
+        return json.loads(response.strip())
+    
+    @staticmethod
+    def _split_categories(parsed, analysis_types: Sequence[str]) -> dict:
+        """
+        Group a combined-analysis response by category.
+        
+        Accepts the requested {"category": [...]} object, or a flat array
+        whose items carry a "category" field. Only categories the response
+        actually covers are returned (a key with an empty list counts; a
+        flat array only covers categories its items name), so omitted ones
+        can be analyzed separately instead of being taken as clean.
+        
+        Returns:
+            {category: improvements} for the covered requested categories
+        
+        Raises:
+            ValueError: If the response has neither shape
+        """
+        requested = set(analysis_types)
+        grouped: Dict[str, List[dict]] = {}
+        
+        if isinstance(parsed, dict):
+            if not any(key in requested for key in parsed):
+                raise ValueError(f"no known categories in keys {list(parsed)[:5]}")
+            for key, items in parsed.items():
+                if key in requested and isinstance(items, list):
+                    grouped.setdefault(key, []).extend(
+                        item for item in items if isinstance(item, dict)
+                    )
+        elif isinstance(parsed, list):
+            for item in parsed:
+                if isinstance(item, dict) and item.get("category") in requested:
+                    grouped.setdefault(item["category"], []).append(item)
+        else:
+            raise ValueError(f"unexpected response type {type(parsed).__name__}")
+        
+        return grouped
+    
+    def _source_block(self, chunk: Chunk) -> str:
+        """Prompt section presenting a chunk (or whole file) to the LLM."""
+        if chunk.is_whole_file:
+            return f"""File: {chunk.file_path}
+
+```
+{chunk.text}
+```"""
+        context = ""
+        if chunk.context:
+            context = f"""
+Imports (context only, do not analyze):
+```
+{chunk.context}```
+"""
+        return f"""File: {chunk.file_path} ({chunk.describe()})
+{context}
+```
+{chunk.text}
+```"""
+    
+    @staticmethod
+    def _tag_improvements(improvements: List[dict], chunk: Chunk, analysis_type: str) -> List[dict]:
+        """Attach file, category, and (for partial chunks) location to improvements."""
+        for imp in improvements:
+            imp["affected_files"] = [chunk.file_path]
+            imp["category"] = analysis_type
+            if not chunk.is_whole_file:
+                imp["description"] = (
+                    f"{imp.get('description', '')}\n\nLocation: {chunk.file_path} "
+                    f"lines {chunk.start_line}-{chunk.end_line}"
+                ).strip()
+        return improvements
+    
+    @staticmethod
+    def _merge_chunk_results(results: List[List[dict]]) -> List[dict]:
+        """
+        Merge per-chunk improvements, collapsing duplicates.
+        
+        Improvements with the same category and normalized title are merged:
+        the highest priority wins and acceptance criteria are unioned.
+        """
+        merged = {}
+        for improvements in results:
+            for imp in improvements:
+                title = " ".join(str(imp.get("title", "")).lower().split())
+                key = (imp.get("category"), title)
+                existing = merged.get(key)
+                if existing is None:
+                    merged[key] = imp
+                    continue
+                if imp.get("priority", 5) > existing.get("priority", 5):
+                    existing["priority"] = imp["priority"]
+                location = str(imp.get("description", "")).rsplit("\n", 1)[-1]
+                known = existing.get("description", "")
+                if location.startswith("Location:") and location not in known:
+                    existing["description"] = f"{existing.get('description', '')}\n{location}"
+                criteria = existing.setdefault("acceptance_criteria", [])
+                for criterion in imp.get("acceptance_criteria", []):
+                    if criterion not in criteria:
+                        criteria.append(criterion)
+        return list(merged.values())
+    
+    def _analyze_chunks(
+        self,
+        file_path: str,
+        analyze_chunk: Callable[[Chunk], List[dict]]
+    ) -> List[dict]:
+        """
+        Chunk a file and analyze the chunks in parallel.
+        
+        Total concurrent LLM calls stay bounded by analysis_workers (see
+        _call_llm), so nesting this pool inside the file pool is safe.
+        """
+        content = self._read_source(file_path)
+        if content is None:
             return []
         
+        chunks = chunk_source(content, file_path, self._chunk_chars)
+        set_span_attributes(chunks=len(chunks))
+        if len(chunks) == 1:
+            return analyze_chunk(chunks[0])
+        
+        workers = min(len(chunks), max(1, self.config.analysis_workers))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chunk") as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, analyze_chunk, chunk)
+                for chunk in chunks
+            ]
+            results = [future.result() for future in futures]
+        
+        improvements = self._merge_chunk_results(results)
+        set_span_attributes(improvements=len(improvements))
+        return improvements
+    
+    @traced("planner.analyze_file")
+    def analyze_file(self, file_path: str, analysis_type: str) -> List[dict]:
+        """
+        Analyze a single file for improvements.
+        
+        Large files are split into chunks at function/class boundaries
+        and analyzed in parallel; duplicate suggestions are merged.
+        
+        Args:
+            file_path: Relative path to file (relative to repo root)
+            analysis_type: Type of analysis to perform
+            
+        Returns:
+            List of improvement opportunities found
+        """
+        set_span_attributes(file=file_path, analysis_type=analysis_type)
+        return self._analyze_chunks(
+            file_path, lambda chunk: self._analyze_chunk(chunk, analysis_type)
+        )
+    
+    def _analyze_chunk(self, chunk: Chunk, analysis_type: str) -> List[dict]:
+        """Analyze one chunk for a single category."""
+        file_path = chunk.file_path
+        content_hash = self._content_hash(chunk)
+        cached = self._cache_get(content_hash, analysis_type)
+        if cached is not None:
+            set_span_attributes(cache_hit=True, improvements=len(cached))
+            return self._tag_improvements(cached, chunk, analysis_type)
+        
         # Get analysis prompt
         analysis_prompt = ANALYSIS_PROMPTS.get(analysis_type, ANALYSIS_PROMPTS["maintainability"])
         
-        system_prompt = """You are an expert code reviewer. Analyze the provided code and output improvement suggestions in JSON format.
-
-Output format (JSON array):
-[
-  {
-    "title": "Short title",
-    "description": "Detailed description of the improvement",
-    "priority": 1-10,
-    "acceptance_criteria": ["Criterion 1", "Criterion 2"],
-    "reasoning": "Why this improvement matters"
-  }
-]
-
-Only output valid JSON, no other text."""
-
         prompt = f"""{analysis_prompt}
 
-File: {file_path}
-
-```
-{content[:20000]}
-```
+{self._source_block(chunk)}
 
 IMPORTANT: You MUST provide at least 1 improvement suggestion. Even if the code looks good, suggest documentation improvements, type hints, or potential edge cases. Never return an empty array.
 
 Provide your analysis as a JSON array of improvements."""
 
         try:
-            response = self._call_llm(prompt, system_prompt)
-            
-            # Parse JSON from response
-            # Handle markdown code blocks
-            if "```json" in response:
-                response = response.split("```json")[1].split("```")[0]
-            elif "```" in response:
-                response = response.split("```")[1].split("```")[0]
-            
-            improvements = json.loads(response.strip())
+            response = self._call_llm(prompt, ANALYSIS_SYSTEM_PROMPT)
+            improvements = self._extract_json(response)
+            self._cache_put(content_hash, analysis_type, improvements, file_path)
             
             # Add file path to each improvement
-            for imp in improvements:
-                imp["affected_files"] = [file_path]
-                imp["category"] = analysis_type
+            self._tag_improvements(improvements, chunk, analysis_type)
             
+            set_span_attributes(improvements=len(improvements))
             return improvements
             
         except json.JSONDecodeError as e:
             logger.warning(f"Could not parse LLM response for {file_path}: {e}")
             return []
+        except BudgetExceededError:
+            raise
         except Exception as e:
             logger.warning(f"Error analyzing {file_path}: {e}")
             return []
     
+    @traced("planner.analyze_file")
+    def analyze_file_combined(self, file_path: str, analysis_types: Sequence[str]) -> List[dict]:
+        """
+        Analyze a file for several categories with a single LLM call per chunk.
+        
+        The file is sent once with a prompt merged from ANALYSIS_PROMPTS and
+        the categorized response is split back per category. Falls back to
+        one call per category only if the response cannot be parsed.
+        
+        Args:
+            file_path: Relative path to file (relative to repo root)
+            analysis_types: Types of analysis to perform
+            
+        Returns:
+            List of improvement opportunities found, each tagged with its category
+        """
+        set_span_attributes(
+            file=file_path, analysis_type="combined", categories=len(analysis_types)
+        )
+        return self._analyze_chunks(
+            file_path, lambda chunk: self._analyze_chunk_combined(chunk, analysis_types)
+        )
+    
+    def _analyze_chunk_combined(self, chunk: Chunk, analysis_types: Sequence[str]) -> List[dict]:
+        """Analyze one chunk for several categories at once."""
+        file_path = chunk.file_path
+        
+        # Serve unchanged categories from the cache; only analyze the rest
+        content_hash = self._content_hash(chunk)
+        improvements = []
+        missing = []
+        for analysis_type in analysis_types:
+            cached = self._cache_get(content_hash, analysis_type)
+            if cached is None:
+                missing.append(analysis_type)
+                continue
+            improvements.extend(self._tag_improvements(cached, chunk, analysis_type))
+        
+        set_span_attributes(cache_hits=len(analysis_types) - len(missing))
+        if not missing:
+            return improvements
+        if len(missing) == 1:
+            return improvements + self._analyze_chunk(chunk, missing[0])
+        analysis_types = missing
+        
+        prompt = f"""{build_combined_prompt(analysis_types)}
+
+{self._source_block(chunk)}
+
+IMPORTANT: You MUST provide at least 1 improvement suggestion overall. Even if the code \
+looks good, suggest documentation improvements, type hints, or potential edge cases.
+
+Provide your analysis as a JSON object keyed by category."""
+
+        try:
+            response = self._call_llm(prompt, COMBINED_SYSTEM_PROMPT)
+            grouped = self._split_categories(self._extract_json(response), analysis_types)
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.info(
+                f"Combined analysis unparseable for {file_path} ({e}), falling back to per-category"
+            )
+            set_span_attributes(fallback=True)
+            for analysis_type in analysis_types:
+                improvements.extend(self._analyze_chunk(chunk, analysis_type))
+            return improvements
+        except BudgetExceededError:
+            raise
+        except Exception as e:
+            logger.warning(f"Error analyzing {file_path}: {e}")
+            return improvements
+        
+        for analysis_type in analysis_types:
+            if analysis_type not in grouped:
+                # Left out of the combined response: ask separately rather than cache it as clean
+                improvements.extend(self._analyze_chunk(chunk, analysis_type))
+                continue
+            items = grouped[analysis_type]
+            self._cache_put(content_hash, analysis_type, items, file_path)
+            improvements.extend(self._tag_improvements(items, chunk, analysis_type))
+        
+        set_span_attributes(improvements=len(improvements))
+        return improvements
+    
+    def _analyze_job(self, file_path: str, analysis_types: Tuple[str, ...]) -> List[dict]:
+        """Run one analysis job: a single category, or several combined."""
+        if len(analysis_types) == 1:
+            return self.analyze_file(file_path, analysis_types[0])
+        return self.analyze_file_combined(file_path, analysis_types)
+    
+    def _enough_improvements(self, improvements: List[dict], max_suggestions: int) -> bool:
+        """Early-termination check: enough candidates, or enough high-priority ones."""
+        if len(improvements) >= max_suggestions * 2:
+            return True
+        threshold = self.config.high_priority_threshold
+        high_priority = sum(1 for imp in improvements if imp.get("priority", 5) >= threshold)
+        return high_priority >= max_suggestions
+    
+    def _iter_analysis_jobs(
+        self,
+        jobs: List[Tuple[str, Tuple[str, ...]]],
+        max_suggestions: int,
+        on_file_analyzed: Optional[Callable] = None
+    ) -> Iterator[Tuple[int, List[dict]]]:
+        """
+        Run (file, analysis_types) jobs on a thread pool, yielding results as they complete.
+        
+        At most analysis_workers jobs are in flight, so early termination
+        (or the caller closing the iterator) leaves no backlog of queued
+        LLM calls.
+        
+        Args:
+            jobs: (file_path, analysis_types) pairs to analyze
+            max_suggestions: Target suggestion count for early termination
+            on_file_analyzed: Callback(file_path, suggestions_count) per finished job
+            
+        Yields:
+            (job_index, improvements) in completion order
+        """
+        workers = max(1, self.config.analysis_workers)
+        collected: List[dict] = []
+        pending = {}
+        next_job = 0
+        
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analysis")
+        try:
+            while next_job < len(jobs) or pending:
+                # Keep the pool full without queueing the whole backlog
+                while next_job < len(jobs) and len(pending) < workers:
+                    file_path, analysis_types = jobs[next_job]
+                    print(f"[DEBUG] Analyzing {file_path} for {', '.join(analysis_types)}...")
+                    # Copy context so tracing spans nest under the caller's span
+                    future = executor.submit(
+                        contextvars.copy_context().run,
+                        self._analyze_job,
+                        file_path,
+                        analysis_types,
+                    )
+                    pending[future] = next_job
+                    next_job += 1
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=pending.get):
+                    index = pending.pop(future)
+                    file_path = jobs[index][0]
+                    try:
+                        improvements = future.result()
+                    except BudgetExceededError:
+                        raise
+                    except Exception as e:
+                        logger.warning(f"Analysis of {file_path} failed: {e}")
+                        improvements = []
+                    print(f"[DEBUG] Found {len(improvements)} improvements")
+                    collected.extend(improvements)
+                    
+                    if on_file_analyzed:
+                        on_file_analyzed(file_path, len(improvements))
+                    yield index, improvements
+                
+                # Early exit if we have enough
+                if self._enough_improvements(collected, max_suggestions):
+                    break
+        finally:
+            # Drop queued work; in-flight calls finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _run_analysis_jobs(
+        self,
+        jobs: List[Tuple[str, Tuple[str, ...]]],
+        max_suggestions: int,
+        on_file_analyzed: Optional[Callable] = None
+    ) -> List[dict]:
+        """
+        Run all analysis jobs (see _iter_analysis_jobs).
+        
+        Returns:
+            Improvements from all completed jobs, in job order so the later
+            priority sort stays deterministic
+        """
+        results = dict(self._iter_analysis_jobs(jobs, max_suggestions, on_file_analyzed))
+        ordered = []
+        for index in sorted(results):
+            ordered.extend(results[index])
+        return ordered
+    
+    def _build_jobs(self, files: List[str]) -> List[Tuple[str, Tuple[str, ...]]]:
+        """One combined job per file, or one job per (file, analysis type)."""
+        analysis_types = tuple(self.config.analysis_types)
+        if self.config.combined_analysis and len(analysis_types) > 1:
+            return [(file_path, analysis_types) for file_path in files]
+        return [
+            (file_path, (analysis_type,))
+            for file_path in files
+            for analysis_type in analysis_types
+        ]
+    
+    @staticmethod
+    def _to_suggestion(imp: dict) -> Suggestion:
+        """Convert an improvement dict into a Suggestion."""
+        try:
+            category = SuggestionCategory(imp.get("category", "refactoring"))
+        except ValueError:
+            category = SuggestionCategory.REFACTORING
+        
+        return Suggestion(
+            title=imp.get("title", "Untitled improvement"),
+            description=imp.get("description", ""),
+            category=category,
+            priority=imp.get("priority", 5),
+            affected_files=imp.get("affected_files", []),
+            acceptance_criteria=imp.get("acceptance_criteria", []),
+            reasoning=imp.get("reasoning", ""),
+        )
+    
     def generate_suggestions(
         self,
         max_suggestions: Optional[int] = None,
@@ -340,29 +863,29 @@ Provide your analysis as a JSON array of improvements."""
             print("[DEBUG] No files found in target directory, using fallback suggestions")
             all_improvements = self._get_generic_improvements_for_codebase([])
         else:
-            # Analyze files
-            for file_path in files:
-                for analysis_type in self.config.analysis_types:
-                    print(f"[DEBUG] Analyzing {file_path} for {analysis_type}...")
-                    improvements = self.analyze_file(file_path, analysis_type)
-                    print(f"[DEBUG] Found {len(improvements)} improvements")
-                    all_improvements.extend(improvements)
-                    
-                    if on_file_analyzed:
-                        on_file_analyzed(file_path, len(improvements))
-                    
-                    # Early exit if we have enough
-                    if len(all_improvements) >= max_suggestions * 2:
-                        break
-                
-                if len(all_improvements) >= max_suggestions * 2:
-                    break
+            # Analyze files (concurrently when analysis_workers > 1)
+            jobs = self._build_jobs(files)
+            all_improvements = self._run_analysis_jobs(jobs, max_suggestions, on_file_analyzed)
+        
+        if self.analysis_cache is not None and self.config.verbose:
+            stats = self.analysis_cache.get_stats()
+            logger.info(f"Analysis cache: {stats['hits']} hits, {stats['misses']} misses")
         
         # If still no improvements after analysis, use fallback
         if not all_improvements:
             print("[DEBUG] LLM returned no improvements, using fallback suggestions")
             all_improvements = self._get_generic_improvements_for_codebase(files)
         
+        # Collapse near-duplicates so one change isn't queued once per file
+        if len(all_improvements) > 1:
+            raw_count = len(all_improvements)
+            all_improvements = cluster_improvements(
+                all_improvements,
+                threshold=self.config.dedup_threshold,
+                max_files=self.config.dedup_max_files,
+            )
+            logger.debug(f"Merged {raw_count} improvements into {len(all_improvements)}")
+        
         # Sort by priority (descending) and take top N
         all_improvements.sort(key=lambda x: x.get("priority", 5), reverse=True)
         top_improvements = all_improvements[:max_suggestions]
@@ -371,22 +894,94 @@ Provide your analysis as a JSON array of improvements."""
         
         # Convert to Suggestion objects
         for imp in top_improvements:
-            try:
-                category = SuggestionCategory(imp.get("category", "refactoring"))
-            except ValueError:
-                category = SuggestionCategory.REFACTORING
+            yield self._to_suggestion(imp)
+    
+    def stream_suggestions(
+        self,
+        max_suggestions: Optional[int] = None,
+        on_file_analyzed: Optional[callable] = None
+    ) -> Generator[Suggestion, None, None]:
+        """
+        Yield suggestions while analysis is still running.
+        
+        Unlike generate_suggestions, nothing waits for the full scan:
+        improvements with priority >= stream_min_priority are yielded as
+        soon as their file completes. Lower-priority ones are held in a
+        min-heap bounded to the remaining top-K slots and yielded, best
+        first, when analysis ends. Near-duplicates of a yielded suggestion
+        are dropped; near-duplicates of a held one are merged into it.
+        
+        Closing the generator early cancels queued analysis jobs.
+        
+        Args:
+            max_suggestions: Maximum number of suggestions to yield (K)
+            on_file_analyzed: Callback(file_path, suggestions_count) for progress
             
-            suggestion = Suggestion(
-                title=imp.get("title", "Untitled improvement"),
-                description=imp.get("description", ""),
-                category=category,
-                priority=imp.get("priority", 5),
-                affected_files=imp.get("affected_files", []),
-                acceptance_criteria=imp.get("acceptance_criteria", []),
-                reasoning=imp.get("reasoning", ""),
-            )
-            yield suggestion
+        Yields:
+            Suggestion objects, at most max_suggestions
+        """
+        max_suggestions = max_suggestions or self.config.max_suggestions
+        files = self.scan_codebase()
+        logger.debug(f"Streaming suggestions from {len(files)} files")
+        
+        min_priority = self.config.stream_min_priority
+        max_files = self.config.dedup_max_files
+        seen = DuplicateFilter(self.config.dedup_threshold)
+        held: Dict[int, dict] = {}           # key -> improvement not yet yielded
+        heap: List[Tuple[int, int]] = []     # (priority, key), stale entries skipped lazily
+        keys = itertools.count()
+        emitted = 0
+        
+        def trim_held():
+            # Evict the lowest-priority held improvements beyond the free slots
+            while len(held) > max_suggestions - emitted:
+                priority, key = heapq.heappop(heap)
+                if key in held and held[key].get("priority", 5) == priority:
+                    del held[key]
+        
+        analysis = self._iter_analysis_jobs(
+            self._build_jobs(files), max_suggestions, on_file_analyzed
+        )
+        try:
+            for _, improvements in analysis:
+                for imp in improvements:
+                    key = seen.match(imp)
+                    if key is not None:
+                        if key not in held:
+                            continue  # Already yielded (or evicted as low priority)
+                        merged = merge_cluster([held[key], imp])
+                        if len(merged["affected_files"]) > max_files:
+                            key = None
+                        else:
+                            del held[key]
+                            imp = merged
+                    if key is None:
+                        key = next(keys)
+                        seen.add(imp, key)
+                    
+                    if imp.get("priority", 5) >= min_priority:
+                        emitted += 1
+                        yield self._to_suggestion(imp)
+                        if emitted >= max_suggestions:
+                            return
+                    else:
+                        held[key] = imp
+                        heapq.heappush(heap, (imp.get("priority", 5), key))
+                    trim_held()
+        finally:
+            analysis.close()
+        
+        remaining = sorted(held.items(), key=lambda item: (-item[1].get("priority", 5), item[0]))
+        if not remaining and not emitted:
+            logger.debug("LLM returned no improvements, using fallback suggestions")
+            fallback = self._get_generic_improvements_for_codebase(files)
+            fallback.sort(key=lambda x: x.get("priority", 5), reverse=True)
+            remaining = list(enumerate(fallback))
+        
+        for _, imp in remaining[:max_suggestions - emitted]:
+            yield self._to_suggestion(imp)
     
+    @traced("planner.generate_suggestions")
     def generate_suggestions_list(
         self,
         max_suggestions: Optional[int] = None
@@ -0,0 +1,248 @@
+"""
+Verification - Deterministic pre-checks that run before the LLM judge.
+
+A Judge LLM call costs seconds to minutes, and it is wasted when an
+attempt has obviously failed. run_prechecks() rejects those attempts
+first, cheapest check first:
+
+    1. worker result   OpenHands reported a failure
+    2. changed files   the attempt changed nothing
+    3. syntax          a touched Python file no longer compiles
+    4. diff size       the suggestion's diff exceeds max_diff_lines
+    5. commands        configured test/lint commands exit non-zero
+
+A failed report becomes a FAIL verdict (see PrecheckReport.to_verdict),
+which sends the attempt straight back to the Worker with concrete feedback.
+Only attempts passing every check reach the LLM judge.
+
+Usage:
+    >>> report = run_prechecks(workspace, result, base_commit=baseline, commands=["pytest -q"])
+    >>> if not report.passed:
+    ...     verdict = report.to_verdict(suggestion.id)
+"""
+
+import logging
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+from .models import Verdict, VerdictStatus
+from .worktree import WorktreeError, git_toplevel, working_tree_diff
+
+if TYPE_CHECKING:
+    from ..workers.openhands_worker import OpenHandsResult
+
+logger = logging.getLogger(__name__)
+
+
+# Command output kept in feedback (tail, where test runners put the summary)
+OUTPUT_TAIL_CHARS = 2000
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one pre-check."""
+    name: str
+    passed: bool
+    details: str = ""
+
+
+@dataclass
+class PrecheckReport:
+    """Outcome of all pre-checks for one attempt."""
+    checks: List[CheckResult] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return all(check.passed for check in self.checks)
+
+    @property
+    def failures(self) -> List[CheckResult]:
+        return [check for check in self.checks if not check.passed]
+
+    def add(self, name: str, passed: bool, details: str = "") -> bool:
+        self.checks.append(CheckResult(name, passed, details))
+        return passed
+
+    def summary(self) -> str:
+        """One line per check, for logs and the judge prompt."""
+        return "\n".join(
+            f"[{'ok' if check.passed else 'FAIL'}] {check.name}"
+            + (f": {check.details}" if check.details else "")
+            for check in self.checks
+        )
+
+    def to_verdict(self, suggestion_id: str) -> Verdict:
+        """FAIL verdict carrying the failed checks as feedback for the Worker."""
+        failures = self.failures
+        return Verdict(
+            suggestion_id=suggestion_id,
+            status=VerdictStatus.FAIL,
+            score=0.0,
+            feedback="Static verification failed before review:\n" + "\n".join(
+                f"- {check.name}: {check.details}" for check in failures
+            ),
+            criteria_met=[check.name for check in self.checks if check.passed],
+            criteria_failed=[check.name for check in failures],
+            suggested_fixes=[check.details for check in failures if check.details],
+        )
+
+
+def _resolve(workspace: Path, path: str) -> Path:
+    return Path(path) if Path(path).is_absolute() else workspace / path
+
+
+def check_python_syntax(files: Sequence[Path]) -> List[str]:
+    """
+    Compile touched Python files without writing bytecode.
+
+    Returns:
+        "path:line: message" for each file that does not compile
+    """
+    errors = []
+    for path in files:
+        if path.suffix != ".py" or not path.is_file():
+            continue
+        try:
+            compile(path.read_bytes(), str(path), "exec", dont_inherit=True)
+        except SyntaxError as e:
+            errors.append(f"{path}:{e.lineno}: {e.msg}")
+        except (ValueError, OSError) as e:
+            errors.append(f"{path}: {e}")
+    return errors
+
+
+def diff_line_count(
+    workspace: Path,
+    base_commit: str,
+    files: Sequence[Path],
+    exclude: Sequence[str] = ()
+) -> int:
+    """
+    Lines added plus removed in files since base_commit.
+
+    Raises:
+        WorktreeError: If the workspace is not a git checkout or git fails
+    """
+    toplevel = git_toplevel(workspace)
+    paths = []
+    for path in files:
+        try:
+            paths.append(path.resolve().relative_to(toplevel).as_posix())
+        except ValueError:
+            continue  # Outside the checkout
+    if not paths:
+        return 0
+    numstat = working_tree_diff(toplevel, base_commit, paths, args=["--numstat"], exclude=exclude)
+    total = 0
+    for line in numstat.splitlines():
+        added, removed = line.split("\t")[:2]
+        if added != "-":  # Binary files have no line counts
+            total += int(added) + int(removed)
+    return total
+
+
+def run_command(command: str, cwd: Path, timeout: int) -> Optional[str]:
+    """
+    Run a shell command in cwd.
+
+    Returns:
+        None if it exited 0, otherwise the tail of its output
+    """
+    try:
+        result = subprocess.run(
+            command, shell=True, cwd=cwd, capture_output=True, text=True,
+            errors="replace", timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return f"timed out after {timeout}s"
+    except OSError as e:
+        return str(e)
+    if result.returncode == 0:
+        return None
+    output = (result.stdout + result.stderr).strip()
+    return f"exit code {result.returncode}\n{output[-OUTPUT_TAIL_CHARS:]}"
+
+
+def check_commands(
+    report: PrecheckReport, commands: Sequence[str], cwd: Path, timeout: int
+) -> bool:
+    """
+    Run commands in cwd, adding one check per command.
+
+    Returns:
+        True if every command exited 0 (stops at the first failure)
+    """
+    for command in commands:
+        failure = run_command(command, cwd, timeout)
+        if not report.add(f"command `{command}`", failure is None, failure or ""):
+            return False
+    return True
+
+
+def run_prechecks(
+    workspace: Path,
+    result: Optional["OpenHandsResult"] = None,
+    base_commit: Optional[str] = None,
+    commands: Sequence[str] = (),
+    max_diff_lines: Optional[int] = None,
+    command_timeout: int = 300,
+    exclude: Sequence[str] = ()
+) -> PrecheckReport:
+    """
+    Check an attempt before it is sent to the LLM judge.
+
+    Stops at the first failing stage, so commands only run on attempts
+    that changed files and still compile.
+
+    Args:
+        workspace: Directory the Worker edited
+        result: The Worker's result for this attempt (None skips the
+            result and changed-files checks)
+        base_commit: Snapshot of the workspace before the suggestion's first
+            attempt (None skips the diff-size check)
+        commands: Shell commands that must exit 0, run in workspace
+        max_diff_lines: Largest allowed diff, added plus removed lines (None = no cap)
+        command_timeout: Seconds allowed per command
+        exclude: Top-level-relative paths left out of diff snapshots
+
+    Returns:
+        PrecheckReport (report.passed tells whether the judge should run)
+    """
+    workspace = Path(workspace)
+    report = PrecheckReport()
+
+    files: List[Path] = []
+    if result is not None:
+        details = "" if result.success else result.message
+        if not report.add("worker result", result.success, details):
+            return report
+        files = [_resolve(workspace, path) for path in result.files_changed]
+        if not report.add(
+            "changed files",
+            bool(files),
+            f"{len(files)} file(s)" if files else "the attempt did not modify any file",
+        ):
+            return report
+
+    errors = check_python_syntax(files)
+    if not report.add("python syntax", not errors, "; ".join(errors)):
+        return report
+
+    if base_commit and max_diff_lines:
+        try:
+            lines = diff_line_count(workspace, base_commit, files, exclude=exclude)
+        except WorktreeError as e:
+            logger.debug(f"Skipping diff-size check: {e}")
+        else:
+            if not report.add(
+                "diff size",
+                lines <= max_diff_lines,
+                f"{lines} changed lines"
+                + (f" (limit {max_diff_lines})" if lines > max_diff_lines else ""),
+            ):
+                return report
+
+    check_commands(report, commands, workspace, command_timeout)
+    return report
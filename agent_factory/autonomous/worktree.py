@@ -0,0 +1,315 @@
+"""
+Worktree - Isolated git worktrees for running suggestions in parallel.
+
+Each concurrently running suggestion gets a detached `git worktree` of a
+snapshot of the main checkout (see snapshot_commit), so OpenHands
+instances never edit the same checkout. When a suggestion passes, the
+files it changed are merged back into the main checkout file by file:
+
+    - unchanged in the main checkout since the worktree's base: copied over
+    - changed on both sides: 3-way merged with `git merge-file`
+    - conflicting (or binary changed on both sides): nothing is written and
+      MergeConflict is raised, so a merge is all-or-nothing
+
+The main checkout's index is never touched; merged changes show up as
+ordinary working-tree edits, just like sequential runs.
+
+Usage:
+    >>> base = snapshot_commit(repo)
+    >>> with Worktree.create(repo, name=suggestion.id, base=base) as worktree:
+    ...     run_in(worktree.path)
+    ...     merged = merge_worktree(worktree)
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+# Never carried back from a worktree
+WORKTREE_EXCLUDES = (".openhands",)
+
+# `git worktree add/remove` update shared metadata under .git/worktrees
+_worktree_lock = threading.Lock()
+
+
+class WorktreeError(Exception):
+    """A git worktree operation failed."""
+    pass
+
+
+class MergeConflict(WorktreeError):
+    """Worktree changes do not merge cleanly into the main checkout."""
+
+    def __init__(self, paths: List[str]):
+        self.paths = paths
+        super().__init__(f"Merge conflict in {', '.join(paths)}")
+
+
+def _run(
+    cwd: Path,
+    args: List[str],
+    check: bool = True,
+    timeout: int = 60,
+    env: Optional[Dict[str, str]] = None
+) -> subprocess.CompletedProcess:
+    """Run git in cwd with bytes output."""
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, timeout=timeout, env=env
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise WorktreeError(f"git {args[0]} failed: {e}") from e
+    if check and result.returncode != 0:
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
+        raise WorktreeError(f"git {args[0]} failed: {stderr}")
+    return result
+
+
+def _git(cwd: Path, args: List[str], env: Optional[Dict[str, str]] = None) -> str:
+    """Run git in cwd and return stdout as text."""
+    return _run(cwd, args, env=env).stdout.decode("utf-8", errors="surrogateescape")
+
+
+def git_toplevel(path: Union[str, Path]) -> Path:
+    """Top-level directory of the git checkout containing path."""
+    return Path(_git(Path(path), ["rev-parse", "--show-toplevel"]).strip()).resolve()
+
+
+def snapshot_commit(repo: Union[str, Path], exclude: Sequence[str] = ()) -> str:
+    """
+    Commit capturing the current working tree, including untracked files.
+
+    Uses a scratch index, so HEAD, the real index and refs are untouched;
+    the commit is only reachable from worktrees created on it. Worktrees
+    based on a snapshot see uncommitted changes, including results merged
+    back from earlier suggestions.
+
+    Args:
+        repo: Any path inside the checkout
+        exclude: Top-level-relative paths left out of the snapshot
+
+    Returns:
+        Commit SHA
+    """
+    toplevel = git_toplevel(repo)
+    git_dir = Path(_git(toplevel, ["rev-parse", "--absolute-git-dir"]).strip())
+    with tempfile.TemporaryDirectory(prefix="autonomous-snapshot-") as tmp:
+        index = os.path.join(tmp, "index")
+        if (git_dir / "index").exists():
+            # Start from the real index so only changed files are rehashed
+            shutil.copyfile(git_dir / "index", index)
+        env = {
+            **os.environ,
+            "GIT_INDEX_FILE": index,
+            "GIT_AUTHOR_NAME": "autonomous",
+            "GIT_AUTHOR_EMAIL": "autonomous@localhost",
+            "GIT_COMMITTER_NAME": "autonomous",
+            "GIT_COMMITTER_EMAIL": "autonomous@localhost",
+        }
+        pathspec = [f":(exclude){path}" for path in (*WORKTREE_EXCLUDES, *exclude)]
+        _git(toplevel, ["add", "-A", "--", ".", *pathspec], env=env)
+        tree = _git(toplevel, ["write-tree"], env=env).strip()
+        head = _run(toplevel, ["rev-parse", "--verify", "--quiet", "HEAD"], check=False)
+        head_commit = head.stdout.decode().strip()
+        parents = ["-p", head_commit] if head_commit else []
+        commit_args = ["commit-tree", tree, *parents, "-m", "autonomous snapshot"]
+        return _git(toplevel, commit_args, env=env).strip()
+
+
+def working_tree_diff(
+    repo: Union[str, Path],
+    base: str,
+    paths: Sequence[str] = (),
+    args: Sequence[str] = (),
+    exclude: Sequence[str] = ()
+) -> str:
+    """
+    git diff from base to the current working tree, including untracked files.
+
+    The working tree is captured with snapshot_commit, so new files show up
+    as additions and the real index is untouched.
+
+    Args:
+        repo: Any path inside the checkout
+        base: Commit to diff from (e.g. an earlier snapshot_commit)
+        paths: Top-level-relative paths to limit the diff to (empty = all)
+        args: Extra git diff arguments (e.g. ["--numstat"], ["-U3"])
+        exclude: Top-level-relative paths left out of the snapshot
+
+    Returns:
+        git diff output
+    """
+    toplevel = git_toplevel(repo)
+    current = snapshot_commit(toplevel, exclude=exclude)
+    return _git(toplevel, ["diff", "--no-renames", *args, base, current, "--", *paths])
+
+
+@dataclass
+class Worktree:
+    """A detached worktree of repo at base_commit."""
+    repo: Path          # top-level of the main checkout
+    path: Path          # top-level of the worktree
+    base_commit: str
+
+    @classmethod
+    def create(
+        cls,
+        repo: Union[str, Path],
+        name: str = "run",
+        base: str = "HEAD",
+        parent_dir: Optional[Union[str, Path]] = None
+    ) -> "Worktree":
+        """
+        Add a detached worktree.
+
+        Args:
+            repo: Any path inside the main checkout
+            name: Label used in the worktree directory name
+            base: Commit-ish to check out
+            parent_dir: Where to create the worktree (default: system temp dir,
+                outside the repository so scans of the main checkout skip it)
+
+        Returns:
+            The new Worktree
+
+        Raises:
+            WorktreeError: If repo is not a git checkout or git fails
+        """
+        toplevel = git_toplevel(repo)
+        base_commit = _git(toplevel, ["rev-parse", "--verify", f"{base}^{{commit}}"]).strip()
+        path = Path(tempfile.mkdtemp(prefix=f"autonomous-{name}-", dir=parent_dir)).resolve()
+        try:
+            with _worktree_lock:
+                _git(toplevel, ["worktree", "add", "--detach", "--force", str(path), base_commit])
+        except WorktreeError:
+            shutil.rmtree(path, ignore_errors=True)
+            raise
+        return cls(toplevel, path, base_commit)
+
+    def changed_paths(self) -> Dict[str, str]:
+        """
+        Files changed in the worktree since base_commit, including new files.
+
+        Returns:
+            {path: status} with status "A", "M" or "D"; paths relative to the top-level
+        """
+        excludes = [f":(exclude){pattern}" for pattern in WORKTREE_EXCLUDES]
+        _git(self.path, ["add", "-A", "--", ".", *excludes])
+        output = _git(
+            self.path, ["diff", "--cached", "--name-status", "-z", "--no-renames", self.base_commit]
+        )
+        items = [item for item in output.split("\0") if item]
+        return {items[i + 1]: items[i][0] for i in range(0, len(items) - 1, 2)}
+
+    def diff(self) -> str:
+        """Binary patch of the worktree's changes against base_commit."""
+        self.changed_paths()  # stages new files
+        return _git(self.path, ["diff", "--cached", "--binary", self.base_commit])
+
+    def base_content(self, rel_path: str) -> Optional[bytes]:
+        """File content at base_commit, or None if it did not exist."""
+        result = _run(self.path, ["show", f"{self.base_commit}:{rel_path}"], check=False)
+        return result.stdout if result.returncode == 0 else None
+
+    def remove(self) -> None:
+        """Delete the worktree and its git metadata."""
+        with _worktree_lock:
+            try:
+                _git(self.repo, ["worktree", "remove", "--force", str(self.path)])
+            except WorktreeError as e:
+                logger.warning(f"Could not remove worktree {self.path}: {e}")
+                shutil.rmtree(self.path, ignore_errors=True)
+                _run(self.repo, ["worktree", "prune"], check=False)
+
+    def __enter__(self) -> "Worktree":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.remove()
+
+
+def _read(path: Path) -> Optional[bytes]:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _merge_text(repo: Path, ours: bytes, base: bytes, theirs: bytes) -> Optional[bytes]:
+    """3-way merge with git merge-file; None on conflict or binary content."""
+    if b"\0" in ours or b"\0" in base or b"\0" in theirs:
+        return None
+    with tempfile.TemporaryDirectory(prefix="autonomous-merge-") as tmp:
+        files = []
+        for label, content in (("ours", ours), ("base", base), ("theirs", theirs)):
+            file_path = os.path.join(tmp, label)
+            with open(file_path, "wb") as f:
+                f.write(content)
+            files.append(file_path)
+        result = _run(repo, ["merge-file", "-p", "--quiet", *files], check=False)
+    return result.stdout if result.returncode == 0 else None
+
+
+def merge_worktree(worktree: Worktree, target: Optional[Union[str, Path]] = None) -> List[str]:
+    """
+    Merge a worktree's changes into the main checkout.
+
+    Every changed file is resolved before anything is written, so a
+    conflict leaves the main checkout untouched.
+
+    Args:
+        worktree: Worktree whose changes to merge
+        target: Main checkout top-level (default: worktree.repo)
+
+    Returns:
+        Paths written or deleted in the main checkout
+
+    Raises:
+        MergeConflict: If any file was changed incompatibly on both sides
+    """
+    target = Path(target).resolve() if target else worktree.repo
+    plan: List[Tuple[str, Optional[bytes]]] = []   # (path, new content or None to delete)
+    conflicts: List[str] = []
+
+    for rel_path, status in sorted(worktree.changed_paths().items()):
+        ours = _read(target / rel_path)
+        theirs = None if status == "D" else _read(worktree.path / rel_path)
+        if ours == theirs:
+            continue  # Already identical in the main checkout
+        base = worktree.base_content(rel_path)
+        if ours == base:
+            plan.append((rel_path, theirs))  # Main checkout untouched: take the worktree's version
+            continue
+        if ours is None or theirs is None or base is None:
+            conflicts.append(rel_path)  # Added/deleted on one side, changed on the other
+            continue
+        merged = _merge_text(worktree.repo, ours, base, theirs)
+        if merged is None:
+            conflicts.append(rel_path)
+        else:
+            plan.append((rel_path, merged))
+
+    if conflicts:
+        raise MergeConflict(conflicts)
+
+    for rel_path, content in plan:
+        destination = target / rel_path
+        if content is None:
+            destination.unlink(missing_ok=True)
+            continue
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        source = worktree.path / rel_path
+        if not destination.exists() and source.exists():
+            shutil.copy2(source, destination)  # New file: keep its mode
+        else:
+            destination.write_bytes(content)
+    return [rel_path for rel_path, _ in plan]
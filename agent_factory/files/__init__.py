@@ -0,0 +1,58 @@
+"""
+Files - Shared file discovery for Agent Factory components.
+
+Provides compiled gitignore-style pattern matching, nested .gitignore
+evaluation, a single-pass pruning directory walker, and a memoized
+per-repository FileIndex used by the autonomous planner, agents, and
+OpenHands worker; plus a cached symbol index that packs ranked repository
+context into LLM prompts under a token budget.
+"""
+
+from .gitignore import (
+    GitignoreStack,
+    find_git_root,
+)
+from .index import (
+    FileIndex,
+    StatSnapshot,
+    get_file_index,
+)
+from .patterns import (
+    PatternSet,
+    glob_to_regex,
+)
+from .symbols import (
+    FileSymbols,
+    SymbolIndex,
+    build_symbol_index,
+    get_symbol_index,
+    pack_context,
+    rank_files,
+)
+from .walker import (
+    DEFAULT_PRUNE_DIRS,
+    walk_files,
+)
+
+__all__ = [
+    # Patterns
+    "PatternSet",
+    "glob_to_regex",
+    # Walking
+    "DEFAULT_PRUNE_DIRS",
+    "walk_files",
+    # Gitignore
+    "GitignoreStack",
+    "find_git_root",
+    # Index
+    "FileIndex",
+    "StatSnapshot",
+    "get_file_index",
+    # Symbols
+    "FileSymbols",
+    "SymbolIndex",
+    "build_symbol_index",
+    "get_symbol_index",
+    "rank_files",
+    "pack_context",
+]
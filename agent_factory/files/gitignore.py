@@ -0,0 +1,151 @@
+"""
+Gitignore - Nested .gitignore rule evaluation.
+
+Rules are collected while walking: every directory's .gitignore is pushed
+onto an immutable GitignoreStack that its subdirectories inherit. Rules
+from deeper .gitignore files take precedence, and within a file the last
+matching rule wins (so "!pattern" can re-include a path).
+
+When the walk starts below the git top-level, .gitignore files in the
+ancestor directories and .git/info/exclude are loaded as well.
+
+Usage:
+    >>> ignores = GitignoreStack.for_root(repo)
+    >>> ignores = ignores.push(repo / "src", "src")
+    >>> ignores.ignored("src/build", is_dir=True)
+    True
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from .patterns import PatternSet
+
+GITIGNORE = ".gitignore"
+
+
+class IgnoreFrame(NamedTuple):
+    """
+    Rules from one ignore file.
+
+    A walk-root-relative path p is matched as prepend + p[strip:], i.e.
+    relative to the directory holding the ignore file.
+    """
+    patterns: PatternSet
+    strip: int
+    prepend: str
+
+
+_cache_lock = threading.Lock()
+_pattern_cache: Dict[str, Tuple[int, PatternSet]] = {}
+
+
+def load_ignore_file(path: str) -> Optional[PatternSet]:
+    """
+    Parse an ignore file, memoized by path and mtime.
+
+    Returns:
+        PatternSet, or None if the file is missing or has no rules
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+    with _cache_lock:
+        cached = _pattern_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1] or None
+
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            patterns = PatternSet(f.read().splitlines(), gitignore=True)
+    except OSError:
+        return None
+
+    with _cache_lock:
+        _pattern_cache[path] = (mtime, patterns)
+    return patterns or None
+
+
+def find_git_root(path: Path) -> Optional[Path]:
+    """Nearest directory at or above path containing .git (dir or worktree file)."""
+    path = Path(path).resolve()
+    for candidate in (path, *path.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+class GitignoreStack:
+    """Immutable stack of ignore rules active in one directory."""
+
+    def __init__(self, frames: Tuple[IgnoreFrame, ...] = ()):
+        self.frames = frames
+
+    @classmethod
+    def for_root(cls, root: Path) -> "GitignoreStack":
+        """
+        Rules that apply at root from outside it: .git/info/exclude and the
+        .gitignore files between the git top-level and root (exclusive).
+        """
+        root = Path(root).resolve()
+        git_root = find_git_root(root)
+        if git_root is None:
+            return cls()
+
+        frames = []
+        offset = root.relative_to(git_root).as_posix()
+        prepend = "" if offset == "." else offset + "/"
+
+        exclude = load_ignore_file(str(git_root / ".git" / "info" / "exclude"))
+        if exclude is not None:
+            frames.append(IgnoreFrame(exclude, 0, prepend))
+
+        ancestor = git_root
+        for part in ([] if offset == "." else offset.split("/")):
+            patterns = load_ignore_file(str(ancestor / GITIGNORE))
+            if patterns is not None:
+                rel = root.relative_to(ancestor).as_posix()
+                frames.append(IgnoreFrame(patterns, 0, rel + "/"))
+            ancestor = ancestor / part
+
+        return cls(tuple(frames))
+
+    def push(self, directory: str, rel_dir: str) -> "GitignoreStack":
+        """
+        Stack for a directory, adding its .gitignore if it has one.
+
+        Args:
+            directory: Absolute directory path
+            rel_dir: Directory path relative to the walk root ("" for the root)
+
+        Returns:
+            A new stack, or self if the directory has no rules
+        """
+        patterns = load_ignore_file(os.path.join(directory, GITIGNORE))
+        if patterns is None:
+            return self
+        strip = len(rel_dir) + 1 if rel_dir else 0
+        return GitignoreStack(self.frames + (IgnoreFrame(patterns, strip, ""),))
+
+    def ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Whether a path (relative to the walk root) is ignored.
+
+        Parent directories are not consulted; callers walking top-down
+        never reach children of ignored directories.
+        """
+        for frame in reversed(self.frames):
+            result = frame.patterns.match(frame.prepend + rel_path[frame.strip:], is_dir)
+            if result is not None:
+                return result
+        return False
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, GitignoreStack) and self.frames == other.frames
+
+    def __hash__(self) -> int:
+        return hash(tuple(id(frame.patterns) for frame in self.frames))
@@ -0,0 +1,281 @@
+"""
+File Index - Shared, memoized, .gitignore-aware view of a repository.
+
+One FileIndex per repository root (see get_file_index) is shared by the
+SuggestionGenerator, PlannerAgent, OpenHandsWorker and openhands_cli.
+Directory listings are cached and revalidated with one stat() per
+directory, so repeated scans only re-list directories that changed.
+
+Usage:
+    >>> index = get_file_index("/path/to/repo")
+    >>> index.list_source_files({".py"}, under="src")
+    ['src/app.py', 'src/util.py']
+    >>> before = index.stat_snapshot()
+    >>> ...  # agent edits files
+    >>> index.changed_files(before)
+    ['src/app.py']
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Collection, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+from .gitignore import GITIGNORE, GitignoreStack
+from .patterns import PatternSet
+from .walker import DEFAULT_PRUNE_DIRS
+
+# path -> (mtime_ns, size)
+StatSnapshot = Dict[str, Tuple[int, int]]
+
+
+@dataclass
+class _DirListing:
+    """Cached listing of one directory."""
+    mtime_ns: int
+    gitignore_mtime_ns: int
+    parent_ignores: GitignoreStack
+    ignores: GitignoreStack
+    files: List[str]                    # root-relative file paths
+    subdirs: List[Tuple[str, str]]      # (absolute path, root-relative path)
+
+
+class FileIndex:
+    """
+    Cached file listing for one repository root.
+
+    Files ignored by .gitignore (nested files, .git/info/exclude, and
+    ignore files above root up to the git top-level) and directories in
+    prune_dirs are never listed.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        prune_dirs: Collection[str] = DEFAULT_PRUNE_DIRS,
+        use_gitignore: bool = True
+    ):
+        """
+        Initialize the index (no I/O until first use).
+
+        Args:
+            root: Repository root; listed paths are relative to it
+            prune_dirs: Directory names never entered
+            use_gitignore: Honour .gitignore rules
+        """
+        self.root = Path(root).resolve()
+        self.prune_dirs = frozenset(prune_dirs)
+        self.use_gitignore = use_gitignore
+        self._listings: Dict[str, _DirListing] = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drop all cached directory listings."""
+        with self._lock:
+            self._listings.clear()
+
+    # ========== WALK ==========
+
+    def _list_dir(
+        self, directory: str, rel_dir: str, parent_ignores: GitignoreStack
+    ) -> Optional[_DirListing]:
+        """Return the cached listing for a directory, re-listing it if it changed."""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+        gitignore_path = os.path.join(directory, GITIGNORE)
+        try:
+            gitignore_mtime_ns = os.stat(gitignore_path).st_mtime_ns if self.use_gitignore else 0
+        except OSError:
+            gitignore_mtime_ns = 0
+
+        cached = self._listings.get(rel_dir)
+        if (
+            cached is not None
+            and cached.mtime_ns == mtime_ns
+            and cached.gitignore_mtime_ns == gitignore_mtime_ns
+            and cached.parent_ignores == parent_ignores
+        ):
+            return cached
+
+        ignores = parent_ignores.push(directory, rel_dir) if self.use_gitignore else parent_ignores
+        prefix = rel_dir + "/" if rel_dir else ""
+        files: List[str] = []
+        subdirs: List[Tuple[str, str]] = []
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return None
+
+        for entry in entries:
+            rel_path = prefix + entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if not is_dir and not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            if is_dir and entry.name in self.prune_dirs:
+                continue
+            if ignores.ignored(rel_path, is_dir):
+                continue
+            if is_dir:
+                subdirs.append((entry.path, rel_path))
+            else:
+                files.append(rel_path)
+
+        listing = _DirListing(mtime_ns, gitignore_mtime_ns, parent_ignores, ignores, files, subdirs)
+        self._listings[rel_dir] = listing
+        return listing
+
+    def _collect_listings(
+        self,
+        under: str = "",
+        exclude: Optional[PatternSet] = None
+    ) -> List[Tuple[str, _DirListing]]:
+        """
+        Walk top-down from root (or a subdirectory) and return (rel_dir, listing)
+        pairs. Directories matching exclude are not entered.
+        """
+        with self._lock:
+            if self.use_gitignore:
+                root_ignores = GitignoreStack.for_root(self.root)
+            else:
+                root_ignores = GitignoreStack()
+
+            # Resolve ignore rules along the path to the requested subdirectory
+            stack = [(str(self.root), "", root_ignores)]
+            if under:
+                rel_dir = ""
+                ignores = root_ignores
+                for part in under.split("/"):
+                    listing = self._list_dir(str(self.root / rel_dir), rel_dir, ignores)
+                    rel_dir = f"{rel_dir}/{part}" if rel_dir else part
+                    if listing is None or not any(sub == rel_dir for _, sub in listing.subdirs):
+                        return []
+                    ignores = listing.ignores
+                stack = [(str(self.root / rel_dir), rel_dir, ignores)]
+
+            listings = []
+            while stack:
+                directory, rel_dir, parent_ignores = stack.pop()
+                listing = self._list_dir(directory, rel_dir, parent_ignores)
+                if listing is None:
+                    continue
+                listings.append((rel_dir, listing))
+                stack.extend(
+                    (abs_path, sub_rel, listing.ignores)
+                    for abs_path, sub_rel in reversed(listing.subdirs)
+                    if exclude is None or not exclude.matches(sub_rel, is_dir=True)
+                )
+
+            # Forget directories that disappeared
+            if not under and exclude is None:
+                seen = {rel_dir for rel_dir, _ in listings}
+                for stale in set(self._listings) - seen:
+                    del self._listings[stale]
+
+            return listings
+
+    # ========== QUERIES ==========
+
+    def iter_files(
+        self,
+        under: str = "",
+        extensions: Optional[Collection[str]] = None,
+        exclude: Optional[PatternSet] = None
+    ) -> Iterator[str]:
+        """
+        Lazily yield indexed files.
+
+        Args:
+            under: Only files below this root-relative directory ("" = all)
+            extensions: File suffixes to keep (None = all files)
+            exclude: Extra patterns; excluded directories are skipped whole
+
+        Yields:
+            Root-relative "/"-separated paths
+        """
+        under = "" if under in ("", ".") else under.strip("/")
+        suffixes = tuple(extensions) if extensions is not None else None
+        exclude = exclude if exclude else None
+
+        for _, listing in self._collect_listings(under, exclude):
+            for rel_path in listing.files:
+                if suffixes is not None and not rel_path.endswith(suffixes):
+                    continue
+                if exclude is not None and exclude.matches(rel_path):
+                    continue
+                yield rel_path
+
+    def list_source_files(
+        self,
+        extensions: Optional[Collection[str]] = None,
+        under: str = "",
+        exclude: Optional[PatternSet] = None
+    ) -> List[str]:
+        """Sorted list of indexed files (see iter_files)."""
+        return sorted(self.iter_files(under, extensions, exclude))
+
+    def stat_snapshot(
+        self,
+        under: str = "",
+        exclude: Optional[PatternSet] = None
+    ) -> StatSnapshot:
+        """
+        Fresh (mtime_ns, size) for every indexed file.
+
+        Directory listings are revalidated, file stats are always re-read.
+        """
+        snapshot: StatSnapshot = {}
+        for rel_path in self.iter_files(under, exclude=exclude):
+            try:
+                st = os.stat(self.root / rel_path)
+            except OSError:
+                continue
+            snapshot[rel_path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def changed_files(
+        self,
+        before: StatSnapshot,
+        under: str = "",
+        exclude: Optional[PatternSet] = None
+    ) -> List[str]:
+        """
+        Files created or modified since a stat_snapshot().
+
+        Returns:
+            Sorted root-relative paths
+        """
+        after = self.stat_snapshot(under, exclude)
+        return sorted(path for path, stat in after.items() if before.get(path) != stat)
+
+
+_index_lock = threading.Lock()
+_indexes: Dict[Tuple[Path, FrozenSet[str], bool], FileIndex] = {}
+
+
+def get_file_index(
+    root: Union[str, Path],
+    prune_dirs: Collection[str] = DEFAULT_PRUNE_DIRS,
+    use_gitignore: bool = True
+) -> FileIndex:
+    """
+    Shared FileIndex for a repository root (memoized per root and settings).
+
+    Args:
+        root: Repository root
+        prune_dirs: Directory names never entered
+        use_gitignore: Honour .gitignore rules
+    """
+    key = (Path(root).resolve(), frozenset(prune_dirs), use_gitignore)
+    with _index_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = FileIndex(key[0], key[1], use_gitignore)
+            _indexes[key] = index
+        return index
@@ -0,0 +1,177 @@
+"""
+Patterns - Compiled gitignore-style glob matching.
+
+Translates glob patterns to regular expressions once, so matching a path
+is a couple of regex calls instead of a loop over fnmatch/substring checks.
+
+Pattern semantics (a subset of gitignore):
+    *.pyc            No slash: matches the name at any depth
+    build/           Trailing slash: directories only
+    node_modules/*   Trailing "/*" or "/**": the directory and everything in it
+    docs/*.md        Inner slash: anchored to the root
+    /setup.py        Leading slash: anchored to the root
+    **/fixtures      "**" matches any number of directories
+
+In .gitignore files (gitignore=True) a trailing "/*" or "/**" keeps its git
+meaning: it matches the directory's contents, not the directory, so
+"docs/*" followed by "!docs/index.md" re-includes that file.
+"""
+
+import re
+from typing import Iterable, List, NamedTuple, Optional, Pattern
+
+
+def glob_to_regex(pattern: str) -> str:
+    """
+    Translate a glob to a regex that matches a whole "/"-separated path.
+
+    "*" and "?" never cross a "/"; "**" does.
+
+    Args:
+        pattern: Glob without leading/trailing slashes
+
+    Returns:
+        Regex source (unanchored; callers wrap it with ^...$)
+    """
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern[i:i + 3] == "**/":
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern[i:i + 2] == "**":
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class GlobRule(NamedTuple):
+    """One parsed pattern."""
+    regex: Pattern
+    dir_only: bool   # Only matches directories
+    anchored: bool   # Matched against the full relative path, not the name
+    negated: bool    # "!pattern" re-includes a previously excluded path
+
+
+def parse_rule(line: str, gitignore: bool = False) -> Optional[GlobRule]:
+    """
+    Parse one pattern line.
+
+    Args:
+        line: Pattern line
+        gitignore: Only a trailing "/" restricts the rule to directories
+
+    Returns:
+        GlobRule, or None for blank lines and comments
+    """
+    pattern = line.rstrip("\n").rstrip()
+    if not pattern or pattern.startswith("#"):
+        return None
+
+    negated = pattern.startswith("!")
+    # Drop the negation mark, or the backslash of an escaped leading ! or #
+    if negated or pattern.startswith(("\\!", "\\#")):
+        pattern = pattern[1:]
+
+    dir_only = False
+    suffixes = ("/",) if gitignore else ("/**", "/*", "/")
+    for suffix in suffixes:
+        if pattern.endswith(suffix) and len(pattern) > len(suffix):
+            pattern = pattern[:-len(suffix)]
+            dir_only = True
+            break
+
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+    if not pattern:
+        return None
+
+    return GlobRule(
+        regex=re.compile(f"^{glob_to_regex(pattern)}$"),
+        dir_only=dir_only,
+        anchored=anchored,
+        negated=negated,
+    )
+
+
+class PatternSet:
+    """
+    A compiled list of exclusion patterns.
+
+    Rules are evaluated in order and the last matching rule wins, so a
+    later "!pattern" re-includes paths excluded earlier.
+
+    Example:
+        >>> excludes = PatternSet(["node_modules/*", "*.pyc", "!keep.pyc"])
+        >>> excludes.matches("src/node_modules", is_dir=True)
+        True
+    """
+
+    def __init__(self, patterns: Iterable[str] = (), gitignore: bool = False):
+        self.rules: List[GlobRule] = [
+            rule for rule in (parse_rule(p, gitignore) for p in patterns) if rule is not None
+        ]
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def match(self, rel_path: str, is_dir: bool = False) -> Optional[bool]:
+        """
+        Evaluate one path against the rules (ancestors are not consulted).
+
+        Args:
+            rel_path: "/"-separated path relative to the pattern root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if excluded, False if re-included by a negation, None if no rule matched
+        """
+        name = rel_path.rsplit("/", 1)[-1]
+        result = None
+        for rule in self.rules:
+            if rule.dir_only and not is_dir:
+                continue
+            target = rel_path if rule.anchored else name
+            if rule.regex.match(target):
+                result = not rule.negated
+        return result
+
+    def matches(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Whether the path itself is excluded."""
+        return bool(self.match(rel_path, is_dir))
+
+    def excludes(self, rel_path: str) -> bool:
+        """
+        Whether a file path is excluded, either directly or because one of
+        its parent directories is.
+
+        Use this for paths that did not come from a pruning walk.
+        """
+        parts = rel_path.split("/")
+        for i in range(1, len(parts)):
+            if self.matches("/".join(parts[:i]), is_dir=True):
+                return True
+        return self.matches(rel_path)
@@ -0,0 +1,432 @@
+"""
+Symbols - Repository symbol index and relevance-ranked context packing.
+
+Builds a compact model of a repository: per-file size, module summary,
+class/function signatures, and the internal import graph. The index is
+keyed by a tree hash of (path, size, mtime) over the indexed files, kept
+in memory per repository, and optionally persisted as JSON. Rebuilds
+re-parse only files whose stat changed.
+
+pack_context() turns the index into prompt text under a token budget:
+a ranked outline of signatures first, then the full source of the most
+central files that still fit.
+
+Usage:
+    >>> index = get_symbol_index("/path/to/repo", cache_path=".autonomous_history/symbols.json")
+    >>> prompt_context = pack_context(index, budget_tokens=6000)
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Collection, Dict, List, Optional, Tuple, Union
+
+from .index import get_file_index
+
+logger = logging.getLogger(__name__)
+
+
+# Rough token estimate, same heuristic as agent_factory.llm.budget
+CHARS_PER_TOKEN = 4
+
+# Bump when FileSymbols changes shape (invalidates persisted indexes)
+INDEX_VERSION = 1
+
+DEFAULT_EXTENSIONS = ('.py', '.ts', '.js', '.tsx', '.jsx', '.go', '.rs', '.java')
+
+# Entry points get a ranking bonus
+ENTRYPOINT_NAMES = {
+    'main.py', 'app.py', 'cli.py', '__main__.py', 'index.ts', 'index.js', 'server.py',
+}
+
+# Largest source file considered for parsing
+MAX_PARSE_BYTES = 1_000_000
+
+_SIGNATURE_PATTERN = re.compile(
+    r"^\s*(export\s+)?(default\s+)?(async\s+)?"
+    r"(function\s*\*?\s*\w+\s*\([^)]*\)|class\s+\w+[^{]*|interface\s+\w+[^{]*|"
+    r"func\s+(\([^)]*\)\s*)?\w+\s*\([^)]*\)[^{]*|(pub\s+)?fn\s+\w+[^{]*|"
+    r"(public|private|protected)\s+[\w<>\[\], ]+\s+\w+\s*\([^)]*\))"
+)
+
+
+@dataclass
+class FileSymbols:
+    """Symbols and metadata for one source file."""
+    path: str
+    size: int
+    mtime_ns: int
+    lines: int
+    summary: str = ""                                    # first docstring/comment line
+    # "class A(B)", "  def m(self, x)", "def f(y)"
+    signatures: List[str] = field(default_factory=list)
+    imports: List[str] = field(default_factory=list)     # repo-relative paths imported
+    parse_error: bool = False
+
+
+@dataclass
+class SymbolIndex:
+    """Symbol index for a repository at one tree hash."""
+    root: str
+    tree_hash: str
+    files: Dict[str, FileSymbols] = field(default_factory=dict)
+
+    def importers(self) -> Dict[str, int]:
+        """In-degree of each file in the internal import graph."""
+        counts: Dict[str, int] = dict.fromkeys(self.files, 0)
+        for symbols in self.files.values():
+            for target in symbols.imports:
+                if target in counts and target != symbols.path:
+                    counts[target] += 1
+        return counts
+
+    def to_dict(self) -> dict:
+        return {
+            "version": INDEX_VERSION,
+            "root": self.root,
+            "tree_hash": self.tree_hash,
+            "files": {path: asdict(symbols) for path, symbols in self.files.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional["SymbolIndex"]:
+        if data.get("version") != INDEX_VERSION:
+            return None
+        return cls(
+            root=data["root"],
+            tree_hash=data["tree_hash"],
+            files={path: FileSymbols(**entry) for path, entry in data.get("files", {}).items()},
+        )
+
+
+# ========== EXTRACTION ==========
+
+def _format_args(args: ast.arguments) -> str:
+    """Render a function's parameters without defaults."""
+    try:
+        rendered = ast.unparse(args)
+    except Exception:
+        rendered = ", ".join(a.arg for a in args.args)
+    # Drop default values to keep signatures short
+    return re.sub(r"=[^,]+", "", rendered) if len(rendered) > 80 else rendered
+
+
+def _python_symbols(
+    content: str, module_path: str, known: Collection[str]
+) -> Tuple[str, List[str], List[str]]:
+    """Summary, signatures and resolved internal imports of a Python module."""
+    tree = ast.parse(content)
+    summary = (ast.get_docstring(tree) or "").strip().split("\n", 1)[0]
+    signatures: List[str] = []
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            bases = ", ".join(ast.unparse(b) for b in node.bases) if node.bases else ""
+            signatures.append(f"class {node.name}({bases})" if bases else f"class {node.name}")
+            for member in node.body:
+                if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)) and (
+                    not member.name.startswith("_") or member.name == "__init__"
+                ):
+                    prefix = "async def" if isinstance(member, ast.AsyncFunctionDef) else "def"
+                    signatures.append(f"  {prefix} {member.name}({_format_args(member.args)})")
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+            signatures.append(f"{prefix} {node.name}({_format_args(node.args)})")
+
+    # Resolve imports to repo files
+    package_parts = module_path.split("/")[:-1]
+    imports = []
+    for node in ast.walk(tree):
+        candidates = []
+        if isinstance(node, ast.Import):
+            candidates = [alias.name.replace(".", "/") for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package_parts[:len(package_parts) - node.level + 1]
+                module = "/".join(base + (node.module.split(".") if node.module else []))
+            else:
+                module = (node.module or "").replace(".", "/")
+            # "from pkg import name" may import a submodule or a symbol of pkg
+            candidates = [f"{module}/{alias.name}" for alias in node.names] + [module]
+        for stem in candidates:
+            stem = stem.strip("/")
+            if not stem:
+                continue
+            for target in (f"{stem}.py", f"{stem}/__init__.py"):
+                if target in known and target not in imports:
+                    imports.append(target)
+                    break
+
+    return summary, signatures, imports
+
+
+def _generic_symbols(content: str) -> Tuple[str, List[str]]:
+    """Summary and regex-extracted signatures for non-Python files."""
+    summary = ""
+    for line in content.splitlines()[:20]:
+        stripped = line.strip().lstrip("/*#! ").strip()
+        if stripped:
+            summary = stripped
+            break
+    signatures = []
+    for line in content.splitlines():
+        match = _SIGNATURE_PATTERN.match(line)
+        if match:
+            indent = "  " if line[:1].isspace() else ""
+            signatures.append(indent + match.group(0).strip().rstrip("{").strip())
+    return summary, signatures
+
+
+def extract_symbols(
+    root: Path, path: str, size: int, mtime_ns: int, known: Collection[str]
+) -> FileSymbols:
+    """
+    Parse one file into FileSymbols.
+
+    Args:
+        root: Repository root
+        path: Repo-relative path
+        size: File size in bytes
+        mtime_ns: File mtime
+        known: All indexed paths (for import resolution)
+    """
+    symbols = FileSymbols(path=path, size=size, mtime_ns=mtime_ns, lines=0)
+    if size > MAX_PARSE_BYTES:
+        return symbols
+    try:
+        content = (root / path).read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        symbols.parse_error = True
+        return symbols
+
+    symbols.lines = content.count("\n") + 1
+    try:
+        if path.endswith(".py"):
+            parsed = _python_symbols(content, path, known)
+            symbols.summary, symbols.signatures, symbols.imports = parsed
+        else:
+            symbols.summary, symbols.signatures = _generic_symbols(content)
+    except (SyntaxError, ValueError):
+        symbols.parse_error = True
+        symbols.summary, symbols.signatures = _generic_symbols(content)
+    return symbols
+
+
+# ========== BUILD / CACHE ==========
+
+_memo_lock = threading.Lock()
+_memo: Dict[str, SymbolIndex] = {}
+
+
+def tree_hash(snapshot: Dict[str, Tuple[int, int]]) -> str:
+    """Fingerprint of a stat snapshot: changes whenever any file is added, removed or modified."""
+    digest = hashlib.sha256()
+    for path in sorted(snapshot):
+        mtime_ns, size = snapshot[path]
+        digest.update(f"{path}\0{size}\0{mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _source_snapshot(root: Path, extensions: Collection[str]) -> Dict[str, Tuple[int, int]]:
+    """Fresh stat snapshot of indexed source files (via the shared FileIndex)."""
+    suffixes = tuple(extensions)
+    return {
+        path: stat
+        for path, stat in get_file_index(root).stat_snapshot().items()
+        if path.endswith(suffixes)
+    }
+
+
+def build_symbol_index(
+    root: Union[str, Path],
+    extensions: Collection[str] = DEFAULT_EXTENSIONS,
+    previous: Optional[SymbolIndex] = None,
+    snapshot: Optional[Dict[str, Tuple[int, int]]] = None
+) -> SymbolIndex:
+    """
+    Build a symbol index, reusing unchanged entries from a previous index.
+
+    Args:
+        root: Repository root
+        extensions: Source file suffixes to index
+        previous: Earlier index for the same root
+        snapshot: Precomputed source snapshot (taken if omitted)
+    """
+    root = Path(root).resolve()
+    if snapshot is None:
+        snapshot = _source_snapshot(root, extensions)
+    known = set(snapshot)
+    reused = previous.files if previous is not None else {}
+
+    files: Dict[str, FileSymbols] = {}
+    for path in sorted(snapshot):
+        mtime_ns, size = snapshot[path]
+        old = reused.get(path)
+        if old is not None and old.mtime_ns == mtime_ns and old.size == size:
+            # Unchanged file; drop imports of files that no longer exist
+            old.imports = [target for target in old.imports if target in known]
+            files[path] = old
+        else:
+            files[path] = extract_symbols(root, path, size, mtime_ns, known)
+
+    return SymbolIndex(root=str(root), tree_hash=tree_hash(snapshot), files=files)
+
+
+def get_symbol_index(
+    root: Union[str, Path],
+    cache_path: Optional[Union[str, Path]] = None,
+    extensions: Collection[str] = DEFAULT_EXTENSIONS
+) -> SymbolIndex:
+    """
+    Symbol index for a repository, rebuilt only when the tree hash changes.
+
+    Args:
+        root: Repository root
+        cache_path: Optional JSON file used to persist the index across processes
+        extensions: Source file suffixes to index
+
+    Returns:
+        Up-to-date SymbolIndex
+    """
+    root = Path(root).resolve()
+    key = str(root)
+
+    with _memo_lock:
+        previous = _memo.get(key)
+
+    if previous is None and cache_path is not None:
+        try:
+            previous = SymbolIndex.from_dict(json.loads(Path(cache_path).read_text()))
+        except (OSError, ValueError, KeyError, TypeError):
+            previous = None
+
+    snapshot = _source_snapshot(root, extensions)
+    if previous is not None and previous.tree_hash == tree_hash(snapshot):
+        index = previous
+    else:
+        index = build_symbol_index(root, extensions, previous, snapshot)
+        if cache_path is not None:
+            _write_atomic(Path(cache_path), json.dumps(index.to_dict()))
+
+    with _memo_lock:
+        _memo[key] = index
+    return index
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not persist symbol index to {path}: {e}")
+
+
+# ========== RANKING / PACKING ==========
+
+def rank_files(index: SymbolIndex) -> List[str]:
+    """
+    Files ordered by estimated value as planner context.
+
+    Favours modules many others import, entry points, and files with
+    many public symbols; de-prioritises tests and tiny files.
+    """
+    importers = index.importers()
+    scores = {}
+    for path, symbols in index.files.items():
+        name = path.rsplit("/", 1)[-1]
+        score = 3.0 * importers.get(path, 0)
+        score += min(len(symbols.signatures), 30) * 0.5
+        score += min(symbols.lines, 2000) / 200
+        if name in ENTRYPOINT_NAMES:
+            score += 5
+        if "test" in name or "/tests/" in f"/{path}":
+            score *= 0.3
+        if symbols.lines < 5:
+            score *= 0.2
+        scores[path] = score
+    return sorted(index.files, key=lambda p: (-scores[p], p))
+
+
+def format_outline(symbols: FileSymbols) -> str:
+    """One file's outline block."""
+    header = f"### {symbols.path} ({symbols.lines} lines)"
+    if symbols.summary:
+        header += f" - {symbols.summary[:120]}"
+    lines = [header]
+    if symbols.imports:
+        lines.append("imports: " + ", ".join(symbols.imports[:8]))
+    lines.extend(symbols.signatures[:40])
+    if len(symbols.signatures) > 40:
+        lines.append(f"  ... ({len(symbols.signatures) - 40} more)")
+    return "\n".join(lines) + "\n"
+
+
+def pack_context(
+    index: SymbolIndex,
+    budget_tokens: int,
+    outline_share: float = 0.6,
+    focus: Optional[Collection[str]] = None
+) -> str:
+    """
+    Pack the most valuable repository context under a token budget.
+
+    The outline section lists signatures for files in rank order until
+    outline_share of the budget is used; the remainder holds the full
+    source of top-ranked files that fit whole.
+
+    Args:
+        index: Symbol index
+        budget_tokens: Total token budget for the returned text
+        outline_share: Fraction of the budget reserved for the outline
+        focus: Paths to rank first (e.g. files a task will touch)
+
+    Returns:
+        Prompt-ready markdown
+    """
+    budget_chars = budget_tokens * CHARS_PER_TOKEN
+    ranked = rank_files(index)
+    if focus:
+        focused = [p for p in focus if p in index.files]
+        ranked = focused + [p for p in ranked if p not in focused]
+
+    outline_budget = int(budget_chars * outline_share)
+    outline_parts, used = [], 0
+    for path in ranked:
+        block = format_outline(index.files[path])
+        if used + len(block) > outline_budget:
+            continue
+        outline_parts.append(block)
+        used += len(block)
+
+    source_parts = []
+    remaining = budget_chars - used
+    root = Path(index.root)
+    for path in ranked:
+        symbols = index.files[path]
+        # Rough pre-check before reading: bytes ~ chars for source files
+        if symbols.size + 64 > remaining or symbols.lines < 5:
+            continue
+        try:
+            content = (root / path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        block = f"### {path}\n```\n{content}\n```\n"
+        if len(block) > remaining:
+            continue
+        source_parts.append(block)
+        remaining -= len(block)
+
+    sections = []
+    if outline_parts:
+        sections.append("### Module Outline\n\n" + "\n".join(outline_parts))
+    if source_parts:
+        sections.append("### Key Source Files\n\n" + "\n".join(source_parts))
+    return "\n".join(sections)
@@ -0,0 +1,105 @@
+"""
+Walker - Single-pass, pruning directory walk.
+
+One os.scandir() traversal replaces per-extension rglob() calls. Excluded
+directories are pruned before they are entered, so node_modules, .git and
+virtualenvs cost a single directory entry instead of a full descent.
+
+Usage:
+    >>> for rel_path in walk_files(repo, extensions={".py"}, exclude=PatternSet(["build/"])):
+    ...     print(rel_path)
+"""
+
+import os
+from pathlib import Path
+from typing import Collection, Iterator, Optional, Union
+
+from .patterns import PatternSet
+
+# Directories never worth descending into when looking for source files
+DEFAULT_PRUNE_DIRS = frozenset({
+    ".git",
+    ".hg",
+    ".svn",
+    "node_modules",
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".tox",
+    ".nox",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+})
+
+
+def walk_files(
+    root: Union[str, Path],
+    base: Optional[Union[str, Path]] = None,
+    extensions: Optional[Collection[str]] = None,
+    exclude: Optional[PatternSet] = None,
+    prune_dirs: Collection[str] = DEFAULT_PRUNE_DIRS
+) -> Iterator[str]:
+    """
+    Lazily yield files under root.
+
+    Entries are visited in sorted order, so output is deterministic and
+    callers can stop early (e.g. with itertools.islice).
+
+    Args:
+        root: Directory to walk
+        base: Directory yielded paths (and exclude patterns) are relative to
+            (defaults to root; must contain root)
+        extensions: File suffixes to keep, e.g. {".py", ".ts"} (None = all files)
+        exclude: Compiled exclusion patterns, matched relative to base
+        prune_dirs: Directory names skipped without matching patterns
+
+    Yields:
+        "/"-separated paths relative to base
+    """
+    root = Path(root)
+    base = Path(base) if base is not None else root
+    prefix = root.relative_to(base).as_posix()
+    prefix = "" if prefix == "." else prefix + "/"
+    suffixes = tuple(extensions) if extensions is not None else None
+    exclude = exclude if exclude else None
+
+    # Stack of (absolute dir, path prefix relative to base); reversed so
+    # directories pop in sorted order
+    stack = [(str(root), prefix)]
+    while stack:
+        directory, rel_prefix = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            rel_path = rel_prefix + entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+
+            if is_dir:
+                if entry.name in prune_dirs:
+                    continue
+                if exclude is not None and exclude.matches(rel_path, is_dir=True):
+                    continue
+                subdirs.append((entry.path, rel_path + "/"))
+                continue
+
+            if suffixes is not None and not entry.name.endswith(suffixes):
+                continue
+            if exclude is not None and exclude.matches(rel_path):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            yield rel_path
+
+        stack.extend(reversed(subdirs))
@@ -43,15 +43,37 @@ from .router import (
     LLMRouterError,
     ModelNotFoundError,
     ProviderAPIError,
+    BudgetExceededError,
+    budgeted_completion,
     create_router,
 )
 
+from .budget import (
+    Budget,
+    BudgetAction,
+    BudgetDecision,
+    BudgetManager,
+    BudgetPeriod,
+    estimate_request_cost,
+)
+
 from .tracker import (
     UsageTracker,
     get_global_tracker,
     reset_global_tracker,
 )
 
+from .metrics import (
+    LLMMetrics,
+    MetricsRegistry,
+    serve_metrics,
+)
+
+from .export import (
+    EXPORT_FORMATS,
+    export_usage,
+)
+
 __all__ = [
     # Enums
     "LLMProvider",
@@ -77,9 +99,25 @@ __all__ = [
     "LLMRouterError",
     "ModelNotFoundError",
     "ProviderAPIError",
+    "BudgetExceededError",
     "create_router",
+    "budgeted_completion",
+    # Budgets
+    "Budget",
+    "BudgetAction",
+    "BudgetDecision",
+    "BudgetManager",
+    "BudgetPeriod",
+    "estimate_request_cost",
     # Tracker
     "UsageTracker",
     "get_global_tracker",
     "reset_global_tracker",
+    # Metrics
+    "LLMMetrics",
+    "MetricsRegistry",
+    "serve_metrics",
+    # Export
+    "EXPORT_FORMATS",
+    "export_usage",
 ]
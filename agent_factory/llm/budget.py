@@ -0,0 +1,569 @@
+"""
+Budget Manager - Pre-call Admission Control
+
+Enforces spend limits before a request is dispatched instead of only
+reporting them afterwards. Budgets are hierarchical (global → tenant → agent)
+and keyed by the same tags used by UsageTracker (e.g. "tenant:acme",
+"agent:planner").
+
+Each request is estimated up front; if it would push any budget in its
+chain over the hard limit, the router either downgrades it to a cheaper
+model in the same capability tier or rejects it. Soft thresholds fire
+callbacks once per budget period so operators get a warning before calls
+start failing.
+
+Part of Phase 6: Budget Alerts
+"""
+
+import threading
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from .config import get_model_info, get_models_by_capability
+from .types import ModelInfo
+
+# Rough characters-per-token ratio used for pre-call estimates
+CHARS_PER_TOKEN = 4
+
+# Per-message overhead (role, separators) added by most chat templates
+TOKENS_PER_MESSAGE = 4
+
+# Assumed completion size when the request does not set max_tokens
+DEFAULT_OUTPUT_TOKENS = 512
+
+GLOBAL_SCOPE = "global"
+
+
+class BudgetPeriod(str, Enum):
+    """Window after which a budget's spend resets."""
+    TOTAL = "total"        # Never resets
+    DAILY = "daily"
+    MONTHLY = "monthly"
+
+
+class BudgetAction(str, Enum):
+    """Outcome of a pre-call admission check."""
+    ALLOW = "allow"            # Request fits all budgets as-is
+    DOWNGRADE = "downgrade"    # Request fits only on a cheaper model
+    REJECT = "reject"          # No model fits the remaining budget
+
+
+class Budget(BaseModel):
+    """
+    A spend limit for one scope in the budget hierarchy.
+
+    Scopes are tag strings. The global budget has no parent; every other
+    budget points at its parent scope, so spend on "agent:bob" also counts
+    against "tenant:acme" and "global".
+    """
+    scope: str = Field(..., description="Tag this budget applies to")
+    limit_usd: float = Field(..., ge=0.0, description="Hard limit in USD per period")
+    parent: Optional[str] = Field(
+        default=GLOBAL_SCOPE,
+        description="Parent scope (None for the root budget)"
+    )
+    soft_threshold: float = Field(
+        default=0.8,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of the limit that triggers the soft-limit callback"
+    )
+    period: BudgetPeriod = BudgetPeriod.MONTHLY
+    allow_downgrade: bool = Field(
+        default=True,
+        description="Whether requests may be moved to a cheaper model instead of rejected"
+    )
+
+    class Config:
+        use_enum_values = True
+
+
+class BudgetDecision(BaseModel):
+    """
+    Result of BudgetManager.admit().
+
+    Admitted decisions hold a reservation for the estimated cost; the caller
+    must pass the decision back to commit() or release() once the request
+    finishes.
+    """
+    action: BudgetAction
+    model: str = Field(..., description="Model the request should use")
+    requested_model: str
+    estimated_cost_usd: float = Field(default=0.0, ge=0.0)
+    scopes: List[str] = Field(default_factory=list, description="Budget chain checked")
+    limiting_scope: Optional[str] = Field(
+        None,
+        description="Budget that forced a downgrade or rejection"
+    )
+    reason: str = ""
+    reservation_id: Optional[str] = None
+
+    class Config:
+        use_enum_values = True
+
+
+def estimate_input_tokens(messages: List[Dict[str, Any]]) -> int:
+    """
+    Estimate prompt tokens for a message list without a tokenizer.
+
+    Args:
+        messages: List of message dicts (role, content)
+
+    Returns:
+        Approximate token count
+    """
+    chars = 0
+    for message in messages:
+        content = message.get("content") or ""
+        chars += len(content) if isinstance(content, str) else len(str(content))
+    return chars // CHARS_PER_TOKEN + TOKENS_PER_MESSAGE * len(messages)
+
+
+def estimate_request_cost(
+    messages: List[Dict[str, Any]],
+    model_info: ModelInfo,
+    max_tokens: Optional[int] = None
+) -> float:
+    """
+    Estimate the worst-case cost of a request before dispatch.
+
+    Args:
+        messages: List of message dicts (role, content)
+        model_info: Model metadata with pricing information
+        max_tokens: Completion limit (DEFAULT_OUTPUT_TOKENS if None)
+
+    Returns:
+        Estimated cost in USD
+
+    Example:
+        >>> info = get_model_info("gpt-4o-mini")
+        >>> cost = estimate_request_cost([{"role": "user", "content": "Hi"}], info)
+    """
+    input_tokens = estimate_input_tokens(messages)
+    output_tokens = max_tokens or DEFAULT_OUTPUT_TOKENS
+    return (
+        (input_tokens / 1000) * model_info.input_cost_per_1k
+        + (output_tokens / 1000) * model_info.output_cost_per_1k
+    )
+
+
+def _period_key(period: BudgetPeriod, now: datetime) -> str:
+    """Bucket key identifying the current budget window."""
+    if period == BudgetPeriod.DAILY:
+        return now.strftime("%Y-%m-%d")
+    if period == BudgetPeriod.MONTHLY:
+        return now.strftime("%Y-%m")
+    return "total"
+
+
+class BudgetManager:
+    """
+    Hierarchical budget enforcement for LLMRouter.
+
+    Tracks spend per scope and admits, downgrades, or rejects requests
+    before they are sent. Thread-safe: concurrent requests reserve their
+    estimated cost so parallel callers cannot jointly overshoot a limit.
+
+    Example:
+        >>> budgets = BudgetManager(global_limit_usd=50.0)
+        >>> budgets.set_budget("tenant:acme", 20.0)
+        >>> budgets.set_budget("agent:planner", 5.0, parent="tenant:acme")
+        >>> router = LLMRouter(budget=budgets)
+        >>> config = LLMConfig(
+        ...     provider=LLMProvider.OPENAI,
+        ...     model="gpt-4o",
+        ...     metadata={"tags": ["tenant:acme", "agent:planner"]}
+        ... )
+        >>> response = router.complete(messages, config)  # may downgrade or raise
+    """
+
+    def __init__(
+        self,
+        global_limit_usd: Optional[float] = None,
+        soft_threshold: float = 0.8,
+        period: BudgetPeriod = BudgetPeriod.MONTHLY,
+        on_soft_limit: Optional[Callable[[Budget, float], None]] = None,
+        on_hard_limit: Optional[Callable[[Budget, float], None]] = None,
+    ):
+        """
+        Initialize budget manager.
+
+        Args:
+            global_limit_usd: Limit for the root "global" budget (None = unlimited)
+            soft_threshold: Soft threshold for the global budget (0-1)
+            period: Reset window for the global budget
+            on_soft_limit: Callback(budget, spent_usd) when a soft threshold is crossed
+            on_hard_limit: Callback(budget, spent_usd) when a hard limit is reached
+        """
+        self.on_soft_limit = on_soft_limit
+        self.on_hard_limit = on_hard_limit
+        self._budgets: Dict[str, Budget] = {}
+        self._spend: Dict[str, Tuple[str, float]] = {}
+        self._reserved: Dict[str, float] = {}
+        self._reservations: Dict[str, Tuple[List[str], float]] = {}
+        self._alerted: Dict[Tuple[str, str, str], bool] = {}
+        self._lock = threading.RLock()
+
+        if global_limit_usd is not None:
+            self.set_budget(
+                GLOBAL_SCOPE,
+                global_limit_usd,
+                parent=None,
+                soft_threshold=soft_threshold,
+                period=period,
+            )
+
+    def set_budget(
+        self,
+        scope: str,
+        limit_usd: float,
+        parent: Optional[str] = GLOBAL_SCOPE,
+        soft_threshold: float = 0.8,
+        period: BudgetPeriod = BudgetPeriod.MONTHLY,
+        allow_downgrade: bool = True,
+    ) -> Budget:
+        """
+        Create or replace the budget for a scope.
+
+        Args:
+            scope: Tag the budget applies to (e.g. "tenant:acme")
+            limit_usd: Hard limit in USD per period
+            parent: Parent scope in the hierarchy (None for a root budget)
+            soft_threshold: Fraction of the limit that triggers on_soft_limit
+            period: Reset window
+            allow_downgrade: Allow cheaper-model substitution instead of rejecting
+
+        Returns:
+            The stored Budget
+        """
+        if scope == GLOBAL_SCOPE:
+            parent = None
+        budget = Budget(
+            scope=scope,
+            limit_usd=limit_usd,
+            parent=parent,
+            soft_threshold=soft_threshold,
+            period=period,
+            allow_downgrade=allow_downgrade,
+        )
+        with self._lock:
+            self._budgets[scope] = budget
+        return budget
+
+    def get_budget(self, scope: str) -> Optional[Budget]:
+        """Get the budget for a scope, if one is configured."""
+        return self._budgets.get(scope)
+
+    def get_spent(self, scope: str) -> float:
+        """Get committed spend for a scope in its current period."""
+        with self._lock:
+            budget = self._budgets.get(scope)
+            if budget is None:
+                return 0.0
+            return self._current_spend(budget, datetime.utcnow())
+
+    def resolve_scopes(self, tags: Optional[List[str]] = None) -> List[str]:
+        """
+        Resolve the budget chain for a set of tags.
+
+        Walks from each tagged scope up through its parents, most specific
+        first, always ending with the global budget when one is configured.
+
+        Args:
+            tags: Request tags (e.g. ["tenant:acme", "agent:planner"])
+
+        Returns:
+            Ordered, de-duplicated list of scopes with budgets
+        """
+        scopes: List[str] = []
+        for tag in tags or []:
+            scope: Optional[str] = tag
+            while scope is not None and scope in self._budgets and scope not in scopes:
+                scopes.append(scope)
+                scope = self._budgets[scope].parent
+        if GLOBAL_SCOPE in self._budgets and GLOBAL_SCOPE not in scopes:
+            scopes.append(GLOBAL_SCOPE)
+        return scopes
+
+    def admit(
+        self,
+        messages: List[Dict[str, Any]],
+        model: str,
+        max_tokens: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+    ) -> BudgetDecision:
+        """
+        Decide whether a request may be dispatched.
+
+        Estimates the request's cost on the requested model. If it fits every
+        budget in the chain the cost is reserved and the request is allowed.
+        Otherwise cheaper models from the same capability tier are tried,
+        most expensive first, so quality degrades as little as possible.
+        Models without registry pricing are allowed unreserved unless a
+        budget in the chain is already spent.
+
+        Args:
+            messages: Message list that will be sent
+            model: Requested model name
+            max_tokens: Completion limit used for the estimate
+            tags: Request tags used to resolve the budget chain
+
+        Returns:
+            BudgetDecision (REJECT decisions hold no reservation)
+        """
+        scopes = self.resolve_scopes(tags)
+        model_info = get_model_info(model)
+
+        if scopes and model_info is None:
+            # Unpriced model (e.g. local): no estimate, but a spent budget still rejects
+            with self._lock:
+                now = datetime.utcnow()
+                for scope in scopes:
+                    budget = self._budgets[scope]
+                    spent = self._current_spend(budget, now)
+                    if spent >= budget.limit_usd:
+                        self._fire_hard(budget, now)
+                        return BudgetDecision(
+                            action=BudgetAction.REJECT,
+                            model=model,
+                            requested_model=model,
+                            scopes=scopes,
+                            limiting_scope=scope,
+                            reason=(
+                                f"Budget '{scope}' exhausted: "
+                                f"${spent:.4f} spent of ${budget.limit_usd:.4f}"
+                            ),
+                        )
+
+        if not scopes or model_info is None:
+            return BudgetDecision(
+                action=BudgetAction.ALLOW,
+                model=model,
+                requested_model=model,
+                scopes=scopes,
+            )
+
+        estimate = estimate_request_cost(messages, model_info, max_tokens)
+
+        with self._lock:
+            now = datetime.utcnow()
+            limiting = self._first_exceeded(scopes, estimate, now)
+            if limiting is None:
+                return self._reserve(
+                    BudgetDecision(
+                        action=BudgetAction.ALLOW,
+                        model=model,
+                        requested_model=model,
+                        estimated_cost_usd=estimate,
+                        scopes=scopes,
+                    )
+                )
+
+            downgrade_allowed = all(
+                self._budgets[s].allow_downgrade for s in scopes
+            )
+            if downgrade_allowed:
+                for candidate, candidate_cost in self._cheaper_candidates(
+                    messages, model_info, max_tokens, estimate
+                ):
+                    if self._first_exceeded(scopes, candidate_cost, now) is None:
+                        return self._reserve(
+                            BudgetDecision(
+                                action=BudgetAction.DOWNGRADE,
+                                model=candidate,
+                                requested_model=model,
+                                estimated_cost_usd=candidate_cost,
+                                scopes=scopes,
+                                limiting_scope=limiting.scope,
+                                reason=(
+                                    f"Budget '{limiting.scope}' cannot cover "
+                                    f"${estimate:.4f} on {model}"
+                                ),
+                            )
+                        )
+
+            self._fire_hard(limiting, now)
+            return BudgetDecision(
+                action=BudgetAction.REJECT,
+                model=model,
+                requested_model=model,
+                estimated_cost_usd=estimate,
+                scopes=scopes,
+                limiting_scope=limiting.scope,
+                reason=(
+                    f"Budget '{limiting.scope}' exhausted: "
+                    f"${self._current_spend(limiting, now):.4f} spent of "
+                    f"${limiting.limit_usd:.4f}"
+                ),
+            )
+
+    def commit(self, decision: BudgetDecision, actual_cost_usd: float) -> None:
+        """
+        Record the real cost of an admitted request and drop its reservation.
+
+        Args:
+            decision: Decision returned by admit()
+            actual_cost_usd: Cost reported by the provider response
+        """
+        with self._lock:
+            self._drop_reservation(decision)
+            self._add_spend(decision.scopes, actual_cost_usd)
+
+    def release(self, decision: BudgetDecision) -> None:
+        """Drop the reservation of a request that failed before completing."""
+        with self._lock:
+            self._drop_reservation(decision)
+
+    def record(self, cost_usd: float, tags: Optional[List[str]] = None) -> None:
+        """
+        Record spend that bypassed admission (e.g. streaming or external calls).
+
+        Args:
+            cost_usd: Cost in USD
+            tags: Tags used to resolve the budget chain
+        """
+        with self._lock:
+            self._add_spend(self.resolve_scopes(tags), cost_usd)
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get spend status for every configured budget.
+
+        Returns:
+            Dict keyed by scope with limit, spent, reserved, and remaining amounts
+
+        Example:
+            >>> status = budgets.get_status()
+            >>> print(status["global"]["remaining_usd"])
+        """
+        with self._lock:
+            now = datetime.utcnow()
+            status = {}
+            for scope, budget in self._budgets.items():
+                spent = self._current_spend(budget, now)
+                reserved = self._reserved.get(scope, 0.0)
+                status[scope] = {
+                    "limit_usd": budget.limit_usd,
+                    "spent_usd": spent,
+                    "reserved_usd": reserved,
+                    "remaining_usd": max(0.0, budget.limit_usd - spent - reserved),
+                    "percentage_used": (
+                        spent / budget.limit_usd * 100 if budget.limit_usd else 100.0
+                    ),
+                    "parent": budget.parent,
+                    "period": budget.period,
+                }
+            return status
+
+    def reset(self) -> None:
+        """Clear all recorded spend, reservations, and alert state."""
+        with self._lock:
+            self._spend.clear()
+            self._reserved.clear()
+            self._reservations.clear()
+            self._alerted.clear()
+
+    # ========== INTERNALS (caller holds self._lock) ==========
+
+    def _current_spend(self, budget: Budget, now: datetime) -> float:
+        """Spend for a budget in the current period, resetting stale windows."""
+        key = _period_key(BudgetPeriod(budget.period), now)
+        stored_key, amount = self._spend.get(budget.scope, (key, 0.0))
+        if stored_key != key:
+            self._spend[budget.scope] = (key, 0.0)
+            return 0.0
+        return amount
+
+    def _first_exceeded(
+        self,
+        scopes: List[str],
+        estimate: float,
+        now: datetime
+    ) -> Optional[Budget]:
+        """Return the first budget in the chain that cannot cover the estimate."""
+        for scope in scopes:
+            budget = self._budgets[scope]
+            projected = (
+                self._current_spend(budget, now)
+                + self._reserved.get(scope, 0.0)
+                + estimate
+            )
+            if projected > budget.limit_usd:
+                return budget
+        return None
+
+    def _cheaper_candidates(
+        self,
+        messages: List[Dict[str, Any]],
+        model_info: ModelInfo,
+        max_tokens: Optional[int],
+        estimate: float
+    ) -> List[Tuple[str, float]]:
+        """Models in the same capability tier that are cheaper, priciest first."""
+        candidates = []
+        for name in get_models_by_capability(model_info.capability):
+            info = get_model_info(name)
+            if info is None or name == model_info.model_name:
+                continue
+            cost = estimate_request_cost(messages, info, max_tokens)
+            if cost < estimate:
+                candidates.append((name, cost))
+        candidates.sort(key=lambda item: item[1], reverse=True)
+        return candidates
+
+    def _reserve(self, decision: BudgetDecision) -> BudgetDecision:
+        """Hold the estimated cost against every scope in the chain."""
+        decision.reservation_id = uuid.uuid4().hex
+        self._reservations[decision.reservation_id] = (
+            decision.scopes,
+            decision.estimated_cost_usd,
+        )
+        for scope in decision.scopes:
+            self._reserved[scope] = self._reserved.get(scope, 0.0) + decision.estimated_cost_usd
+        return decision
+
+    def _drop_reservation(self, decision: BudgetDecision) -> None:
+        """Release a reservation created by _reserve (no-op if already released)."""
+        if not decision.reservation_id:
+            return
+        scopes, amount = self._reservations.pop(decision.reservation_id, ([], 0.0))
+        for scope in scopes:
+            self._reserved[scope] = max(0.0, self._reserved.get(scope, 0.0) - amount)
+        decision.reservation_id = None
+
+    def _add_spend(self, scopes: List[str], cost_usd: float) -> None:
+        """Add committed spend and fire threshold callbacks."""
+        now = datetime.utcnow()
+        for scope in scopes:
+            budget = self._budgets.get(scope)
+            if budget is None:
+                continue
+            spent = self._current_spend(budget, now) + cost_usd
+            self._spend[scope] = (_period_key(BudgetPeriod(budget.period), now), spent)
+
+            if spent >= budget.limit_usd:
+                self._fire_hard(budget, now)
+            elif spent >= budget.limit_usd * budget.soft_threshold:
+                self._fire_soft(budget, now)
+
+    def _fire_soft(self, budget: Budget, now: datetime) -> None:
+        """Invoke on_soft_limit once per budget period."""
+        key = (budget.scope, _period_key(BudgetPeriod(budget.period), now), "soft")
+        if self._alerted.get(key):
+            return
+        self._alerted[key] = True
+        if self.on_soft_limit:
+            self.on_soft_limit(budget, self._current_spend(budget, now))
+
+    def _fire_hard(self, budget: Budget, now: datetime) -> None:
+        """Invoke on_hard_limit once per budget period."""
+        key = (budget.scope, _period_key(BudgetPeriod(budget.period), now), "hard")
+        if self._alerted.get(key):
+            return
+        self._alerted[key] = True
+        if self.on_hard_limit:
+            self.on_hard_limit(budget, self._current_spend(budget, now))
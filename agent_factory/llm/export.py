@@ -0,0 +1,289 @@
+"""
+Usage Export - Streaming Exporters for Tracked LLM Calls
+
+Writes UsageTracker data incrementally to a file path or file-like object
+so exports of millions of calls run in constant memory. Supports CSV,
+JSONL, and (when pyarrow is installed) Parquet in row-group batches.
+
+Records can be filtered by time range and tags, and "key:value" tags can
+be projected into their own columns (e.g. tag_keys=["user"] turns
+"user:123" into a "tag_user" column with value "123"; the prefix keeps
+them from colliding with base columns such as "model").
+
+Part of Phase 6: Usage Analytics
+"""
+
+import csv
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .types import LLMResponse
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+
+# Base columns, in the order export_to_csv() has always used
+BASE_COLUMNS = [
+    "timestamp",
+    "provider",
+    "model",
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "input_cost_usd",
+    "output_cost_usd",
+    "total_cost_usd",
+    "latency_ms",
+    "finish_reason",
+]
+
+# Fixed-precision formatting kept for CSV backward compatibility
+_CSV_FORMATS = {
+    "input_cost_usd": "{:.6f}",
+    "output_cost_usd": "{:.6f}",
+    "total_cost_usd": "{:.6f}",
+    "latency_ms": "{:.2f}",
+}
+
+# Prefix for projected tag columns ("user" -> "tag_user")
+TAG_COLUMN_PREFIX = "tag_"
+
+Destination = Union[str, Path, IO]
+
+
+def tag_column(key: str) -> str:
+    """Column name for a projected tag key."""
+    return f"{TAG_COLUMN_PREFIX}{key}"
+
+
+def build_columns(
+    include_tags: bool = False,
+    tag_keys: Optional[Sequence[str]] = None
+) -> List[str]:
+    """
+    Get the column list for an export.
+
+    Args:
+        include_tags: Add a "tags" column with all tags of each call
+        tag_keys: Tag prefixes to project into their own "tag_<key>" columns
+
+    Returns:
+        Ordered column names
+    """
+    columns = list(BASE_COLUMNS)
+    if include_tags:
+        columns.append("tags")
+    columns.extend(tag_column(key) for key in dict.fromkeys(tag_keys or []))
+    return columns
+
+
+def iter_usage_records(
+    calls: Iterable[Tuple[LLMResponse, Sequence[str]]],
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    tags: Optional[Sequence[str]] = None,
+    tag_keys: Optional[Sequence[str]] = None,
+    include_tags: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily convert tracked calls into flat export records.
+
+    Args:
+        calls: Iterable of (response, tags) pairs, e.g. UsageTracker.iter_calls()
+        since: Only include calls at or after this timestamp
+        until: Only include calls before this timestamp
+        tags: Only include calls carrying every one of these tags
+        tag_keys: Tag prefixes to project into "tag_<key>" fields ("user" for "user:123")
+        include_tags: Include the full tag list as a "tags" field
+
+    Yields:
+        One dict per matching call
+    """
+    required = set(tags or [])
+
+    for call, call_tags in calls:
+        if since and call.timestamp < since:
+            continue
+        if until and call.timestamp >= until:
+            continue
+        if required and not required.issubset(call_tags):
+            continue
+
+        # Handle both string and enum provider values
+        provider_key = call.provider if isinstance(call.provider, str) else call.provider.value
+
+        record: Dict[str, Any] = {
+            "timestamp": call.timestamp.isoformat(),
+            "provider": provider_key,
+            "model": call.model,
+            "input_tokens": call.usage.input_tokens,
+            "output_tokens": call.usage.output_tokens,
+            "total_tokens": call.usage.total_tokens,
+            "input_cost_usd": call.usage.input_cost_usd,
+            "output_cost_usd": call.usage.output_cost_usd,
+            "total_cost_usd": call.usage.total_cost_usd,
+            "latency_ms": call.latency_ms,
+            "finish_reason": call.finish_reason,
+        }
+
+        if include_tags:
+            record["tags"] = list(call_tags)
+
+        for key in tag_keys or []:
+            prefix = f"{key}:"
+            record[tag_column(key)] = next(
+                (t[len(prefix):] for t in call_tags if t.startswith(prefix)),
+                None
+            )
+
+        yield record
+
+
+def _csv_row(record: Dict[str, Any], columns: List[str]) -> List[str]:
+    """Format one record as CSV cells."""
+    row = []
+    for column in columns:
+        value = record.get(column)
+        if value is None:
+            row.append("")
+        elif column in _CSV_FORMATS:
+            row.append(_CSV_FORMATS[column].format(value))
+        elif isinstance(value, list):
+            row.append(";".join(value))
+        else:
+            row.append(str(value))
+    return row
+
+
+def write_csv(records: Iterable[Dict[str, Any]], stream: IO, columns: List[str]) -> int:
+    """
+    Write records to a text stream as CSV, one row at a time.
+
+    Returns:
+        Number of data rows written
+    """
+    writer = csv.writer(stream, lineterminator="\n")
+    writer.writerow(columns)
+    count = 0
+    for record in records:
+        writer.writerow(_csv_row(record, columns))
+        count += 1
+    return count
+
+
+def write_jsonl(records: Iterable[Dict[str, Any]], stream: IO, columns: List[str]) -> int:
+    """
+    Write records to a text stream as JSON Lines.
+
+    Returns:
+        Number of records written
+    """
+    count = 0
+    for record in records:
+        stream.write(json.dumps({c: record.get(c) for c in columns}))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def write_parquet(
+    records: Iterable[Dict[str, Any]],
+    destination: Destination,
+    columns: List[str],
+    batch_size: int = 10000
+) -> int:
+    """
+    Write records as Parquet, flushing one row group per batch.
+
+    Requires pyarrow. Memory use is bounded by batch_size.
+
+    Returns:
+        Number of records written
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow not installed. Run: poetry add pyarrow"
+        ) from e
+
+    fields = []
+    for column in columns:
+        if column in ("input_tokens", "output_tokens", "total_tokens"):
+            fields.append(pa.field(column, pa.int64()))
+        elif column in ("input_cost_usd", "output_cost_usd", "total_cost_usd", "latency_ms"):
+            fields.append(pa.field(column, pa.float64()))
+        elif column == "tags":
+            fields.append(pa.field(column, pa.list_(pa.string())))
+        else:
+            fields.append(pa.field(column, pa.string()))
+    schema = pa.schema(fields)
+
+    sink = str(destination) if isinstance(destination, (str, Path)) else destination
+    count = 0
+    batch: List[Dict[str, Any]] = []
+
+    with pq.ParquetWriter(sink, schema) as writer:
+        for record in records:
+            batch.append({c: record.get(c) for c in columns})
+            if len(batch) >= batch_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+                batch = []
+        if batch or count == 0:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+
+    return count
+
+
+def export_usage(
+    calls: Iterable[Tuple[LLMResponse, Sequence[str]]],
+    destination: Destination,
+    format: str = "csv",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    tags: Optional[Sequence[str]] = None,
+    tag_keys: Optional[Sequence[str]] = None,
+    include_tags: bool = False,
+    batch_size: int = 10000
+) -> int:
+    """
+    Stream tracked calls to a file path or file-like object.
+
+    Args:
+        calls: Iterable of (response, tags) pairs, e.g. UsageTracker.iter_calls()
+        destination: Path or open file (text mode for csv/jsonl, binary for parquet)
+        format: One of "csv", "jsonl", "parquet"
+        since: Only include calls at or after this timestamp
+        until: Only include calls before this timestamp
+        tags: Only include calls carrying every one of these tags
+        tag_keys: Tag prefixes to project into "tag_<key>" columns
+        include_tags: Include the full tag list as a "tags" column
+        batch_size: Rows per Parquet row group
+
+    Returns:
+        Number of records written
+
+    Example:
+        >>> export_usage(tracker.iter_calls(), "usage.jsonl", format="jsonl",
+        ...              since=datetime(2025, 12, 1), tag_keys=["user", "agent"])
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format '{format}'. Use one of: {EXPORT_FORMATS}")
+
+    columns = build_columns(include_tags, tag_keys)
+    records = iter_usage_records(calls, since, until, tags, tag_keys, include_tags)
+
+    if format == "parquet":
+        return write_parquet(records, destination, columns, batch_size)
+
+    writer = write_csv if format == "csv" else write_jsonl
+
+    if isinstance(destination, (str, Path)):
+        with open(destination, "w", encoding="utf-8", newline="") as stream:
+            return writer(records, stream, columns)
+
+    return writer(records, destination, columns)
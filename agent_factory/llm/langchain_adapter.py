@@ -24,6 +24,7 @@ from .router import LLMRouter
 from .types import LLMConfig, LLMProvider, ModelCapability, LLMResponse
 from .config import get_cheapest_model, DEFAULT_MODELS
 from .tracker import get_global_tracker
+from ..observability.hooks import HOOKS, MESSAGE_CONVERSION
 
 # Pydantic V2/V1 shim
 try:
@@ -104,23 +105,32 @@ class RoutedChatModel(BaseChatModel):
         messages: List[BaseMessage]
     ) -> List[Dict[str, str]]:
         """Convert LangChain messages to LiteLLM format."""
+        hook_ctx = HOOKS.fire_pre(MESSAGE_CONVERSION, count=len(messages)) if HOOKS.active else None
         litellm_messages = []
 
-        for msg in messages:
-            if isinstance(msg, HumanMessage):
-                role = "user"
-            elif isinstance(msg, AIMessage):
-                role = "assistant"
-            elif isinstance(msg, SystemMessage):
-                role = "system"
-            else:
-                # Default to user for unknown types
-                role = "user"
-
-            litellm_messages.append({
-                "role": role,
-                "content": msg.content
-            })
+        try:
+            for msg in messages:
+                if isinstance(msg, HumanMessage):
+                    role = "user"
+                elif isinstance(msg, AIMessage):
+                    role = "assistant"
+                elif isinstance(msg, SystemMessage):
+                    role = "system"
+                else:
+                    # Default to user for unknown types
+                    role = "user"
+
+                litellm_messages.append({
+                    "role": role,
+                    "content": msg.content
+                })
+        except BaseException as e:
+            if hook_ctx is not None:
+                HOOKS.fire_post(hook_ctx, error=e)
+            raise
+
+        if hook_ctx is not None:
+            HOOKS.fire_post(hook_ctx, result=litellm_messages)
 
         return litellm_messages
 
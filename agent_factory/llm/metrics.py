@@ -0,0 +1,445 @@
+"""
+Metrics - Prometheus/OpenMetrics Exposition for Router and Tracker
+
+Dependency-free counters, gauges, and histograms that LLMRouter updates on
+every call, rendered in the Prometheus text exposition format. Scrape them
+through the built-in HTTP endpoint or call render() from your own server.
+
+Nothing here talks to an external service; metrics live in-process.
+
+Usage:
+    >>> metrics = LLMMetrics()
+    >>> router = LLMRouter(metrics=metrics)
+    >>> server = serve_metrics(metrics, port=9464, tracker=get_global_tracker())
+    >>> # curl localhost:9464/metrics
+
+Part of Phase 6: Observability
+"""
+
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Latency buckets in seconds, sized for LLM calls (sub-second to minutes)
+DEFAULT_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape_label(value: str) -> str:
+    """Escape a label value per the exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value (integers without trailing .0)."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Render a {name="value",...} label set (empty string if no labels)."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape_label(str(v))}"' for n, v in zip(names, values, strict=True))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    metric_type = "untyped"
+    # Sample-name suffix that OpenMetrics leaves off the family name
+    openmetrics_suffix = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        """Order label values to match label_names."""
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def family(self, openmetrics: bool = False) -> str:
+        """Metric family name used in HELP/TYPE lines."""
+        suffix = self.openmetrics_suffix
+        if openmetrics and suffix and self.name.endswith(suffix):
+            return self.name[:-len(suffix)]
+        return self.name
+
+    def header(self, openmetrics: bool = False) -> List[str]:
+        """HELP and TYPE lines."""
+        family = self.family(openmetrics)
+        return [
+            f"# HELP {family} {self.documentation}",
+            f"# TYPE {family} {self.metric_type}",
+        ]
+
+    def samples(self) -> List[str]:
+        """Sample lines (implemented by subclasses)."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value."""
+
+    metric_type = "counter"
+    openmetrics_suffix = "_total"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the counter (amount must be non-negative)."""
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: Any) -> float:
+        """Current value for a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge."""
+        with self._lock:
+            self._values[self._key(labels)] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the gauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Decrease the gauge."""
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: Any) -> float:
+        """Current value for a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def clear(self) -> None:
+        """Drop all label sets (used by scrape-time collectors)."""
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """Cumulative bucketed distribution with sum and count."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> (per-bucket counts incl. +Inf, sum, count)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record one observation."""
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(
+                key, ([0] * (len(self.buckets) + 1), 0.0, 0)
+            )
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = [(k, (list(c), s, n)) for k, (c, s, n) in self._values.items()]
+
+        lines = []
+        names = self.label_names + ("le",)
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts, strict=True):
+                cumulative += bucket_count
+                labels = _format_labels(names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            base = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{base} {_format_value(total)}")
+            lines.append(f"{self.name}_count{base} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric (names must be unique)."""
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric '{metric.name}' already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        """Create and register a Counter."""
+        return self.register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        """Create and register a Gauge."""
+        return self.register(Gauge(name, documentation, labels))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> Histogram:
+        """Create and register a Histogram."""
+        return self.register(Histogram(name, documentation, labels, buckets))
+
+    def render(self, openmetrics: bool = False) -> str:
+        """
+        Render every metric in text exposition format.
+
+        Args:
+            openmetrics: Render OpenMetrics (counter families without _total,
+                "# EOF" terminator) instead of Prometheus text 0.0.4
+
+        Returns:
+            Exposition text
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.header(openmetrics))
+            lines.extend(metric.samples())
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+class LLMMetrics:
+    """
+    Standard metric set for LLMRouter and UsageTracker.
+
+    The router updates request, error, latency, token, cost, cache, and
+    in-flight metrics as calls happen. Tracker aggregates (cost by tag,
+    budget status) are collected at scrape time by render(tracker=...).
+
+    Example:
+        >>> metrics = LLMMetrics()
+        >>> router = LLMRouter(metrics=metrics)
+        >>> print(metrics.render(tracker=get_global_tracker()))
+    """
+
+    def __init__(self, namespace: str = "agent_factory"):
+        """
+        Initialize the metric set.
+
+        Args:
+            namespace: Prefix for every metric name
+        """
+        self.registry = MetricsRegistry()
+        p = namespace
+
+        self.requests = self.registry.counter(
+            f"{p}_llm_requests_total", "LLM requests by outcome", ("provider", "model", "status")
+        )
+        self.errors = self.registry.counter(
+            f"{p}_llm_errors_total", "LLM request errors by exception type",
+            ("provider", "model", "error_type")
+        )
+        self.latency = self.registry.histogram(
+            f"{p}_llm_request_latency_seconds", "LLM request latency", ("provider", "model")
+        )
+        self.tokens = self.registry.counter(
+            f"{p}_llm_tokens_total", "Tokens processed", ("provider", "model", "direction")
+        )
+        self.cost = self.registry.counter(
+            f"{p}_llm_cost_usd_total", "Spend in USD", ("provider", "model")
+        )
+        self.cache_requests = self.registry.counter(
+            f"{p}_llm_cache_requests_total", "Response cache lookups", ("result",)
+        )
+        self.cache_hit_ratio = self.registry.gauge(
+            f"{p}_llm_cache_hit_ratio", "Response cache hits / lookups"
+        )
+        self.budget_rejections = self.registry.counter(
+            f"{p}_llm_budget_rejections_total", "Requests rejected or downgraded by budget",
+            ("scope", "action")
+        )
+        self.in_flight = self.registry.gauge(
+            f"{p}_llm_in_flight_requests", "LLM requests currently being processed"
+        )
+        self.queue_depth = self.registry.gauge(
+            f"{p}_queue_depth", "Items waiting in work queues", ("queue",)
+        )
+        self.tracker_cost = self.registry.gauge(
+            f"{p}_tracker_cost_usd", "Tracked spend in USD by tag", ("tag",)
+        )
+        self.tracker_calls = self.registry.gauge(
+            f"{p}_tracker_calls", "Tracked calls by tag", ("tag",)
+        )
+        self.tracker_total_cost = self.registry.gauge(
+            f"{p}_tracker_total_cost_usd", "Total tracked spend in USD"
+        )
+        self.tracker_budget_remaining = self.registry.gauge(
+            f"{p}_tracker_budget_remaining_usd", "Remaining tracker budget in USD"
+        )
+
+    # ========== ROUTER HOOKS ==========
+
+    def observe_success(
+        self,
+        provider: str,
+        model: str,
+        latency_ms: float,
+        input_tokens: int,
+        output_tokens: int,
+        cost_usd: float
+    ) -> None:
+        """Record a successful provider call."""
+        self.requests.inc(provider=provider, model=model, status="success")
+        self.latency.observe(latency_ms / 1000.0, provider=provider, model=model)
+        self.tokens.inc(input_tokens, provider=provider, model=model, direction="input")
+        self.tokens.inc(output_tokens, provider=provider, model=model, direction="output")
+        self.cost.inc(cost_usd, provider=provider, model=model)
+
+    def observe_error(self, provider: str, model: str, error: BaseException) -> None:
+        """Record a failed provider call attempt."""
+        self.requests.inc(provider=provider, model=model, status="error")
+        self.errors.inc(provider=provider, model=model, error_type=type(error).__name__)
+
+    def observe_cache(self, hit: bool) -> None:
+        """Record a response cache lookup."""
+        self.cache_requests.inc(result="hit" if hit else "miss")
+        hits = self.cache_requests.get(result="hit")
+        total = hits + self.cache_requests.get(result="miss")
+        self.cache_hit_ratio.set(hits / total if total else 0.0)
+
+    def set_queue_depth(self, queue: str, depth: int) -> None:
+        """Publish the depth of a named work queue."""
+        self.queue_depth.set(depth, queue=queue)
+
+    # ========== SCRAPE ==========
+
+    def collect_tracker(self, tracker: Any) -> None:
+        """Refresh tracker-derived gauges from a UsageTracker."""
+        self.tracker_cost.clear()
+        self.tracker_calls.clear()
+        for tag, totals in tracker.get_tag_totals().items():
+            self.tracker_cost.set(totals["total_cost_usd"], tag=tag)
+            self.tracker_calls.set(totals["total_calls"], tag=tag)
+        self.tracker_total_cost.set(tracker.get_total_cost())
+        remaining = tracker.get_budget_status().get("remaining_usd")
+        if remaining is not None:
+            self.tracker_budget_remaining.set(remaining)
+
+    def render(self, tracker: Any = None, openmetrics: bool = False) -> str:
+        """
+        Render all metrics as exposition text.
+
+        Args:
+            tracker: Optional UsageTracker to collect tag/budget gauges from
+            openmetrics: Render OpenMetrics instead of Prometheus text 0.0.4
+
+        Returns:
+            Exposition text
+        """
+        if tracker is not None:
+            self.collect_tracker(tracker)
+        return self.registry.render(openmetrics=openmetrics)
+
+
+def serve_metrics(
+    metrics: LLMMetrics,
+    port: int = 9464,
+    host: str = "127.0.0.1",
+    tracker: Any = None
+) -> ThreadingHTTPServer:
+    """
+    Serve /metrics over HTTP from a background daemon thread.
+
+    Args:
+        metrics: LLMMetrics to expose
+        port: Port to listen on (0 picks a free port)
+        host: Interface to bind (localhost by default)
+        tracker: Optional UsageTracker collected on every scrape
+
+    Returns:
+        Running server (call .shutdown() to stop)
+    """
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+            body = metrics.render(tracker=tracker, openmetrics=openmetrics).encode("utf-8")
+            self.send_response(200)
+            self.send_header(
+                "Content-Type",
+                OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE
+            )
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # Keep scrapes out of the console
+
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    return server
@@ -10,7 +10,7 @@ Phase 2: Intelligent routing (select cheapest capable model)
 Part of Phase 1: LLM Abstraction Layer
 """
 
-from typing import Optional, Dict, Any, List, Iterator
+from typing import Optional, Dict, Any, List, Iterator, Callable
 import time
 from datetime import datetime
 
@@ -38,6 +38,10 @@ from .config import (
 )
 from .cache import ResponseCache
 from .streaming import stream_complete, collect_stream, StreamChunk
+from .budget import BudgetManager, BudgetAction, BudgetDecision
+from .metrics import LLMMetrics
+from ..observability.tracing import traced, set_span_attributes
+from ..observability.hooks import HOOKS, CACHE_LOOKUP, ROUTER_DISPATCH
 
 
 class LLMRouterError(Exception):
@@ -55,6 +59,14 @@ class ProviderAPIError(LLMRouterError):
     pass
 
 
+class BudgetExceededError(LLMRouterError):
+    """Raised when a request is rejected by budget admission control"""
+
+    def __init__(self, message: str, decision: Optional[BudgetDecision] = None):
+        super().__init__(message)
+        self.decision = decision
+
+
 class LLMRouter:
     """
     Unified router for multiple LLM providers.
@@ -65,6 +77,8 @@ class LLMRouter:
     - Error handling with retries
     - Support for streaming (future)
     - Foundation for intelligent routing (Phase 2)
+    - Pre-call budget admission control (Phase 6)
+    - Optional Prometheus metrics (Phase 6)
 
     Example:
         >>> router = LLMRouter()
@@ -79,7 +93,9 @@ class LLMRouter:
         retry_delay: float = 1.0,
         enable_fallback: bool = False,
         enable_cache: bool = False,
-        cache: Optional[ResponseCache] = None
+        cache: Optional[ResponseCache] = None,
+        budget: Optional[BudgetManager] = None,
+        metrics: Optional[LLMMetrics] = None
     ):
         """
         Initialize LLM router.
@@ -90,12 +106,16 @@ class LLMRouter:
             enable_fallback: Enable fallback to cheaper models on failure (Phase 2)
             enable_cache: Enable response caching (Phase 2 Day 3)
             cache: Optional ResponseCache instance (creates new if None)
+            budget: Optional BudgetManager for pre-call admission control (Phase 6)
+            metrics: Optional LLMMetrics updated on every call (Phase 6)
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.enable_fallback = enable_fallback
         self.enable_cache = enable_cache
         self.cache = cache if cache is not None else ResponseCache()
+        self.budget = budget
+        self.metrics = metrics
 
     def complete(
         self,
@@ -117,6 +137,10 @@ class LLMRouter:
         Raises:
             ModelNotFoundError: If model doesn't exist in registry
             ProviderAPIError: If all models (primary + fallbacks) fail
+            BudgetExceededError: If every model in the chain is rejected by the budget
+
+        Budget tags are read from ``config.metadata["tags"]`` (e.g.
+        ``["tenant:acme", "agent:planner"]``) when a BudgetManager is attached.
 
         Example:
             >>> messages = [{"role": "user", "content": "Hello!"}]
@@ -129,8 +153,18 @@ class LLMRouter:
         """
         # Check cache first (Phase 2 Day 3)
         if self.enable_cache:
-            cache_key = self.cache.generate_key(messages, config)
-            cached_response = self.cache.get(cache_key)
+            hook_ctx = HOOKS.fire_pre(CACHE_LOOKUP, model=config.model) if HOOKS.active else None
+            try:
+                cache_key = self.cache.generate_key(messages, config)
+                cached_response = self.cache.get(cache_key)
+            except BaseException as e:
+                if hook_ctx is not None:
+                    HOOKS.fire_post(hook_ctx, error=e)
+                raise
+            if hook_ctx is not None:
+                HOOKS.fire_post(hook_ctx, result=cached_response)
+            if self.metrics is not None:
+                self.metrics.observe_cache(hit=bool(cached_response))
             if cached_response:
                 # Cache hit - return cached response
                 return cached_response
@@ -142,7 +176,9 @@ class LLMRouter:
 
         fallback_events: List[FallbackEvent] = []
         last_error = None
+        budget_decision: Optional[BudgetDecision] = None
         overall_start_time = time.time()
+        budget_tags = config.metadata.get("tags") or []
 
         # Try each model in chain
         for attempt_num, model_name in enumerate(model_chain, start=1):
@@ -150,9 +186,27 @@ class LLMRouter:
             if not validate_model_exists(model_name):
                 continue  # Skip invalid models
 
+            # Budget admission (Phase 6): allow, downgrade, or reject before dispatch
+            decision: Optional[BudgetDecision] = None
+            if self.budget is not None:
+                decision = self.budget.admit(
+                    messages, model_name, config.max_tokens, tags=budget_tags
+                )
+                if self.metrics is not None and decision.action != BudgetAction.ALLOW:
+                    self.metrics.budget_rejections.inc(
+                        scope=decision.limiting_scope, action=decision.action
+                    )
+                if decision.action == BudgetAction.REJECT:
+                    budget_decision = decision
+                    last_error = BudgetExceededError(decision.reason, decision)
+                    continue
+                model_name = decision.model
+
             # Get model metadata
             model_info = get_model_info(model_name)
             if not model_info:
+                if decision is not None:
+                    self.budget.release(decision)
                 continue
 
             # Build config for this model
@@ -167,9 +221,51 @@ class LLMRouter:
                 metadata=config.metadata
             )
 
+            hook_ctx = (
+                HOOKS.fire_pre(ROUTER_DISPATCH, model=model_name, attempt=attempt_num)
+                if HOOKS.active else None
+            )
             try:
                 # Try this model with retries
                 response = self._try_single_model(messages, model_config, model_info, **kwargs)
+            except Exception as e:
+                # Only dispatch failures release the reservation and fall back
+                last_error = e
+                if hook_ctx is not None:
+                    HOOKS.fire_post(hook_ctx, error=e)
+                if decision is not None:
+                    self.budget.release(decision)
+
+                # Record fallback event if this wasn't the last model
+                if attempt_num < len(model_chain):
+                    fallback_time_ms = (time.time() - overall_start_time) * 1000
+                    fallback_event = FallbackEvent(
+                        primary_model=config.model,
+                        fallback_model=(
+                            model_chain[attempt_num] if attempt_num < len(model_chain) else "none"
+                        ),
+                        failure_reason=str(e),
+                        attempt_number=attempt_num,
+                        latency_ms=fallback_time_ms,
+                        succeeded=False
+                    )
+                    fallback_events.append(fallback_event)
+            except BaseException as e:
+                # Interrupted (e.g. KeyboardInterrupt): close the hook and reservation, no fallback
+                if hook_ctx is not None:
+                    HOOKS.fire_post(hook_ctx, error=e)
+                if decision is not None:
+                    self.budget.release(decision)
+                raise
+            else:
+                if hook_ctx is not None:
+                    HOOKS.fire_post(hook_ctx, result=response)
+
+                if decision is not None:
+                    self.budget.commit(decision, response.usage.total_cost_usd)
+                    if decision.action == BudgetAction.DOWNGRADE:
+                        response.metadata["budget_downgraded_from"] = decision.requested_model
+                        response.metadata["budget_limiting_scope"] = decision.limiting_scope
 
                 # Success! Add fallback metadata if we used a fallback
                 if attempt_num > 1:
@@ -186,21 +282,11 @@ class LLMRouter:
 
                 return response
 
-            except Exception as e:
-                last_error = e
-
-                # Record fallback event if this wasn't the last model
-                if attempt_num < len(model_chain):
-                    fallback_time_ms = (time.time() - overall_start_time) * 1000
-                    fallback_event = FallbackEvent(
-                        primary_model=config.model,
-                        fallback_model=model_chain[attempt_num] if attempt_num < len(model_chain) else "none",
-                        failure_reason=str(e),
-                        attempt_number=attempt_num,
-                        latency_ms=fallback_time_ms,
-                        succeeded=False
-                    )
-                    fallback_events.append(fallback_event)
+        # Every model was refused by the budget - surface that instead of a provider error
+        if isinstance(last_error, BudgetExceededError):
+            raise BudgetExceededError(
+                f"Request rejected by budget: {last_error}", budget_decision
+            )
 
         # All models failed - raise error
         models_tried = ", ".join(model_chain)
@@ -208,6 +294,7 @@ class LLMRouter:
             f"All models failed ({models_tried}). Last error: {str(last_error)}"
         ) from last_error
 
+    @traced("llm.call")
     def _try_single_model(
         self,
         messages: List[Dict[str, str]],
@@ -231,30 +318,58 @@ class LLMRouter:
             Exception: If all retries fail
         """
         last_error = None
+        metrics = self.metrics
+        provider_str = (
+            config.provider if isinstance(config.provider, str) else config.provider.value
+        )
+        set_span_attributes(provider=provider_str, model=config.model)
 
-        # Attempt with retries
-        for attempt in range(self.max_retries):
-            try:
-                start_time = time.time()
-
-                # Call LiteLLM
-                response = self._call_litellm(messages, config, **kwargs)
+        if metrics is not None:
+            metrics.in_flight.inc()
 
-                # Calculate latency
-                latency_ms = (time.time() - start_time) * 1000
+        try:
+            # Attempt with retries
+            for attempt in range(self.max_retries):
+                try:
+                    start_time = time.time()
 
-                # Extract and standardize response
-                return self._build_llm_response(response, config, model_info, latency_ms)
+                    # Call LiteLLM
+                    response = self._call_litellm(messages, config, **kwargs)
 
-            except Exception as e:
-                last_error = e
+                    # Calculate latency
+                    latency_ms = (time.time() - start_time) * 1000
 
-                # If final attempt, raise
-                if attempt == self.max_retries - 1:
-                    raise
+                    # Extract and standardize response
+                    llm_response = self._build_llm_response(
+                        response, config, model_info, latency_ms
+                    )
 
-                # Wait before retry with exponential backoff
-                time.sleep(self.retry_delay * (attempt + 1))
+                    if metrics is not None:
+                        metrics.observe_success(
+                            provider_str,
+                            config.model,
+                            latency_ms,
+                            llm_response.usage.input_tokens,
+                            llm_response.usage.output_tokens,
+                            llm_response.usage.total_cost_usd,
+                        )
+
+                    return llm_response
+
+                except Exception as e:
+                    last_error = e
+                    if metrics is not None:
+                        metrics.observe_error(provider_str, config.model, e)
+
+                    # If final attempt, raise
+                    if attempt == self.max_retries - 1:
+                        raise
+
+                    # Wait before retry with exponential backoff
+                    time.sleep(self.retry_delay * (attempt + 1))
+        finally:
+            if metrics is not None:
+                metrics.in_flight.dec()
 
         # Should never reach here, but satisfy type checker
         raise last_error if last_error else ProviderAPIError("Unexpected error")
@@ -428,6 +543,12 @@ class LLMRouter:
         Raises:
             ModelNotFoundError: If model doesn't exist in registry
             ProviderAPIError: If streaming fails
+            BudgetExceededError: If the budget rejects the request
+
+        Streams go through the same budget admission as complete(). When the
+        stream ends (or is abandoned) the cost reported in the final chunk's
+        ``metadata["usage"]["total_cost_usd"]`` is committed, or the admission
+        estimate if the provider reported none.
 
         Example:
             >>> messages = [{"role": "user", "content": "Write a story"}]
@@ -444,31 +565,68 @@ class LLMRouter:
         if not validate_model_exists(config.model):
             raise ModelNotFoundError(f"Model '{config.model}' not found in registry")
 
+        # Budget admission (Phase 6): same rules as complete(), no fallback chain
+        decision: Optional[BudgetDecision] = None
+        if self.budget is not None:
+            decision = self.budget.admit(
+                messages, config.model, config.max_tokens, tags=config.metadata.get("tags") or []
+            )
+            if self.metrics is not None and decision.action != BudgetAction.ALLOW:
+                self.metrics.budget_rejections.inc(
+                    scope=decision.limiting_scope, action=decision.action
+                )
+            if decision.action == BudgetAction.REJECT:
+                raise BudgetExceededError(
+                    f"Request rejected by budget: {decision.reason}", decision
+                )
+            if decision.model != config.model:
+                config = config.model_copy(update={"model": decision.model})
+
         # Get model info
         model_info = get_model_info(config.model)
         if not model_info:
+            if decision is not None:
+                self.budget.release(decision)
             raise ModelNotFoundError(f"Model info not found for '{config.model}'")
 
         # Force streaming
         config.stream = True
 
         # Call LiteLLM with streaming
+        observed_cost: Optional[float] = None
+        failed = False
         try:
             raw_stream = self._call_litellm(messages, config, **kwargs)
 
             # Process stream
             for chunk in stream_complete(raw_stream, config.provider, config.model):
+                usage = (chunk.metadata or {}).get("usage") or {}
+                if usage.get("total_cost_usd") is not None:
+                    observed_cost = usage["total_cost_usd"]
                 yield chunk
 
         except Exception as e:
+            failed = True
             raise ProviderAPIError(f"Streaming failed: {str(e)}") from e
+        finally:
+            if decision is not None:
+                if failed and observed_cost is None:
+                    self.budget.release(decision)
+                else:
+                    # Ended or abandoned mid-stream: tokens were generated, charge them
+                    self.budget.commit(
+                        decision,
+                        observed_cost if observed_cost is not None else decision.estimated_cost_usd,
+                    )
 
 
 def create_router(
     max_retries: int = 3,
     enable_fallback: bool = False,
     enable_cache: bool = False,
-    cache: Optional[ResponseCache] = None
+    cache: Optional[ResponseCache] = None,
+    budget: Optional[BudgetManager] = None,
+    metrics: Optional[LLMMetrics] = None
 ) -> LLMRouter:
     """
     Factory function to create LLM router.
@@ -478,6 +636,8 @@ def create_router(
         enable_fallback: Enable model fallback on failure
         enable_cache: Enable response caching (Phase 2 Day 3)
         cache: Optional ResponseCache instance
+        budget: Optional BudgetManager for pre-call admission control
+        metrics: Optional LLMMetrics to record router activity
 
     Returns:
         Configured LLMRouter instance
@@ -490,5 +650,72 @@ def create_router(
         max_retries=max_retries,
         enable_fallback=enable_fallback,
         enable_cache=enable_cache,
-        cache=cache
+        cache=cache,
+        budget=budget,
+        metrics=metrics
     )
+
+
+def budgeted_completion(
+    budget: Optional[BudgetManager],
+    messages: List[Dict[str, str]],
+    model: str,
+    dispatch: Callable[[str], Any],
+    tags: Optional[List[str]] = None,
+    max_tokens: Optional[int] = None
+) -> Any:
+    """
+    Run a direct LiteLLM call under budget admission control.
+
+    For callers that talk to LiteLLM themselves (e.g. local Ollama models
+    outside the registry) but must still share a BudgetManager with the
+    router. The admitted (possibly downgraded) model is passed to dispatch;
+    its cost is committed on success and the reservation released on error.
+
+    Args:
+        budget: BudgetManager to admit against (None = dispatch unchecked)
+        messages: Message list that will be sent
+        model: Requested model name
+        dispatch: Callable(model) that sends the request and returns the raw response
+        tags: Budget tags (e.g. ["agent:judge"])
+        max_tokens: Completion limit used for the estimate
+
+    Returns:
+        Raw LiteLLM response from dispatch
+
+    Raises:
+        BudgetExceededError: If the budget rejects the request
+
+    Example:
+        >>> response = budgeted_completion(
+        ...     budgets, messages, "qwen2.5-coder:latest",
+        ...     lambda model: completion(model=f"ollama/{model}", messages=messages),
+        ...     tags=["agent:judge"],
+        ... )
+    """
+    if budget is None:
+        return dispatch(model)
+
+    decision = budget.admit(messages, model, max_tokens, tags=tags)
+    if decision.action == BudgetAction.REJECT:
+        raise BudgetExceededError(decision.reason, decision)
+
+    try:
+        response = dispatch(decision.model)
+    except BaseException:
+        budget.release(decision)
+        raise
+
+    # Registry models are priced from reported usage; others keep the estimate
+    cost = decision.estimated_cost_usd
+    model_info = get_model_info(decision.model)
+    usage_data = getattr(response, "usage", None)
+    if model_info is not None and usage_data is not None:
+        usage = UsageStats(
+            input_tokens=getattr(usage_data, "prompt_tokens", 0) or 0,
+            output_tokens=getattr(usage_data, "completion_tokens", 0) or 0,
+        )
+        usage.calculate_costs(model_info)
+        cost = usage.total_cost_usd
+    budget.commit(decision, cost)
+    return response
@@ -10,11 +10,14 @@ multi-tenant SaaS (Phase 9).
 Part of Phase 1: LLM Abstraction Layer
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Any, Sequence, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict
+import io
 
 from .types import LLMResponse, LLMProvider, UsageStats
+from .export import Destination, export_usage
+from ..observability.hooks import HOOKS, TRACKER_UPDATE
 
 
 class UsageTracker:
@@ -36,18 +39,29 @@ class UsageTracker:
         >>> print(f"Total calls: {stats['total_calls']}")
     """
 
-    def __init__(self, budget_limit_usd: Optional[float] = None):
+    def __init__(
+        self,
+        budget_limit_usd: Optional[float] = None,
+        on_budget_exceeded: Optional[Callable[[Dict[str, Any]], None]] = None
+    ):
         """
         Initialize usage tracker.
 
         Args:
             budget_limit_usd: Optional budget limit for alerts
+            on_budget_exceeded: Callback(budget_status) fired once when the limit is reached.
+                For enforcement (blocking calls), attach a BudgetManager to LLMRouter.
         """
         self.calls: List[LLMResponse] = []
+        self._call_tags: List[Tuple[str, ...]] = []
         self.budget_limit_usd = budget_limit_usd
+        self.on_budget_exceeded = on_budget_exceeded
+        self._total_cost = 0.0
+        self._budget_alerted = False
         self._by_provider: Dict[LLMProvider, List[LLMResponse]] = defaultdict(list)
         self._by_model: Dict[str, List[LLMResponse]] = defaultdict(list)
         self._tags: Dict[str, List[LLMResponse]] = defaultdict(list)
+        self._tag_totals: Dict[str, Dict[str, float]] = {}
 
     def track(
         self,
@@ -64,26 +78,48 @@ class UsageTracker:
         Example:
             >>> tracker.track(response, tags=["user:john", "research"])
         """
-        # Add to main list
-        self.calls.append(response)
-
-        # Index by provider
-        self._by_provider[response.provider].append(response)
-
-        # Index by model
-        self._by_model[response.model].append(response)
-
-        # Index by tags
-        if tags:
-            for tag in tags:
-                self._tags[tag].append(response)
-
-        # Check budget limit
-        if self.budget_limit_usd:
-            total_cost = self.get_total_cost()
-            if total_cost >= self.budget_limit_usd:
-                # TODO: Trigger alert (Phase 6)
-                pass
+        hook_ctx = HOOKS.fire_pre(TRACKER_UPDATE, model=response.model) if HOOKS.active else None
+
+        try:
+            # Add to main list
+            self.calls.append(response)
+            self._call_tags.append(tuple(tags or ()))
+            self._total_cost += response.usage.total_cost_usd
+
+            # Index by provider
+            self._by_provider[response.provider].append(response)
+
+            # Index by model
+            self._by_model[response.model].append(response)
+
+            # Index by tags
+            if tags:
+                for tag in tags:
+                    self._tags[tag].append(response)
+                    totals = self._tag_totals.setdefault(
+                        tag, {"total_calls": 0, "total_cost_usd": 0.0, "total_tokens": 0}
+                    )
+                    totals["total_calls"] += 1
+                    totals["total_cost_usd"] += response.usage.total_cost_usd
+                    totals["total_tokens"] += response.usage.total_tokens
+
+            # Check budget limit (alert once per crossing)
+            if (
+                self.budget_limit_usd
+                and not self._budget_alerted
+                and self._total_cost >= self.budget_limit_usd
+            ):
+                self._budget_alerted = True
+                if self.on_budget_exceeded:
+                    self.on_budget_exceeded(self.get_budget_status())
+        except BaseException as e:
+            # e.g. a raising on_budget_exceeded callback
+            if hook_ctx is not None:
+                HOOKS.fire_post(hook_ctx, error=e)
+            raise
+
+        if hook_ctx is not None:
+            HOOKS.fire_post(hook_ctx)
 
     def get_stats(
         self,
@@ -162,7 +198,7 @@ class UsageTracker:
         Returns:
             Total cost in USD
         """
-        return sum(call.usage.total_cost_usd for call in self.calls)
+        return self._total_cost
 
     def get_budget_status(self) -> Dict[str, Any]:
         """
@@ -198,6 +234,17 @@ class UsageTracker:
         """Get all calls with a specific tag."""
         return self._tags.get(tag, [])
 
+    def get_tag_totals(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get running call, cost, and token totals per tag.
+
+        Maintained incrementally, so this is O(tags) rather than O(calls).
+
+        Returns:
+            Dict keyed by tag with total_calls, total_cost_usd, total_tokens
+        """
+        return {tag: dict(totals) for tag, totals in self._tag_totals.items()}
+
     def get_cost_breakdown(self) -> Dict[str, Dict[str, float]]:
         """
         Get detailed cost breakdown by provider and model.
@@ -228,10 +275,66 @@ class UsageTracker:
 
         return dict(breakdown)
 
+    def iter_calls(self) -> Iterator[Tuple[LLMResponse, Tuple[str, ...]]]:
+        """
+        Iterate over tracked calls with the tags each was tracked with.
+
+        Yields:
+            (response, tags) pairs in tracking order
+        """
+        # Index-based so calls tracked during iteration don't break it
+        for i in range(len(self.calls)):
+            yield self.calls[i], self._call_tags[i]
+
+    def export(
+        self,
+        destination: Destination,
+        format: str = "csv",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        tags: Optional[Sequence[str]] = None,
+        tag_keys: Optional[Sequence[str]] = None,
+        include_tags: bool = False,
+        batch_size: int = 10000
+    ) -> int:
+        """
+        Stream tracking data to a file in constant memory.
+
+        Args:
+            destination: Path or open file (text for csv/jsonl, binary for parquet)
+            format: One of "csv", "jsonl", "parquet" (parquet requires pyarrow)
+            since: Only include calls at or after this timestamp
+            until: Only include calls before this timestamp
+            tags: Only include calls carrying every one of these tags
+            tag_keys: Tag prefixes projected into "tag_<key>" columns ("user" for "user:123")
+            include_tags: Include the full tag list as a "tags" column
+            batch_size: Rows per Parquet row group
+
+        Returns:
+            Number of records written
+
+        Example:
+            >>> tracker.export("usage.jsonl", format="jsonl", tag_keys=["user", "agent"])
+            >>> tracker.export("usage.parquet", format="parquet", since=month_start)
+        """
+        return export_usage(
+            self.iter_calls(),
+            destination,
+            format=format,
+            since=since,
+            until=until,
+            tags=tags,
+            tag_keys=tag_keys,
+            include_tags=include_tags,
+            batch_size=batch_size,
+        )
+
     def export_to_csv(self) -> str:
         """
         Export tracking data to CSV format.
 
+        Builds the whole export in memory; prefer export() for large histories.
+
         Returns:
             CSV string with all call data
 
@@ -240,39 +343,20 @@ class UsageTracker:
             >>> with open('usage_log.csv', 'w') as f:
             ...     f.write(csv)
         """
-        # CSV header
-        lines = [
-            "timestamp,provider,model,input_tokens,output_tokens,total_tokens,"
-            "input_cost_usd,output_cost_usd,total_cost_usd,latency_ms,finish_reason"
-        ]
-
-        # Add each call
-        for call in self.calls:
-            # Handle both string and enum provider values
-            provider_key = call.provider if isinstance(call.provider, str) else call.provider.value
-
-            lines.append(
-                f"{call.timestamp.isoformat()},"
-                f"{provider_key},"
-                f"{call.model},"
-                f"{call.usage.input_tokens},"
-                f"{call.usage.output_tokens},"
-                f"{call.usage.total_tokens},"
-                f"{call.usage.input_cost_usd:.6f},"
-                f"{call.usage.output_cost_usd:.6f},"
-                f"{call.usage.total_cost_usd:.6f},"
-                f"{call.latency_ms:.2f},"
-                f"{call.finish_reason or ''}"
-            )
-
-        return "\n".join(lines)
+        buffer = io.StringIO()
+        self.export(buffer, format="csv")
+        return buffer.getvalue().rstrip("\n")
 
     def reset(self) -> None:
         """Clear all tracking data."""
         self.calls.clear()
+        self._call_tags.clear()
+        self._total_cost = 0.0
+        self._budget_alerted = False
         self._by_provider.clear()
         self._by_model.clear()
         self._tags.clear()
+        self._tag_totals.clear()
 
     def _filter_calls(
         self,
@@ -0,0 +1,53 @@
+"""
+Observability - Tracing and profiling for the Agent Factory pipelines.
+
+Provides nested span tracing across the Planner → Worker → Judge loop,
+LLM calls, and OpenHands runs, with in-memory, JSONL, and optional OTLP
+exporters; a hook registry for attaching profilers to hot paths; and a
+sampling profiler that writes flamegraph-ready collapsed stacks.
+"""
+
+from .hooks import (
+    ALL_POINTS,
+    HOOK_POINTS,
+    HOOKS,
+    HookContext,
+    HookRegistry,
+)
+from .profiler import (
+    SamplingProfiler,
+    profile_run,
+)
+from .tracing import (
+    InMemorySpanExporter,
+    JsonlSpanExporter,
+    OTLPSpanExporter,
+    Span,
+    SpanExporter,
+    Tracer,
+    get_tracer,
+    set_span_attributes,
+    traced,
+)
+
+__all__ = [
+    # Tracing
+    "Span",
+    "Tracer",
+    "SpanExporter",
+    "InMemorySpanExporter",
+    "JsonlSpanExporter",
+    "OTLPSpanExporter",
+    "get_tracer",
+    "traced",
+    "set_span_attributes",
+    # Hooks
+    "HOOKS",
+    "HOOK_POINTS",
+    "ALL_POINTS",
+    "HookContext",
+    "HookRegistry",
+    # Profiling
+    "SamplingProfiler",
+    "profile_run",
+]
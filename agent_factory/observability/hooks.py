@@ -0,0 +1,194 @@
+"""
+Hooks - Pluggable Pre/Post Callbacks on Hot Paths
+
+Lets profilers and diagnostics attach to instrumented points without
+patching code. Instrumented call sites check the plain ``HOOKS.active``
+attribute first, so with no hooks registered the cost is one attribute
+read per call.
+
+Instrumented points:
+    router.dispatch     LLMRouter sending a request to one model
+    cache.lookup        LLMRouter response cache lookup
+    messages.convert    RoutedChatModel._convert_messages_to_litellm
+    files.scan          Codebase scans (SuggestionGenerator, PlannerAgent)
+    tracker.update      UsageTracker.track
+
+Usage:
+    >>> def pre(ctx): ...
+    >>> def post(ctx): print(ctx.point, ctx.elapsed_ms)
+    >>> handle = HOOKS.register("router.dispatch", pre=pre, post=post)
+    >>> HOOKS.unregister(handle)
+
+Call-site pattern:
+    >>> ctx = HOOKS.fire_pre(ROUTER_DISPATCH, model=name) if HOOKS.active else None
+    >>> ...
+    >>> if ctx is not None:
+    ...     HOOKS.fire_post(ctx, result=response)
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+ROUTER_DISPATCH = "router.dispatch"
+CACHE_LOOKUP = "cache.lookup"
+MESSAGE_CONVERSION = "messages.convert"
+FILE_SCAN = "files.scan"
+TRACKER_UPDATE = "tracker.update"
+
+HOOK_POINTS = (
+    ROUTER_DISPATCH,
+    CACHE_LOOKUP,
+    MESSAGE_CONVERSION,
+    FILE_SCAN,
+    TRACKER_UPDATE,
+)
+
+# Register on this point to receive every hook point
+ALL_POINTS = "*"
+
+
+@dataclass
+class HookContext:
+    """State shared between the pre and post callbacks of one call."""
+    point: str
+    info: Dict[str, Any] = field(default_factory=dict)
+    start: float = field(default_factory=time.perf_counter)
+    end: Optional[float] = None
+    result: Any = None
+    error: Optional[BaseException] = None
+    data: Dict[str, Any] = field(default_factory=dict)  # scratch space for hooks
+    thread_id: int = field(default_factory=threading.get_ident)
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Time between fire_pre and fire_post in milliseconds."""
+        end = self.end if self.end is not None else time.perf_counter()
+        return (end - self.start) * 1000
+
+
+HookCallback = Callable[[HookContext], None]
+HookHandle = Tuple[str, Optional[HookCallback], Optional[HookCallback]]
+
+
+class HookRegistry:
+    """
+    Registry of pre/post callbacks keyed by hook point.
+
+    Callback errors are logged and swallowed so a faulty profiler can
+    never break the pipeline it is observing.
+    """
+
+    def __init__(self):
+        self.active = False
+        self._hooks: Dict[str, List[HookHandle]] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        point: str,
+        pre: Optional[HookCallback] = None,
+        post: Optional[HookCallback] = None
+    ) -> HookHandle:
+        """
+        Attach callbacks to a hook point.
+
+        Args:
+            point: One of HOOK_POINTS, or ALL_POINTS for every point
+            pre: Called with the HookContext before the instrumented operation
+            post: Called with the HookContext after it (result/error filled in)
+
+        Returns:
+            Handle for unregister()
+        """
+        if point != ALL_POINTS and point not in HOOK_POINTS:
+            raise ValueError(f"Unknown hook point '{point}'. Use one of: {HOOK_POINTS}")
+        handle: HookHandle = (point, pre, post)
+        with self._lock:
+            # Copy-on-write so firing never needs the lock
+            hooks = dict(self._hooks)
+            hooks[point] = hooks.get(point, []) + [handle]
+            self._hooks = hooks
+            self.active = True
+        return handle
+
+    def unregister(self, handle: HookHandle) -> None:
+        """Detach callbacks registered with register()."""
+        with self._lock:
+            hooks = dict(self._hooks)
+            remaining = [h for h in hooks.get(handle[0], []) if h is not handle]
+            if remaining:
+                hooks[handle[0]] = remaining
+            else:
+                hooks.pop(handle[0], None)
+            self._hooks = hooks
+            self.active = bool(hooks)
+
+    def clear(self) -> None:
+        """Remove every hook."""
+        with self._lock:
+            self._hooks = {}
+            self.active = False
+
+    def _handles(self, point: str) -> List[HookHandle]:
+        hooks = self._hooks
+        return hooks.get(point, []) + hooks.get(ALL_POINTS, [])
+
+    def fire_pre(self, point: str, **info: Any) -> HookContext:
+        """Run pre callbacks and return the context to pass to fire_post()."""
+        ctx = HookContext(point=point, info=info)
+        for _, pre, _ in self._handles(point):
+            if pre is None:
+                continue
+            try:
+                pre(ctx)
+            except Exception as e:
+                logger.warning(f"Pre-hook for {point} failed: {e}")
+        return ctx
+
+    def fire_post(
+        self,
+        ctx: HookContext,
+        result: Any = None,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """Run post callbacks for a context created by fire_pre()."""
+        ctx.end = time.perf_counter()
+        ctx.result = result
+        ctx.error = error
+        for _, _, post in self._handles(ctx.point):
+            if post is None:
+                continue
+            try:
+                post(ctx)
+            except Exception as e:
+                logger.warning(f"Post-hook for {ctx.point} failed: {e}")
+
+    @contextmanager
+    def hook(self, point: str, **info: Any) -> Iterator[Optional[HookContext]]:
+        """
+        Convenience wrapper for non-hot paths.
+
+        Yields None when no hooks are registered.
+        """
+        if not self.active:
+            yield None
+            return
+        ctx = self.fire_pre(point, **info)
+        try:
+            yield ctx
+        except BaseException as e:
+            self.fire_post(ctx, error=e)
+            raise
+        else:
+            self.fire_post(ctx, result=ctx.result)
+
+
+# Global hook registry used by instrumented call sites
+HOOKS = HookRegistry()
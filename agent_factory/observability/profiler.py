@@ -0,0 +1,194 @@
+"""
+Sampling Profiler - Flamegraph-ready Stack Sampling
+
+A low-overhead wall-clock sampler that periodically records the Python
+stack of every thread via sys._current_frames() and aggregates them into
+collapsed-stack format ("frame;frame;frame count"), the input expected by
+flamegraph.pl, speedscope, and inferno.
+
+Scoped mode: pass hook_points to sample only threads currently inside
+those hook points (see hooks.py). Samples are then rooted under a
+"hook:<point>" frame so each instrumented path gets its own subtree.
+
+Usage:
+    >>> with SamplingProfiler(interval=0.005) as profiler:
+    ...     runner.run_all(suggestions)
+    >>> profiler.write_collapsed("run.folded")
+"""
+
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .hooks import HOOKS, HookContext, HookHandle, HookRegistry
+
+
+def _frame_label(frame) -> str:
+    """Readable label for one stack frame: module.function:line."""
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}.{frame.f_code.co_name}:{frame.f_code.co_firstlineno}"
+
+
+class SamplingProfiler:
+    """
+    Background-thread stack sampler.
+
+    Costs nothing until start() is called; sampling overhead is bounded by
+    the interval (default 5 ms).
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.005,
+        hook_points: Optional[Iterable[str]] = None,
+        registry: HookRegistry = HOOKS,
+        max_depth: int = 128
+    ):
+        """
+        Initialize the profiler.
+
+        Args:
+            interval: Seconds between samples
+            hook_points: Only sample threads inside these hook points (None = all threads)
+            registry: Hook registry used for scoped mode
+            max_depth: Maximum frames recorded per stack
+        """
+        self.interval = interval
+        self.hook_points = list(hook_points) if hook_points else []
+        self.registry = registry
+        self.max_depth = max_depth
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+
+        self._active_points: Dict[int, List[HookContext]] = {}
+        self._handles: List[HookHandle] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # ========== SCOPED MODE ==========
+
+    def _enter_point(self, ctx: HookContext) -> None:
+        with self._lock:
+            self._active_points.setdefault(ctx.thread_id, []).append(ctx)
+
+    def _exit_point(self, ctx: HookContext) -> None:
+        # Remove this call's entry, not just the innermost one, so an
+        # unpaired or out-of-order post cannot mislabel the enclosing point
+        with self._lock:
+            stack = self._active_points.get(ctx.thread_id)
+            if not stack:
+                return
+            for i in range(len(stack) - 1, -1, -1):
+                if stack[i] is ctx:
+                    del stack[i]
+                    break
+            if not stack:
+                del self._active_points[ctx.thread_id]
+
+    # ========== SAMPLING ==========
+
+    def _sample_once(self, own_thread: int) -> None:
+        frames = sys._current_frames()
+        with self._lock:
+            scoped = {tid: stack[-1].point for tid, stack in self._active_points.items()}
+
+        for thread_id, frame in frames.items():
+            if thread_id == own_thread:
+                continue
+            if self.hook_points and thread_id not in scoped:
+                continue
+
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.reverse()
+
+            if self.hook_points:
+                stack = [f"hook:{scoped[thread_id]}"] + stack
+
+            self.samples[";".join(stack)] += 1
+            self.sample_count += 1
+
+    def _run(self) -> None:
+        own_thread = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self._sample_once(own_thread)
+
+    def start(self) -> "SamplingProfiler":
+        """Start sampling in a daemon thread."""
+        if self._thread is not None:
+            return self
+        for point in self.hook_points:
+            self._handles.append(
+                self.registry.register(point, pre=self._enter_point, post=self._exit_point)
+            )
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop sampling and detach scoped-mode hooks."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        for handle in self._handles:
+            self.registry.unregister(handle)
+        self._handles.clear()
+        self._active_points.clear()
+
+    def __enter__(self) -> "SamplingProfiler":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ========== OUTPUT ==========
+
+    def collapsed(self) -> List[str]:
+        """Collapsed-stack lines, most frequent first."""
+        return [f"{stack} {count}" for stack, count in self.samples.most_common()]
+
+    def write_collapsed(self, path: str) -> Path:
+        """
+        Write collapsed stacks to a file for flamegraph tools.
+
+        Args:
+            path: Output file (e.g. "run.folded")
+
+        Returns:
+            Path written
+        """
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text("\n".join(self.collapsed()) + "\n", encoding="utf-8")
+        return output
+
+
+@contextmanager
+def profile_run(
+    path: str,
+    interval: float = 0.005,
+    hook_points: Optional[Iterable[str]] = None
+) -> Iterator[SamplingProfiler]:
+    """
+    Profile a block and write collapsed stacks to path when it exits.
+
+    Example:
+        >>> with profile_run("autonomous.folded"):
+        ...     runner.run_all(suggestions)
+    """
+    profiler = SamplingProfiler(interval=interval, hook_points=hook_points)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        profiler.write_collapsed(path)
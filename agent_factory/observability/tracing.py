@@ -0,0 +1,333 @@
+"""
+Tracing - Lightweight Span Tracing for the Autonomous Pipeline
+
+OpenTelemetry-style nested spans without a hard dependency on the
+OpenTelemetry SDK. Spans are tracked per execution context (contextvars),
+so nesting works across function calls and can be carried into worker
+threads with contextvars.copy_context().
+
+Exporters:
+    - InMemorySpanExporter: keeps finished spans in a list (tests, CLI summaries)
+    - JsonlSpanExporter: appends one JSON object per finished span to a file
+    - OTLPSpanExporter: forwards spans to an OTLP collector (requires opentelemetry-sdk)
+
+With no exporter attached, tracing is disabled and spans are no-ops.
+
+Usage:
+    >>> tracer = get_tracer()
+    >>> tracer.add_exporter(JsonlSpanExporter("trace.jsonl"))
+    >>> with tracer.span("autonomous.judge", suggestion_id="abc123") as span:
+    ...     span.set_attribute("files", 3)
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    """A timed operation, optionally nested under a parent span."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_time: float = field(default_factory=time.time)
+    end_time: Optional[float] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    error: Optional[str] = None
+    thread: str = field(default_factory=lambda: threading.current_thread().name)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        """Attach several attributes at once."""
+        self.attributes.update(attributes)
+
+    def record_error(self, error: BaseException) -> None:
+        """Mark the span as failed."""
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    @property
+    def duration_ms(self) -> float:
+        """Span duration in milliseconds (0 while still open)."""
+        if self.end_time is None:
+            return 0.0
+        return (self.end_time - self.start_time) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for JSON exporters."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error,
+            "thread": self.thread,
+        }
+
+
+class _NoopSpan:
+    """Stand-in yielded when tracing is disabled."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+_current_span: ContextVar[Optional[Span]] = ContextVar("agent_factory_current_span", default=None)
+
+
+class SpanExporter:
+    """Base exporter. on_start is called when a span opens, export when it closes."""
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def export(self, span: Span) -> None:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Collect finished spans in memory."""
+
+    def __init__(self):
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def get_finished_spans(self) -> List[Span]:
+        """Finished spans in completion order."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Drop collected spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+class JsonlSpanExporter(SpanExporter):
+    """Append finished spans to a JSON Lines file (opened per span, nothing held open)."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class OTLPSpanExporter(SpanExporter):
+    """
+    Forward spans to an OpenTelemetry collector over OTLP/HTTP.
+
+    Requires: pip install opentelemetry-sdk opentelemetry-exporter-otlp-proto-http
+    """
+
+    def __init__(self, endpoint: Optional[str] = None, service_name: str = "agent-factory"):
+        try:
+            from opentelemetry import trace as otel_trace
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter as _OTLPExporter,
+            )
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+            from opentelemetry.trace import Status, StatusCode
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetry SDK not installed. Run: "
+                "pip install opentelemetry-sdk opentelemetry-exporter-otlp-proto-http"
+            ) from e
+
+        self._otel_trace = otel_trace
+        self._status = Status
+        self._status_code = StatusCode
+        self._provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+        exporter = _OTLPExporter(endpoint=endpoint) if endpoint else _OTLPExporter()
+        self._provider.add_span_processor(BatchSpanProcessor(exporter))
+        self._tracer = self._provider.get_tracer("agent_factory")
+        self._open: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def on_start(self, span: Span) -> None:
+        with self._lock:
+            parent = self._open.get(span.parent_id) if span.parent_id else None
+        context = self._otel_trace.set_span_in_context(parent) if parent is not None else None
+        otel_span = self._tracer.start_span(
+            span.name, context=context, start_time=int(span.start_time * 1e9)
+        )
+        with self._lock:
+            self._open[span.span_id] = otel_span
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            otel_span = self._open.pop(span.span_id, None)
+        if otel_span is None:
+            return
+        for key, value in span.attributes.items():
+            if not isinstance(value, (str, bool, int, float)):
+                value = str(value)
+            otel_span.set_attribute(key, value)
+        if span.status == "error":
+            otel_span.set_status(self._status(self._status_code.ERROR, span.error))
+        otel_span.end(end_time=int((span.end_time or time.time()) * 1e9))
+
+    def shutdown(self) -> None:
+        self._provider.shutdown()
+
+
+class Tracer:
+    """
+    Creates nested spans and hands finished ones to exporters.
+
+    Disabled (zero-overhead no-op spans) until an exporter is added.
+    """
+
+    def __init__(self, exporters: Optional[List[SpanExporter]] = None):
+        self._exporters: List[SpanExporter] = list(exporters or [])
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any exporter is attached."""
+        return bool(self._exporters)
+
+    def add_exporter(self, exporter: SpanExporter) -> SpanExporter:
+        """Attach an exporter (enables tracing)."""
+        with self._lock:
+            self._exporters = self._exporters + [exporter]
+        return exporter
+
+    def remove_exporter(self, exporter: SpanExporter) -> None:
+        """Detach an exporter."""
+        with self._lock:
+            self._exporters = [e for e in self._exporters if e is not exporter]
+
+    def shutdown(self) -> None:
+        """Flush and detach all exporters."""
+        with self._lock:
+            exporters, self._exporters = self._exporters, []
+        for exporter in exporters:
+            exporter.shutdown()
+
+    def current_span(self) -> Optional[Span]:
+        """Span active in the current context, if any."""
+        return _current_span.get()
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Any]:
+        """
+        Open a span for the duration of the with-block.
+
+        Exceptions raised inside the block mark the span as failed and
+        propagate unchanged.
+
+        Args:
+            name: Span name (e.g. "autonomous.judge")
+            **attributes: Initial span attributes
+        """
+        exporters = self._exporters
+        if not exporters:
+            yield _NOOP_SPAN
+            return
+
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_id=parent.span_id if parent else None,
+            attributes=dict(attributes),
+        )
+        for exporter in exporters:
+            exporter.on_start(span)
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_time = time.time()
+            for exporter in exporters:
+                exporter.export(span)
+
+
+# Global tracer instance (optional singleton pattern)
+_global_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer."""
+    return _global_tracer
+
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorator that wraps a function call in a span on the global tracer.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+
+    Example:
+        >>> @traced("planner.scan_codebase")
+        ... def scan_codebase(self): ...
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _global_tracer.enabled:
+                return func(*args, **kwargs)
+            with _global_tracer.span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def set_span_attributes(**attributes: Any) -> None:
+    """Attach attributes to the current span (no-op when tracing is disabled)."""
+    span = _current_span.get()
+    if span is not None:
+        span.set_attributes(**attributes)
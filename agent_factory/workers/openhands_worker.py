@@ -38,18 +38,32 @@ LITELLM OLLAMA INTEGRATION:
 import os
 import time
 import logging
+import re
+import threading
 import warnings
-from typing import List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 from enum import Enum
 
+from agent_factory.observability.tracing import get_tracer, traced, set_span_attributes
+from agent_factory.files import PatternSet, get_file_index
+
 # Suppress warnings and noisy logs
 warnings.filterwarnings("ignore")
 logging.getLogger("openhands").setLevel(logging.ERROR)
 logging.getLogger("litellm").setLevel(logging.ERROR)
 logging.getLogger("httpx").setLevel(logging.ERROR)
 
+logger = logging.getLogger(__name__)
+
+# File paths and code blocks mentioned in agent events
+_EVENT_FILE_PATTERN = re.compile(r'(?:path|file)["\']?\s*[:=]\s*["\']?([^\s"\']+)', re.IGNORECASE)
+_EVENT_CODE_PATTERN = re.compile(r'```[\w]*\n(.*?)```', re.DOTALL)
+
+# Build artifacts never reported as changed files
+SNAPSHOT_PATTERNS = ["*.pyc", "*.pyo"]
+
 # Check SDK availability
 try:
     import openhands.sdk
@@ -107,6 +121,91 @@ class OpenHandsResult:
     cost: float = 0.0
     logs: str = ""
     token_usage: Optional[dict] = None
+    events_summary: Optional[Dict[str, Any]] = None  # See summarize_events()
+
+
+# Limits for summarize_events()
+MAX_SUMMARY_ACTIONS = 40
+MAX_SUMMARY_TEXT = 300
+
+
+def _clip(text: Any, limit: int = MAX_SUMMARY_TEXT) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _message_text(event: Any) -> str:
+    """Text content of a MessageEvent's LLM message."""
+    message = getattr(event, "llm_message", None)
+    content = getattr(message, "content", None) or []
+    if isinstance(content, str):
+        return content
+    return " ".join(getattr(part, "text", "") for part in content)
+
+
+def summarize_events(events: List[Any]) -> Dict[str, Any]:
+    """
+    Structured digest of a conversation's events.
+
+    Much smaller than the raw event log and keeps what a reviewer needs:
+    which tools were called on what, which errors occurred and what the
+    agent said at the end. Event attributes are read defensively, so SDK
+    versions with different event fields still produce a summary.
+
+    Returns:
+        {"event_counts": {type: n}, "actions": ["tool command target", ...],
+         "errors": [...], "final_message": str}
+    """
+    counts: Dict[str, int] = {}
+    actions: List[str] = []
+    errors: List[str] = []
+    final_message = ""
+
+    for event in events:
+        kind = type(event).__name__
+        counts[kind] = counts.get(kind, 0) + 1
+
+        action = getattr(event, "action", None)
+        tool = getattr(event, "tool_name", None)
+        if tool and action is not None:
+            parts = [tool]
+            for attr in ("command", "path"):
+                value = getattr(action, attr, None)
+                if value:
+                    parts.append(_clip(value, 120))
+            actions.append(" ".join(parts))
+        elif "Error" in kind:
+            errors.append(_clip(getattr(event, "error", None) or event))
+        elif kind == "MessageEvent" and getattr(event, "source", None) == "agent":
+            final_message = _message_text(event) or final_message
+
+    if len(actions) > MAX_SUMMARY_ACTIONS:
+        # Keep the start (exploration) and the end (final edits and checks)
+        half = MAX_SUMMARY_ACTIONS // 2
+        skipped = len(actions) - 2 * half
+        actions = actions[:half] + [f"... {skipped} more actions ..."] + actions[-half:]
+
+    return {
+        "event_counts": counts,
+        "actions": actions,
+        "errors": errors[-10:],
+        "final_message": _clip(final_message, 1000),
+    }
+
+
+def format_events_summary(summary: Dict[str, Any]) -> str:
+    """Render summarize_events() output as compact text for prompts."""
+    counts = summary.get("event_counts", {})
+    lines = ["Events: " + ", ".join(f"{kind} x{n}" for kind, n in counts.items())]
+    if summary.get("actions"):
+        lines.append("Actions:")
+        lines.extend(f"  {i}. {action}" for i, action in enumerate(summary["actions"], 1))
+    if summary.get("errors"):
+        lines.append("Errors:")
+        lines.extend(f"  - {error}" for error in summary["errors"])
+    if summary.get("final_message"):
+        lines.append(f"Final agent message: {summary['final_message']}")
+    return "\n".join(lines)
 
 
 class OpenHandsWorker:
@@ -122,6 +221,9 @@ class OpenHandsWorker:
         - Configurable tool selection
         - Workspace management
         - Token usage and cost tracking
+    
+    The LLM, tools and Agent are built on the first task and reused; each
+    task only creates a Conversation. A worker runs one task at a time.
     """
 
     def __init__(
@@ -134,6 +236,7 @@ class OpenHandsWorker:
         enabled_tools: Optional[Set[ToolOption]] = None,
         enable_tool_calling: bool = True,
         keep_alive: str = "5m",
+        exclude_paths: Optional[List[str]] = None,
         **kwargs
     ):
         """
@@ -148,6 +251,8 @@ class OpenHandsWorker:
             enabled_tools: Set of tools to enable (default: terminal, file_editor, apply_patch)
             enable_tool_calling: Use native tool calling for supported models
             keep_alive: How long Ollama keeps model loaded (default: 5m, use -1 for forever)
+            exclude_paths: Workspace-relative directories never reported as
+                changed (e.g. a history directory written during tasks)
         """
         if not SDK_AVAILABLE:
             raise ImportError(
@@ -192,6 +297,17 @@ class OpenHandsWorker:
         self.enabled_tools = enabled_tools or DEFAULT_TOOLS
         self.enable_tool_calling = enable_tool_calling
         self.keep_alive = keep_alive
+        self._snapshot_excludes = PatternSet(
+            [*SNAPSHOT_PATTERNS, *(f"/{path.strip('/')}/" for path in exclude_paths or ())]
+        )
+        
+        # Agent (LLM, tools, condenser) shared by all conversations, built on first use
+        self._agent = None
+        self._agent_lock = threading.Lock()
+        
+        # Conversations kept between run_task calls, by session id
+        self._sessions: Dict[str, Any] = {}
+        self._sessions_lock = threading.Lock()
         
         # Ensure workspace exists
         self.workspace_dir.mkdir(parents=True, exist_ok=True)
@@ -251,24 +367,41 @@ class OpenHandsWorker:
         
         return tools
 
+    @traced("openhands.run_task")
     def run_task(
         self,
         task: str,
         timeout: int = 300,
-        on_log: Optional[Any] = None
+        on_log: Optional[Any] = None,
+        session_id: Optional[str] = None
     ) -> OpenHandsResult:
         """
         Run a coding task using OpenHands SDK.
         
+        With a session_id, the conversation is kept after the task and the
+        next run_task with the same id continues it: task is sent as a
+        follow-up message, so the agent keeps what it already read and
+        planned. Call close_session() when the session is no longer needed.
+        
         Args:
-            task: Task description for the agent
+            task: Task description for the agent (a follow-up message for an
+                existing session)
             timeout: Maximum execution time in seconds
             on_log: Optional callback for log events
+            session_id: Key of a conversation to create or continue (None =
+                one-off conversation)
             
         Returns:
-            OpenHandsResult with execution details
+            OpenHandsResult with execution details (metrics, events and
+            changed files cover this task only)
         """
         start_time = time.time()
+        set_span_attributes(
+            model=self.model,
+            task_chars=len(task or ""),
+            timeout=timeout,
+            resumed_session=self.has_session(session_id) if session_id else False,
+        )
 
         if not task or not task.strip():
             return OpenHandsResult(
@@ -278,10 +411,12 @@ class OpenHandsWorker:
             )
 
         try:
-            return self._run_sdk_task(task, timeout, on_log=on_log)
+            return self._run_sdk_task(task, timeout, on_log=on_log, session_id=session_id)
         except Exception as e:
             import traceback
             error_details = traceback.format_exc()
+            if session_id:
+                self.close_session(session_id)  # Do not continue a broken conversation
             return OpenHandsResult(
                 success=False,
                 message=f"SDK Error: {str(e)}",
@@ -289,25 +424,38 @@ class OpenHandsWorker:
                 execution_time=time.time() - start_time
             )
 
-    def _run_sdk_task(self, task: str, timeout: int, on_log=None) -> OpenHandsResult:
-        """Internal method to run task using the SDK."""
-        from openhands.sdk import Agent, LLM, Conversation
+    def has_session(self, session_id: str) -> bool:
+        """Whether a conversation is kept for session_id."""
+        with self._sessions_lock:
+            return session_id in self._sessions
+
+    def close_session(self, session_id: str) -> None:
+        """Discard the conversation kept for session_id (no-op if there is none)."""
+        with self._sessions_lock:
+            conversation = self._sessions.pop(session_id, None)
+        if conversation is None:
+            return
+        close = getattr(conversation, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.debug(f"Closing conversation {session_id} failed: {e}")
+
+    def _get_agent(self):
+        """The worker's Agent, built on first use."""
+        if self._agent is None:
+            with self._agent_lock:
+                if self._agent is None:
+                    self._agent = self._create_agent()
+        return self._agent
+
+    def _create_agent(self):
+        """Build the LLM, tools, condenser and Agent."""
+        from openhands.sdk import Agent, LLM
         from openhands.sdk.context.condenser import LLMSummarizingCondenser
         from pydantic import SecretStr
-        import glob
 
-        start_time = time.time()
-        
-        # Track files BEFORE execution for change detection
-        workspace = Path(self.workspace_dir)
-        files_before = {}
-        for f in workspace.rglob("*"):
-            if f.is_file() and not any(p in str(f) for p in [".git", "__pycache__", ".pyc"]):
-                try:
-                    files_before[str(f)] = f.stat().st_mtime
-                except:
-                    pass
-        
         # 1. Setup LLM with Ollama optimizations
         api_key = os.getenv("LLM_API_KEY", "ollama")  # Ollama accepts any key
         
@@ -342,25 +490,57 @@ class OpenHandsWorker:
             keep_first=4
         )
         
-        agent = Agent(
+        return Agent(
             llm=llm,
             tools=tools,
             condenser=condenser,
             system_prompt_kwargs={"cli_mode": True},
         )
 
-        if self.verbose:
-            print(f"[OpenHands SDK] Starting task in {self.workspace_dir}")
+    @staticmethod
+    def _llm_totals(agent) -> Tuple[float, Dict[str, int]]:
+        """Accumulated cost and token usage of the agent's LLM."""
+        metrics = agent.llm.metrics
+        usage = metrics.accumulated_token_usage
+        return metrics.accumulated_cost or 0.0, {
+            "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+            "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+            "total_tokens": getattr(usage, "total_tokens", 0) or 0,
+        }
 
-        # 4. Create Conversation with LocalWorkspace
-        conversation = Conversation(
-            agent=agent,
-            workspace=str(self.workspace_dir),
-            visualizer=None  # Suppress default noisy output
-        )
+    def _run_sdk_task(
+        self, task: str, timeout: int, on_log=None, session_id: Optional[str] = None
+    ) -> OpenHandsResult:
+        """Internal method to run task using the SDK."""
+        from openhands.sdk import Conversation
+
+        start_time = time.time()
+        
+        # Track files BEFORE execution for change detection
+        workspace = Path(self.workspace_dir)
+        file_index = get_file_index(workspace)
+        files_before = file_index.stat_snapshot(exclude=self._snapshot_excludes)
+        
+        agent = self._get_agent()
+        with self._sessions_lock:
+            conversation = self._sessions.get(session_id) if session_id else None
+        
+        if conversation is None:
+            if self.verbose:
+                print(f"[OpenHands SDK] Starting task in {self.workspace_dir}")
+
+            # 4. Create Conversation with LocalWorkspace
+            conversation = Conversation(
+                agent=agent,
+                workspace=str(self.workspace_dir),
+                visualizer=None  # Suppress default noisy output
+            )
+            if session_id:
+                with self._sessions_lock:
+                    self._sessions[session_id] = conversation
 
-        # 5. Enhance task prompt with explicit tool usage instructions
-        enhanced_task = f"""{task}
+            # 5. Enhance task prompt with explicit tool usage instructions
+            message = f"""{task}
 
 INSTRUCTIONS:
 - Use the file_editor tool to create or modify files
@@ -369,14 +549,25 @@ INSTRUCTIONS:
 - Working directory: {self.workspace_dir}
 
 Begin implementing now. Create or modify the necessary files."""
+        else:
+            # Follow-up in the same conversation: the agent keeps its context
+            message = task
+            if self.verbose:
+                print(f"[OpenHands SDK] Continuing session {session_id} in {self.workspace_dir}")
+
+        events_before = len(conversation.state.events)
+        cost_before, usage_before = self._llm_totals(agent)
 
         # 6. Run the task
         try:
-            conversation.send_message(enhanced_task)
-            conversation.run()
+            with get_tracer().span("openhands.conversation", workspace=str(self.workspace_dir)):
+                conversation.send_message(message)
+                conversation.run()
         except Exception as e:
             if on_log:
                 on_log(f"Error during execution: {e}")
+            if session_id:
+                self.close_session(session_id)
             return OpenHandsResult(
                 success=False,
                 message=f"Execution error: {e}",
@@ -384,57 +575,43 @@ Begin implementing now. Create or modify the necessary files."""
                 execution_time=time.time() - start_time,
             )
 
-        # 7. Collect Metrics and Logs
-        metrics = agent.llm.metrics
-        token_usage = {
-            "prompt_tokens": metrics.accumulated_token_usage.prompt_tokens if hasattr(metrics.accumulated_token_usage, 'prompt_tokens') else 0,
-            "completion_tokens": metrics.accumulated_token_usage.completion_tokens if hasattr(metrics.accumulated_token_usage, 'completion_tokens') else 0,
-            "total_tokens": metrics.accumulated_token_usage.total_tokens if hasattr(metrics.accumulated_token_usage, 'total_tokens') else 0,
-        }
-        cost = metrics.accumulated_cost
+        # 7. Collect Metrics and Logs (deltas: the shared LLM accumulates across tasks)
+        cost_after, usage_after = self._llm_totals(agent)
+        cost = cost_after - cost_before
+        token_usage = {key: value - usage_before[key] for key, value in usage_after.items()}
         
         # 8. Parse events for file operations and extract code
+        events = list(conversation.state.events)[events_before:]
         event_logs = []
         extracted_code = ""
         files_from_events = set()
         
-        for event in conversation.state.events:
+        for event in events:
             event_str = str(event)
             event_logs.append(event_str)
             
             # Look for file editor operations in events
             if "file_editor" in event_str.lower() or "write" in event_str.lower():
                 # Try to extract file paths mentioned
-                import re
-                file_pattern = r'(?:path|file)["\']?\s*[:=]\s*["\']?([^\s"\']+)'
-                matches = re.findall(file_pattern, event_str, re.IGNORECASE)
+                matches = _EVENT_FILE_PATTERN.findall(event_str)
                 for match in matches:
                     if match and not match.startswith("http"):
                         files_from_events.add(match)
                 
                 # Extract code blocks
-                code_pattern = r'```[\w]*\n(.*?)```'
-                code_matches = re.findall(code_pattern, event_str, re.DOTALL)
+                code_matches = _EVENT_CODE_PATTERN.findall(event_str)
                 if code_matches:
                     extracted_code = code_matches[-1]  # Take last code block
         
         history_str = "\n".join(event_logs)
+        events_summary = summarize_events(events)
         
         # 9. Detect file changes by comparing before/after
         files_changed = list(files_from_events)
         
-        for f in workspace.rglob("*"):
-            if f.is_file() and not any(p in str(f) for p in [".git", "__pycache__", ".pyc"]):
-                try:
-                    f_str = str(f)
-                    current_mtime = f.stat().st_mtime
-                    # New file or modified file
-                    if f_str not in files_before or files_before[f_str] < current_mtime:
-                        rel_path = str(f.relative_to(workspace))
-                        if rel_path not in files_changed:
-                            files_changed.append(rel_path)
-                except:
-                    pass
+        for rel_path in file_index.changed_files(files_before, exclude=self._snapshot_excludes):
+            if rel_path not in files_changed:
+                files_changed.append(rel_path)
         
         # Format logs with stats
         stats_msg = f"Task Completed.\nFiles Changed: {files_changed}\nToken Usage: {token_usage}\nCost: ${cost:.4f}"
@@ -442,6 +619,8 @@ Begin implementing now. Create or modify the necessary files."""
         
         if self.verbose:
             print(f"[OpenHands SDK] {stats_msg}")
+        
+        set_span_attributes(files_changed=len(files_changed), cost=cost, **token_usage)
 
         return OpenHandsResult(
             success=True,
@@ -451,7 +630,8 @@ Begin implementing now. Create or modify the necessary files."""
             logs=full_logs,
             execution_time=time.time() - start_time,
             cost=cost,
-            token_usage=token_usage
+            token_usage=token_usage,
+            events_summary=events_summary,
         )
     
     @classmethod
@@ -19,13 +19,18 @@ Usage:
     python autonomous_cli.py --headless         # Headless mode (auto-accept)
     python autonomous_cli.py --target /path     # Specify target repo
     python autonomous_cli.py --max-suggestions 3
+    python autonomous_cli.py --headless --trace trace.jsonl
+    python autonomous_cli.py --stream           # Review/implement while analysis runs
 """
 
 import os
 import sys
 import argparse
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -48,6 +53,14 @@ from agent_factory.autonomous import (
     SuggestionStatus,
     Verdict,
     VerdictStatus,
+    AutonomousRun,
+    RunStatus,
+)
+from agent_factory.observability import (
+    get_tracer,
+    JsonlSpanExporter,
+    OTLPSpanExporter,
+    SamplingProfiler,
 )
 
 console = Console()
@@ -300,8 +313,17 @@ def show_diff(runner: AutonomousRunner):
         console.print("[dim]No changes detected[/dim]")
 
 
-def run_with_live_progress(runner: AutonomousRunner, accepted: List[Suggestion]):
-    """Run suggestions with rich live progress display and beautified agent logs."""
+def install_progress_callbacks(runner: AutonomousRunner, out: Callable = console.print) -> Callable:
+    """
+    Attach stylized agent-output callbacks to a runner.
+    
+    Args:
+        runner: Runner whose status/implementation/verdict callbacks are set
+        out: Print function (console.print, or a DeferredOutput while prompting)
+        
+    Returns:
+        print_agent_output(agent, message, style) helper
+    """
     
     def print_agent_output(agent: str, message: str, style: str = "dim"):
         """Print stylized agent output."""
@@ -319,7 +341,7 @@ def run_with_live_progress(runner: AutonomousRunner, accepted: List[Suggestion])
         }
         icon = icons.get(agent.lower(), "📌")
         color = colors.get(agent.lower(), "white")
-        console.print(f"[{color}]{icon} [{agent.upper()}][/{color}] [{style}]{message}[/{style}]")
+        out(f"[{color}]{icon} [{agent.upper()}][/{color}] [{style}]{message}[/{style}]")
     
     def on_status(status: str):
         # Determine agent from status message
@@ -334,8 +356,8 @@ def run_with_live_progress(runner: AutonomousRunner, accepted: List[Suggestion])
     
     def on_implementation(suggestion, logs: str):
         """Show worker implementation output."""
-        console.print()
-        console.print(Panel(
+        out()
+        out(Panel(
             logs[:3000] + ("..." if len(logs) > 3000 else ""),
             title=f"[bold yellow]🔧 WORKER OUTPUT[/bold yellow]",
             subtitle=suggestion.title[:40],
@@ -343,15 +365,15 @@ def run_with_live_progress(runner: AutonomousRunner, accepted: List[Suggestion])
         ))
     
     def on_verdict(verdict: Verdict):
-        console.print()
+        out()
         if verdict.status == VerdictStatus.PASS:
-            console.print(Panel(
+            out(Panel(
                 f"[bold green]✅ PASSED[/bold green] (Score: {verdict.score:.0%})\n\n{verdict.feedback}",
                 title="[bold magenta]⚖️ JUDGE VERDICT[/bold magenta]",
                 border_style="green"
             ))
         else:
-            console.print(Panel(
+            out(Panel(
                 f"[bold red]❌ {verdict.status.upper()}[/bold red] (Score: {verdict.score:.0%})\n\n{verdict.feedback}\n\n[dim]Fixes: {', '.join(verdict.suggested_fixes[:3])}[/dim]",
                 title="[bold magenta]⚖️ JUDGE VERDICT[/bold magenta]",
                 border_style="red"
@@ -362,10 +384,78 @@ def run_with_live_progress(runner: AutonomousRunner, accepted: List[Suggestion])
     runner.on_implementation = on_implementation
     runner.on_verdict = on_verdict
     
+    return print_agent_output
+
+
+class DeferredOutput:
+    """
+    Console printer that holds output from worker threads while a prompt is open.
+    
+    Printing over an active questionary prompt garbles it, so messages
+    are buffered inside prompting() and flushed when it exits.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._prompting = False
+        self._pending = []
+    
+    def __call__(self, *objects, **kwargs):
+        with self._lock:
+            if self._prompting:
+                self._pending.append((objects, kwargs))
+                return
+            console.print(*objects, **kwargs)
+    
+    @contextmanager
+    def prompting(self):
+        with self._lock:
+            self._prompting = True
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._prompting = False
+                pending, self._pending = self._pending, []
+                for objects, kwargs in pending:
+                    console.print(*objects, **kwargs)
+
+
+def run_with_live_progress(runner: AutonomousRunner, accepted: List[Suggestion]):
+    """Run suggestions with rich live progress display and beautified agent logs."""
+    print_agent_output = install_progress_callbacks(runner)
+    
+    # Track the run so progress is checkpointed and can be resumed from history
+    run = runner.create_run(accepted)
+    run.status = RunStatus.RUNNING
+    run.started_at = datetime.utcnow()
+    run.accepted_count = len(accepted)
+    
     console.print()
     print_agent_output("system", f"Starting autonomous run with {len(accepted)} suggestions")
     console.print()
     
+    try:
+        _run_suggestions_with_panels(runner, run, accepted, print_agent_output)
+    except KeyboardInterrupt:
+        run.status = RunStatus.PAUSED
+        runner.checkpoint(run)
+        print_agent_output("system", f"Run {run.id} paused; resume it from View History")
+        raise
+    
+    run.status = RunStatus.COMPLETED
+    run.completed_at = datetime.utcnow()
+    runner.checkpoint(run)
+    print_agent_output("system", "Autonomous run complete!")
+
+
+def _run_suggestions_with_panels(
+    runner: AutonomousRunner,
+    run: AutonomousRun,
+    accepted: List[Suggestion],
+    print_agent_output: Callable,
+):
+    """Run suggestions one by one, showing a header, diff and result for each."""
     for i, suggestion in enumerate(accepted):
         # Show suggestion header
         console.print(Panel.fit(
@@ -377,6 +467,11 @@ def run_with_live_progress(runner: AutonomousRunner, accepted: List[Suggestion])
         # Run suggestion (callbacks will show progress)
         print_agent_output("worker", f"Starting implementation...")
         success = runner.run_suggestion(suggestion)
+        if success:
+            run.completed_count += 1
+        else:
+            run.failed_count += 1
+        runner.checkpoint(run, suggestion)
         
         # Show diff
         diff = runner.get_git_diff()
@@ -391,8 +486,64 @@ def run_with_live_progress(runner: AutonomousRunner, accepted: List[Suggestion])
         status_color = "green" if success else "red"
         console.print(f"\n[{status_color}]{status_icon} Suggestion {i+1} {'completed' if success else 'failed'}[/{status_color}]\n")
         console.print("─" * 60)
+
+
+def run_streaming_cycle(runner: AutonomousRunner):
+    """Review suggestions as analysis yields them while accepted ones are implemented."""
+    out = DeferredOutput()
+    print_agent_output = install_progress_callbacks(runner, out)
+    max_suggestions = runner.config.max_suggestions
+    reviewed = 0
+    remaining_decision = None  # Set by "Accept/Reject All Remaining"
     
-    print_agent_output("system", "Autonomous run complete!")
+    def accept(suggestion: Suggestion) -> bool:
+        nonlocal reviewed, remaining_decision
+        reviewed += 1
+        if remaining_decision is not None:
+            out(f"  {'[green]✓' if remaining_decision else '[red]✗'}[/] {suggestion.title}")
+            return remaining_decision
+        
+        # Worker output is held back while the prompt is open
+        with out.prompting():
+            console.print()
+            print_suggestion(suggestion, reviewed, max_suggestions)
+            action = questionary.select(
+                "Action:",
+                choices=[
+                    questionary.Choice("Accept", value="accept"),
+                    questionary.Choice("Reject", value="reject"),
+                    questionary.Choice("Accept All Remaining", value="accept_all"),
+                    questionary.Choice("Reject All Remaining", value="reject_all"),
+                ]
+            ).ask()
+        
+        if action in ("accept_all", "reject_all", None):
+            remaining_decision = action == "accept_all"
+        return action in ("accept", "accept_all")
+    
+    console.print()
+    print_agent_output(
+        "system", "Streaming suggestions; accepted ones start while analysis continues"
+    )
+    console.print()
+    
+    run = runner.run_streaming(accept=accept)
+    
+    if not run.total_suggestions:
+        console.print("[yellow]No improvement suggestions found.[/yellow]")
+    
+    # Save run to history
+    try:
+        runner.save_run()
+    except Exception as e:
+        console.print(f"[dim]Could not save run history: {e}[/dim]")
+    
+    # Summary
+    console.print("\n")
+    show_run_summary(runner)
+    show_diff(runner)
+    
+    questionary.press_any_key_to_continue().ask()
 
 
 def run_autonomous_cycle(config: Optional[AutonomousConfig] = None):
@@ -440,6 +591,11 @@ def run_autonomous_cycle(config: Optional[AutonomousConfig] = None):
     # Create runner
     runner = AutonomousRunner(config)
     
+    if config.stream:
+        console.print("\n[bold]Step 3: Review and Implement as Suggestions Arrive[/bold]")
+        run_streaming_cycle(runner)
+        return
+    
     # Generate suggestions
     console.print("\n[bold]Step 3: Generating Suggestions[/bold]")
     with console.status("[bold green]Analyzing codebase...[/bold green]"):
@@ -480,7 +636,12 @@ def run_autonomous_cycle(config: Optional[AutonomousConfig] = None):
     # Execute with live progress
     console.print("\n[bold]Step 5: Implementing Improvements[/bold]\n")
     
-    run_with_live_progress(runner, accepted)
+    if config.parallel_suggestions > 1 or config.pipelined:
+        # Concurrent suggestions interleave output, so skip per-suggestion panels
+        install_progress_callbacks(runner)
+        runner.run_all(accepted)
+    else:
+        run_with_live_progress(runner, accepted)
     
     # Save run to history
     try:
@@ -496,20 +657,13 @@ def run_autonomous_cycle(config: Optional[AutonomousConfig] = None):
     questionary.press_any_key_to_continue().ask()
 
 
-def show_history(config: AutonomousConfig):
-    """Show run history."""
-    console.clear()
-    print_header()
-    
-    runner = AutonomousRunner(config)
-    runs = runner.list_runs()
-    
-    if not runs:
-        console.print("[yellow]No run history found.[/yellow]")
-        questionary.press_any_key_to_continue().ask()
-        return
-    
-    table = Table(title="Run History")
+HISTORY_PAGE_SIZE = 10
+
+
+def _runs_table(runs: List[dict], page: int, status: Optional[str]) -> Table:
+    """Table of run summaries."""
+    title = f"Run History (page {page + 1}{', ' + status if status else ''})"
+    table = Table(title=title)
     table.add_column("ID", style="cyan")
     table.add_column("Status")
     table.add_column("Date")
@@ -517,7 +671,7 @@ def show_history(config: AutonomousConfig):
     table.add_column("Completed")
     table.add_column("Failed")
     
-    for run in runs[:10]:  # Show last 10
+    for run in runs:
         status_color = "green" if run["status"] == "completed" else "yellow"
         table.add_row(
             run["id"],
@@ -527,20 +681,136 @@ def show_history(config: AutonomousConfig):
             str(run["completed"]),
             str(run["failed"]),
         )
+    return table
+
+
+def _suggestions_table(rows: List[dict], page: int) -> Table:
+    """Table of suggestion search results."""
+    table = Table(title=f"Suggestions (page {page + 1})")
+    table.add_column("Run", style="cyan")
+    table.add_column("Title")
+    table.add_column("Status")
+    table.add_column("Iter.")
+    table.add_column("Updated")
+    table.add_column("Files", style="dim")
+    table.add_column("Time")
+    table.add_column("Cost")
     
-    console.print(table)
-    
-    # Option to view details
-    if questionary.confirm("View details of a run?", default=False).ask():
-        run_id = questionary.text("Enter Run ID:").ask()
-        if run_id:
-            loaded = runner.load_run(run_id)
-            if loaded:
-                show_run_summary(runner)
-            else:
-                console.print(f"[red]Run {run_id} not found[/red]")
+    for row in rows:
+        status_color = {"completed": "green", "failed": "red"}.get(row["status"], "yellow")
+        table.add_row(
+            row["run_id"],
+            (row["title"] or "")[:50],
+            f"[{status_color}]{row['status']}[/{status_color}]",
+            str(row["iterations"]),
+            (row["updated_at"] or "-")[:19],
+            (row["files"] or "-")[:60],
+            f"{row['duration_s']:.0f}s",
+            f"${row['cost']:.4f}",
+        )
+    return table
+
+
+def _ask_suggestion_filters() -> dict:
+    """Prompt for suggestion search filters (blank = any)."""
+    status = questionary.select(
+        "Status:",
+        choices=[questionary.Choice("Any", value="")] + [
+            questionary.Choice(s.value, value=s.value) for s in SuggestionStatus
+        ]
+    ).ask()
+    file = questionary.text("Touching file (blank = any):").ask()
+    days = questionary.text("Updated in the last N days (blank = any):").ask()
+    try:
+        since = datetime.utcnow() - timedelta(days=int(days)) if days else None
+    except ValueError:
+        since = None
+    return {"status": status or None, "file": file or None, "since": since}
+
+
+def show_history(config: AutonomousConfig):
+    """Show run history, with paging, status filters and suggestion search."""
+    runner = AutonomousRunner(config)
+    view = "runs"
+    filters: dict = {}
+    page = 0
     
-    questionary.press_any_key_to_continue().ask()
+    while True:
+        console.clear()
+        print_header()
+        
+        # Fetch one extra row to know whether there is a next page
+        offset = page * HISTORY_PAGE_SIZE
+        if view == "runs":
+            rows = runner.list_runs(limit=HISTORY_PAGE_SIZE + 1, offset=offset, **filters)
+        else:
+            rows = runner.find_suggestions(limit=HISTORY_PAGE_SIZE + 1, offset=offset, **filters)
+        has_next = len(rows) > HISTORY_PAGE_SIZE
+        rows = rows[:HISTORY_PAGE_SIZE]
+        
+        if view == "runs" and not rows and page == 0 and not filters:
+            console.print("[yellow]No run history found.[/yellow]")
+            questionary.press_any_key_to_continue().ask()
+            return
+        
+        if not rows:
+            console.print("[yellow]Nothing matches these filters.[/yellow]")
+        elif view == "runs":
+            console.print(_runs_table(rows, page, filters.get("status")))
+        else:
+            console.print(_suggestions_table(rows, page))
+        
+        choices = []
+        if has_next:
+            choices.append(questionary.Choice("Next page →", value="next"))
+        if page > 0:
+            choices.append(questionary.Choice("← Previous page", value="previous"))
+        choices += [
+            questionary.Choice("View details of a run", value="details"),
+            questionary.Choice("Resume an unfinished run", value="resume"),
+            questionary.Choice("Filter runs by status", value="filter_runs"),
+            questionary.Choice("Search suggestions (status, file, date)", value="search"),
+        ]
+        if view != "runs" or filters:
+            choices.append(questionary.Choice("Show all runs", value="all_runs"))
+        choices.append(questionary.Choice("← Back", value="back"))
+        
+        action = questionary.select("Action:", choices=choices).ask()
+        
+        if action == "back" or action is None:
+            return
+        elif action == "next":
+            page += 1
+        elif action == "previous":
+            page -= 1
+        elif action == "filter_runs":
+            status = questionary.select(
+                "Run status:",
+                choices=[questionary.Choice("Any", value="")] + [
+                    questionary.Choice(s.value, value=s.value) for s in RunStatus
+                ]
+            ).ask()
+            view, filters, page = "runs", ({"status": status} if status else {}), 0
+        elif action == "search":
+            view, filters, page = "suggestions", _ask_suggestion_filters(), 0
+        elif action == "all_runs":
+            view, filters, page = "runs", {}, 0
+        elif action in ("details", "resume"):
+            run_id = questionary.text("Enter Run ID:").ask()
+            if run_id and action == "details":
+                loaded = runner.load_run(run_id)
+                if loaded:
+                    show_run_summary(runner)
+                else:
+                    console.print(f"[red]Run {run_id} not found[/red]")
+            elif run_id:
+                install_progress_callbacks(runner)
+                if runner.resume_run(run_id):
+                    show_run_summary(runner)
+                    show_diff(runner)
+                else:
+                    console.print(f"[red]Run {run_id} not found[/red]")
+            questionary.press_any_key_to_continue().ask()
 
 
 def show_settings(config: AutonomousConfig) -> AutonomousConfig:
@@ -559,6 +829,10 @@ def show_settings(config: AutonomousConfig) -> AutonomousConfig:
 [dim]Context Size:[/dim] {config.num_ctx} tokens
 [dim]Analysis Types:[/dim] {', '.join(config.analysis_types)}
 [dim]Auto Accept:[/dim] {config.auto_accept}
+[dim]Streaming:[/dim] {config.stream}
+[dim]Parallel Suggestions:[/dim] {config.parallel_suggestions}
+[dim]Pipelined:[/dim] {config.pipelined}
+[dim]History Backend:[/dim] {config.history_backend}
 [dim]Headless Mode:[/dim] {config.headless}""",
             title="Settings"
         ))
@@ -572,6 +846,10 @@ def show_settings(config: AutonomousConfig) -> AutonomousConfig:
                 questionary.Choice("Change Max Iterations", value="max_iterations"),
                 questionary.Choice("Change Context Size", value="num_ctx"),
                 questionary.Choice("Toggle Auto Accept", value="auto_accept"),
+                questionary.Choice("Toggle Streaming", value="stream"),
+                questionary.Choice(
+                    "Toggle History Backend (journal/sqlite)", value="history_backend"
+                ),
                 questionary.Choice("← Back", value="back"),
             ]
         ).ask()
@@ -606,6 +884,10 @@ def show_settings(config: AutonomousConfig) -> AutonomousConfig:
                 pass
         elif action == "auto_accept":
             config.auto_accept = not config.auto_accept
+        elif action == "stream":
+            config.stream = not config.stream
+        elif action == "history_backend":
+            config.history_backend = "journal" if config.history_backend == "sqlite" else "sqlite"
         
         console.clear()
         print_header()
@@ -613,30 +895,51 @@ def show_settings(config: AutonomousConfig) -> AutonomousConfig:
     return config
 
 
-def run_headless(config: AutonomousConfig):
+def run_headless(config: AutonomousConfig, resume: Optional[str] = None):
     """Run in headless mode (for CI/automation)."""
     console.print("[bold]Running in headless mode...[/bold]")
     
     runner = AutonomousRunner(config)
     
-    # Generate suggestions
-    console.print("Generating suggestions...")
-    suggestions = runner.generate_suggestions()
-    
-    if not suggestions:
-        console.print("No suggestions generated.")
-        return
-    
-    console.print(f"Generated {len(suggestions)} suggestions")
-    
-    # Auto-accept all
-    for s in suggestions:
-        s.status = SuggestionStatus.ACCEPTED
-        console.print(f"  [green]✓[/green] {s.title}")
-    
-    # Run
-    console.print("\nImplementing...")
-    run = runner.run_all(suggestions)
+    if resume:
+        # Continue a checkpointed run ("latest" = state file or most recent unfinished run)
+        console.print("Resuming run...")
+        run = runner.resume_run(None if resume == "latest" else resume)
+        if run is None:
+            console.print("No unfinished run to resume.")
+            sys.exit(1)
+    elif config.stream:
+        # Implement each suggestion as soon as analysis yields it
+        console.print("Streaming suggestions...")
+        
+        def accept(s: Suggestion) -> bool:
+            console.print(f"  [green]✓[/green] {s.title}")
+            return True
+        
+        run = runner.run_streaming(accept=accept)
+        
+        if not run.total_suggestions:
+            console.print("No suggestions generated.")
+            return
+    else:
+        # Generate suggestions
+        console.print("Generating suggestions...")
+        suggestions = runner.generate_suggestions()
+        
+        if not suggestions:
+            console.print("No suggestions generated.")
+            return
+        
+        console.print(f"Generated {len(suggestions)} suggestions")
+        
+        # Auto-accept all
+        for s in suggestions:
+            s.status = SuggestionStatus.ACCEPTED
+            console.print(f"  [green]✓[/green] {s.title}")
+        
+        # Run
+        console.print("\nImplementing...")
+        run = runner.run_all(suggestions)
     
     # Save
     try:
@@ -665,6 +968,14 @@ Examples:
   python autonomous_cli.py --headless               # Headless mode
   python autonomous_cli.py --target /path/to/repo   # Specify target
   python autonomous_cli.py --max-suggestions 3      # Limit suggestions
+  python autonomous_cli.py --headless --changed-since origin/main  # CI on pull requests
+  python autonomous_cli.py --headless --stream      # Implement while analysis runs
+  python autonomous_cli.py --headless --parallel 4  # 4 suggestions at once in git worktrees
+  python autonomous_cli.py --headless --pipeline    # Implement next suggestion while judging
+  python autonomous_cli.py --headless --resume      # Continue the last interrupted run
+  python autonomous_cli.py --headless --check "pytest -q"  # Tests must pass before judging
+  python autonomous_cli.py --trace trace.jsonl      # Record spans to JSONL
+  python autonomous_cli.py --profile run.folded     # Sample stacks for a flamegraph
 """
     )
     parser.add_argument("--headless", action="store_true", help="Run without interactive prompts")
@@ -674,9 +985,51 @@ Examples:
     parser.add_argument("--max-suggestions", type=int, default=5, help="Maximum suggestions to generate")
     parser.add_argument("--max-iterations", type=int, default=3, help="Maximum worker-judge iterations")
     parser.add_argument("--auto-accept", action="store_true", help="Auto-accept all suggestions")
+    parser.add_argument("--changed-since", type=str, default=None, metavar="REF",
+                        help="Only analyze files changed since a git ref "
+                             "('last-run' = previous run's HEAD)")
+    parser.add_argument("--no-analysis-cache", action="store_true",
+                        help="Re-analyze every file, ignoring cached results")
+    parser.add_argument("--parallel", type=int, default=1, metavar="N",
+                        help="Implement up to N suggestions at once, each in its own git worktree")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Overlap worker and judge: implement the next suggestion "
+                             "while the previous is judged")
+    parser.add_argument("--stream", action="store_true",
+                        help="Yield suggestions as files are analyzed and start "
+                             "implementing them immediately")
+    parser.add_argument("--resume", nargs="?", const="latest", default=None, metavar="RUN_ID",
+                        help="Resume a checkpointed run (default: the most recent unfinished run)")
+    parser.add_argument("--state-file", type=str, default=None,
+                        help="Also checkpoint a full JSON snapshot of the run to this file")
+    parser.add_argument("--check", action="append", default=[], metavar="CMD",
+                        dest="precheck_commands",
+                        help="Command that must pass before the judge reviews an attempt "
+                             "(repeatable)")
+    parser.add_argument("--no-precheck", action="store_true",
+                        help="Send every attempt to the judge without static checks")
+    parser.add_argument("--max-diff-lines", type=int, default=2000, metavar="N",
+                        help="Reject attempts whose diff exceeds N changed lines (0 = no cap)")
+    parser.add_argument("--history-backend", choices=["journal", "sqlite"], default="journal",
+                        help="Store run history as JSONL journals or in an indexed SQLite database")
+    parser.add_argument("--trace", type=str, default=None,
+                        help="Write tracing spans to this JSONL file")
+    parser.add_argument("--otlp-endpoint", type=str, default=None,
+                        help="Export spans to an OTLP/HTTP collector")
+    parser.add_argument("--profile", type=str, default=None,
+                        help="Write sampled collapsed stacks to this file")
     
     args = parser.parse_args()
     
+    # Tracing (disabled unless an exporter is configured)
+    if args.trace:
+        get_tracer().add_exporter(JsonlSpanExporter(args.trace))
+    if args.otlp_endpoint:
+        try:
+            get_tracer().add_exporter(OTLPSpanExporter(endpoint=args.otlp_endpoint))
+        except ImportError as e:
+            console.print(f"[yellow]{e}[/yellow]")
+    
     # Create config from args
     config = AutonomousConfig(
         target_repo=args.target,
@@ -686,13 +1039,46 @@ Examples:
         max_iterations=args.max_iterations,
         auto_accept=args.auto_accept,
         headless=args.headless,
+        use_analysis_cache=not args.no_analysis_cache,
+        changed_since=args.changed_since,
+        stream=args.stream,
+        parallel_suggestions=max(1, args.parallel),
+        pipelined=args.pipeline,
+        state_file=args.state_file,
+        history_backend=args.history_backend,
+        precheck=not args.no_precheck,
+        precheck_commands=args.precheck_commands,
+        max_diff_lines=args.max_diff_lines or None,
     )
     
+    # Sampling profiler (flamegraph-ready output written on exit)
+    profiler = SamplingProfiler().start() if args.profile else None
+    
+    def finish():
+        get_tracer().shutdown()
+        if profiler:
+            profiler.stop()
+            profiler.write_collapsed(args.profile)
+    
     # Headless mode
     if args.headless:
-        run_headless(config)
+        try:
+            run_headless(config, resume=args.resume)
+        finally:
+            finish()
         return
     
+    # Interactive resume goes straight to the interrupted run
+    if args.resume:
+        runner = AutonomousRunner(config)
+        install_progress_callbacks(runner)
+        if runner.resume_run(None if args.resume == "latest" else args.resume):
+            show_run_summary(runner)
+            show_diff(runner)
+        else:
+            console.print("[yellow]No unfinished run to resume.[/yellow]")
+        questionary.press_any_key_to_continue().ask()
+    
     # Interactive mode
     while True:
         console.clear()
@@ -752,6 +1138,7 @@ Press any key to continue...
             questionary.press_any_key_to_continue().ask()
         elif action == "exit" or action is None:
             console.print("\n[bold green]Goodbye! 👋[/bold green]")
+            finish()
             break
 
 
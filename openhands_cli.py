@@ -28,6 +28,8 @@ from rich.syntax import Syntax
 from rich.table import Table
 import questionary
 
+from agent_factory.files import DEFAULT_PRUNE_DIRS, get_file_index
+
 # Suppress warnings
 warnings.filterwarnings("ignore")
 
@@ -82,14 +84,11 @@ def display_file_content(workspace: Path, filename: Path):
 
 
 def get_file_state(workspace: Path) -> dict:
-    """Get current file state (path -> mtime) for change detection."""
-    state = {}
+    """Get current file state (path -> (mtime_ns, size)) for change detection."""
     if not workspace.exists():
-        return state
-    for path in workspace.rglob("*"):
-        if path.is_file() and ".openhands" not in str(path):
-            state[str(path.relative_to(workspace))] = path.stat().st_mtime
-    return state
+        return {}
+    index = get_file_index(workspace, prune_dirs=DEFAULT_PRUNE_DIRS | {".openhands"})
+    return index.stat_snapshot()
 
 
 def get_ollama_models() -> list[str]:
@@ -0,0 +1,6 @@
+"""Shared test configuration."""
+
+import os
+
+# Use litellm's bundled cost map instead of fetching it on import
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
@@ -0,0 +1,122 @@
+"""Tests for hierarchical budget admission."""
+
+import pytest
+
+from agent_factory.llm.budget import BudgetAction, BudgetManager
+
+MESSAGES = [{"role": "user", "content": "Summarize the change log."}]
+
+
+def make_manager(**kwargs):
+    soft, hard = [], []
+    manager = BudgetManager(
+        on_soft_limit=lambda budget, spent: soft.append((budget.scope, spent)),
+        on_hard_limit=lambda budget, spent: hard.append((budget.scope, spent)),
+        **kwargs,
+    )
+    return manager, soft, hard
+
+
+class TestAdmission:
+    def test_allow_reserves_estimate(self):
+        manager, _, _ = make_manager(global_limit_usd=10.0)
+        decision = manager.admit(MESSAGES, "gpt-4o", max_tokens=1000)
+
+        assert decision.action == BudgetAction.ALLOW
+        assert decision.model == "gpt-4o"
+        assert decision.estimated_cost_usd > 0
+        assert manager.get_status()["global"]["reserved_usd"] == pytest.approx(
+            decision.estimated_cost_usd
+        )
+
+        manager.commit(decision, 0.002)
+        status = manager.get_status()["global"]
+        assert status["reserved_usd"] == 0
+        assert status["spent_usd"] == pytest.approx(0.002)
+
+    def test_release_drops_reservation_without_spend(self):
+        manager, _, _ = make_manager(global_limit_usd=10.0)
+        decision = manager.admit(MESSAGES, "gpt-4o", max_tokens=1000)
+        manager.release(decision)
+        manager.release(decision)  # Idempotent
+
+        status = manager.get_status()["global"]
+        assert status["reserved_usd"] == 0
+        assert status["spent_usd"] == 0
+
+    def test_downgrade_to_cheaper_model_in_same_tier(self):
+        manager, _, hard = make_manager(global_limit_usd=0.005)
+        decision = manager.admit(MESSAGES, "gpt-4o", max_tokens=1000)
+
+        assert decision.action == BudgetAction.DOWNGRADE
+        assert decision.requested_model == "gpt-4o"
+        assert decision.model != "gpt-4o"
+        assert decision.estimated_cost_usd <= 0.005
+        assert decision.limiting_scope == "global"
+        assert hard == []
+
+    def test_reject_when_downgrade_disallowed(self):
+        manager, _, hard = make_manager()
+        manager.set_budget("global", 0.005, allow_downgrade=False)
+        decision = manager.admit(MESSAGES, "gpt-4o", max_tokens=1000)
+
+        assert decision.action == BudgetAction.REJECT
+        assert decision.reservation_id is None
+        assert hard == [("global", 0.0)]
+
+    def test_child_budget_limits_before_parent(self):
+        manager, _, _ = make_manager(global_limit_usd=10.0)
+        manager.set_budget("agent:planner", 0.001, allow_downgrade=False)
+
+        rejected = manager.admit(MESSAGES, "gpt-4o", max_tokens=1000, tags=["agent:planner"])
+        allowed = manager.admit(MESSAGES, "gpt-4o", max_tokens=1000, tags=["agent:judge"])
+
+        assert rejected.action == BudgetAction.REJECT
+        assert rejected.limiting_scope == "agent:planner"
+        assert allowed.action == BudgetAction.ALLOW
+        assert allowed.scopes == ["global"]
+
+    def test_reservations_count_against_concurrent_requests(self):
+        manager, _, _ = make_manager()
+        manager.set_budget("global", 0.015, allow_downgrade=False)
+        first = manager.admit(MESSAGES, "gpt-4o", max_tokens=1000)
+        second = manager.admit(MESSAGES, "gpt-4o", max_tokens=1000)
+
+        assert first.action == BudgetAction.ALLOW
+        assert second.action == BudgetAction.REJECT
+
+    def test_unpriced_model_rejected_once_budget_spent(self):
+        manager, _, _ = make_manager(global_limit_usd=1.0)
+        assert manager.admit(MESSAGES, "local-model").action == BudgetAction.ALLOW
+
+        manager.record(1.0)
+        assert manager.admit(MESSAGES, "local-model").action == BudgetAction.REJECT
+
+
+class TestCallbacks:
+    def test_soft_then_hard_fire_once_per_period(self):
+        manager, soft, hard = make_manager(global_limit_usd=1.0, soft_threshold=0.8)
+        manager.set_budget("tenant:acme", 0.5)
+
+        manager.record(0.25, tags=["tenant:acme"])
+        assert soft == [] and hard == []
+
+        manager.record(0.1875, tags=["tenant:acme"])
+        assert soft == [("tenant:acme", 0.4375)]
+
+        manager.record(0.0625, tags=["tenant:acme"])
+        manager.record(0.375)
+        assert hard == [("tenant:acme", 0.5)]
+        assert soft == [("tenant:acme", 0.4375), ("global", 0.875)]
+
+        manager.record(0.25)
+        manager.record(0.125, tags=["tenant:acme"])
+        assert hard == [("tenant:acme", 0.5), ("global", 1.125)]
+        assert len(soft) == 2
+
+    def test_reset_rearms_callbacks(self):
+        manager, soft, _ = make_manager(global_limit_usd=1.0)
+        manager.record(0.9)
+        manager.reset()
+        manager.record(0.9)
+        assert len(soft) == 2
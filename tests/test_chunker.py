@@ -0,0 +1,88 @@
+"""Tests for syntactic source chunking."""
+
+import pytest
+
+from agent_factory.autonomous.chunker import chunk_budget_chars, chunk_source
+
+
+def python_source(functions=30):
+    parts = [
+        '"""Module docstring."""\n',
+        "\n",
+        "import os\n",
+        "from typing import List\n",
+        "\n",
+        "# Leading comment for the first function\n",
+    ]
+    for i in range(functions):
+        parts.append(f"\n\ndef function_{i}(value: int) -> int:\n")
+        parts.append(f'    """Return value plus {i}."""\n')
+        parts.extend(f"    value += {j}\n" for j in range(i % 5 + 1))
+        parts.append("    return value\n")
+    parts.append("\n\nclass Service:\n")
+    for i in range(20):
+        parts.append(f"\n    def method_{i}(self) -> List[str]:\n")
+        parts.append(f"        return [os.sep] * {i}\n")
+    parts.append("\n\nif __name__ == '__main__':\n    function_0(1)\n")
+    return "".join(parts)
+
+
+def javascript_source(blocks=40):
+    parts = ["// Generated helpers\n"]
+    for i in range(blocks):
+        parts.append(f"\nfunction helper{i}(x) {{\n")
+        parts.extend(f"  x = x + {j};\n" for j in range(i % 4 + 1))
+        parts.append("  return x;\n}\n")
+    return "".join(parts)
+
+
+def assert_rejoins(chunks, content):
+    assert chunks[0].context + "".join(chunk.text for chunk in chunks) == content
+    for previous, chunk in zip(chunks, chunks[1:], strict=False):
+        assert chunk.start_line == previous.end_line + 1
+    assert [chunk.index for chunk in chunks] == list(range(len(chunks)))
+    assert all(chunk.total == len(chunks) for chunk in chunks)
+
+
+class TestChunkSource:
+    def test_small_file_is_one_chunk(self):
+        content = "import os\n\nprint(os.sep)\n"
+        chunks = chunk_source(content, "small.py", 1000)
+        assert len(chunks) == 1
+        assert chunks[0].is_whole_file
+        assert chunks[0].text == content
+        assert chunks[0].context == ""
+
+    @pytest.mark.parametrize("max_chars", [300, 600, 1500])
+    def test_python_chunks_rejoin_to_source(self, max_chars):
+        content = python_source()
+        chunks = chunk_source(content, "pkg/module.py", max_chars)
+        assert len(chunks) > 1
+        assert_rejoins(chunks, content)
+        assert "import os" in chunks[0].context
+        assert all(len(chunk.context) + len(chunk.text) <= max_chars for chunk in chunks)
+
+    def test_python_chunks_split_between_definitions(self):
+        chunks = chunk_source(python_source(), "pkg/module.py", 600)
+        for chunk in chunks[1:]:
+            first_code = next(line for line in chunk.text.splitlines() if line.strip())
+            assert first_code.lstrip().startswith(("def ", "class ", "if __name__"))
+        assert any("function_0" in chunk.symbols for chunk in chunks)
+
+    def test_unparseable_python_falls_back(self):
+        content = python_source().replace("def function_3(", "def function_3((")
+        chunks = chunk_source(content, "broken.py", 500)
+        assert len(chunks) > 1
+        assert_rejoins(chunks, content)
+
+    @pytest.mark.parametrize("max_chars", [200, 500])
+    def test_generic_chunks_rejoin_to_source(self, max_chars):
+        content = javascript_source()
+        chunks = chunk_source(content, "web/helpers.js", max_chars)
+        assert len(chunks) > 1
+        assert_rejoins(chunks, content)
+        assert all(chunk.context == "" for chunk in chunks)
+
+    def test_budget_has_a_floor(self):
+        assert chunk_budget_chars(2048) == 1000
+        assert chunk_budget_chars(32768, chunk_tokens=6000) == 6000 * 4
@@ -0,0 +1,64 @@
+"""Tests for near-duplicate improvement clustering."""
+
+import pytest
+
+from agent_factory.autonomous.dedup import find_clusters
+
+
+def improvement(title, files=(), description="", category="documentation"):
+    return {
+        "title": title,
+        "description": description,
+        "category": category,
+        "affected_files": list(files),
+    }
+
+
+class TestFindClusters:
+    def test_titles_differing_only_in_file_names_merge(self):
+        improvements = [
+            improvement("Add docstrings to a.py", ["a.py"], "Public functions lack docs."),
+            improvement("Add docstrings to b.py", ["b.py"], "Several helpers are undocumented."),
+            improvement("Add docstrings to c.py", ["c.py"], "Classes have no docstrings."),
+        ]
+        assert find_clusters(improvements, threshold=0.9) == [[0, 1, 2]]
+
+    def test_threshold_controls_partial_title_overlap(self):
+        # Title token Jaccard is 2/4 = 0.5
+        improvements = [
+            improvement("Handle timeout errors", description="Wrap the client call."),
+            improvement("Handle timeout retries", description="Back off between tries."),
+        ]
+        assert find_clusters(improvements, threshold=0.5) == [[0, 1]]
+        assert find_clusters(improvements, threshold=0.6) == [[0], [1]]
+
+    def test_near_identical_descriptions_merge(self):
+        description = (
+            "The parser reads the whole configuration file into memory and then "
+            "walks every section twice, once to validate and once to build objects"
+        )
+        improvements = [
+            improvement("Stream configuration parsing", description=description),
+            improvement("Single pass config loader", description=description + " again"),
+        ]
+        assert find_clusters(improvements, threshold=0.7) == [[0, 1]]
+
+    def test_different_categories_never_merge(self):
+        improvements = [
+            improvement("Add docstrings to a.py", ["a.py"], category="documentation"),
+            improvement("Add docstrings to b.py", ["b.py"], category="refactoring"),
+        ]
+        assert find_clusters(improvements, threshold=0.5) == [[0], [1]]
+
+    def test_threshold_above_one_keeps_everything_separate(self):
+        improvements = [improvement("Add docstrings to a.py", ["a.py"])] * 3
+        assert find_clusters(improvements, threshold=1.01) == [[0], [1], [2]]
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.8])
+    def test_clusters_partition_indices_in_order(self, threshold):
+        titles = ["Add logging", "Add logging to parser", "Fix typo", "Fix typos", "Cache results"]
+        improvements = [improvement(title, category="maintainability") for title in titles]
+        clusters = find_clusters(improvements, threshold)
+        assert sorted(i for cluster in clusters for i in cluster) == list(range(len(titles)))
+        assert [cluster[0] for cluster in clusters] == sorted(cluster[0] for cluster in clusters)
+        assert all(cluster == sorted(cluster) for cluster in clusters)
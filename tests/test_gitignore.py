@@ -0,0 +1,83 @@
+"""FileIndex gitignore handling checked against git itself."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from agent_factory.files import FileIndex
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+TREE = {
+    ".gitignore": "*.log\n!keep.log\nbuild/\n!build/rescued.py\n/rootonly.txt\n**/gen/*.py\n",
+    "main.py": "",
+    "debug.log": "",
+    "keep.log": "",
+    "rootonly.txt": "",
+    "build/out.py": "",
+    "build/rescued.py": "",
+    "lib/gen/model.py": "",
+    "lib/gen/schema.json": "",
+    "lib/rootonly.txt": "",
+    "sub/.gitignore": "*.tmp\n!important.tmp\ndata/\n/local.cfg\ndocs/*\n!docs/index.md\n",
+    "sub/a.tmp": "",
+    "sub/important.tmp": "",
+    "sub/local.cfg": "",
+    "sub/data/file.txt": "",
+    "sub/deep/local.cfg": "",
+    "sub/deep/b.tmp": "",
+    "sub/deep/trace.log": "",
+    "sub/deep/.gitignore": "!*.log\n",
+    "sub/docs/index.md": "",
+    "sub/docs/draft.md": "",
+    "secret.env": "",
+    "other/secret.env": "",
+}
+
+
+def git_files(cwd):
+    """Files git would list (tracked or untracked, not ignored), relative to cwd."""
+    out = subprocess.run(
+        ["git", "ls-files", "--cached", "--others", "--exclude-standard"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return sorted(out.splitlines())
+
+
+@pytest.fixture
+def repo(tmp_path):
+    for rel_path, content in TREE.items():
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    (tmp_path / ".git" / "info" / "exclude").write_text("secret.env\n")
+    return tmp_path
+
+
+class TestGitignore:
+    def test_matches_git_ls_files(self, repo):
+        assert FileIndex(repo).list_source_files() == git_files(repo)
+
+    def test_negation_and_excluded_parents(self, repo):
+        files = set(FileIndex(repo).list_source_files())
+        assert "keep.log" in files
+        assert "debug.log" not in files
+        # A file cannot be re-included when its directory is excluded
+        assert "build/rescued.py" not in files
+        assert "sub/deep/trace.log" in files
+        assert "sub/docs/index.md" in files
+        assert "sub/docs/draft.md" not in files
+
+    def test_subdirectory_root_sees_parent_rules(self, repo):
+        sub = repo / "sub"
+        assert FileIndex(sub).list_source_files() == git_files(sub)
+
+    def test_gitignore_can_be_disabled(self, repo):
+        files = FileIndex(repo, use_gitignore=False).list_source_files()
+        assert "debug.log" in files
+        assert "sub/data/file.txt" in files
@@ -0,0 +1,93 @@
+"""Tests for the append-only run journal."""
+
+import json
+
+from agent_factory.autonomous.journal import RunJournal
+from agent_factory.autonomous.models import AutonomousRun, RunStatus, Suggestion, SuggestionStatus
+
+
+def make_run(count=3):
+    run = AutonomousRun(id="run1", target_repo="/tmp/repo", status=RunStatus.RUNNING)
+    run.suggestions = [
+        Suggestion(id=f"s{i}", title=f"Suggestion {i}", description="Change") for i in range(count)
+    ]
+    run.total_suggestions = count
+    return run
+
+
+def read_events(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestRunJournal:
+    def test_replay_returns_latest_state(self, tmp_path):
+        journal = RunJournal(tmp_path)
+        run = make_run()
+        journal.append(run)
+
+        run.suggestions[1].status = SuggestionStatus.COMPLETED
+        run.completed_count = 1
+        journal.append(run, [run.suggestions[1]])
+
+        data = journal.replay(run.id)
+        assert [s["id"] for s in data["suggestions"]] == ["s0", "s1", "s2"]
+        assert data["suggestions"][1]["status"] == "completed"
+        assert data["completed_count"] == 1
+        # Only the changed suggestion is appended after the first checkpoint
+        assert len(read_events(journal.journal_path(run.id))) == 3 + 1 + 2
+
+    def test_torn_final_line_is_ignored(self, tmp_path):
+        journal = RunJournal(tmp_path)
+        run = make_run()
+        path = journal.append(run)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"type": "suggestion", "data": {"id": "s1", "sta')
+
+        data = RunJournal(tmp_path).replay(run.id)
+        assert data is not None
+        assert [s["status"] for s in data["suggestions"]] == ["pending"] * 3
+
+    def test_append_after_torn_line_keeps_journal_parseable(self, tmp_path):
+        path = RunJournal(tmp_path).append(make_run())
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"type": "run", "da')
+
+        # A new process resumes the run and keeps appending
+        journal = RunJournal(tmp_path)
+        run = make_run()
+        run.suggestions[0].status = SuggestionStatus.FAILED
+        journal.append(run, [run.suggestions[0]])
+        journal.append(run)
+
+        data = journal.replay(run.id)
+        assert data["suggestions"][0]["status"] == "failed"
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert lines[4] == '{"type": "run", "da'
+        assert all(json.loads(line) for line in lines[5:])
+
+    def test_compact_keeps_one_event_per_suggestion(self, tmp_path):
+        journal = RunJournal(tmp_path)
+        run = make_run()
+        journal.append(run)
+        for suggestion in run.suggestions:
+            suggestion.status = SuggestionStatus.COMPLETED
+            journal.append(run, [suggestion])
+        run.status = RunStatus.COMPLETED
+        run.completed_count = 3
+        journal.append(run)
+        before = journal.replay(run.id)
+
+        path = journal.compact(run)
+
+        events = read_events(path)
+        assert [e["type"] for e in events] == ["suggestion"] * 3 + ["run"]
+        assert journal.replay(run.id) == before
+
+    def test_index_lists_runs_without_reading_journals(self, tmp_path):
+        journal = RunJournal(tmp_path)
+        run = make_run()
+        journal.append(run)
+        journal.journal_path(run.id).unlink()
+
+        runs = RunJournal(tmp_path).list_runs()
+        assert [(r["id"], r["total"]) for r in runs] == [("run1", 3)]
@@ -0,0 +1,142 @@
+"""Tests for the Worker → Judge suggestion pipeline."""
+
+import threading
+
+from agent_factory.autonomous.models import Suggestion, SuggestionStatus
+from agent_factory.autonomous.pipeline import SuggestionPipeline
+from agent_factory.llm.router import BudgetExceededError
+
+
+def make_suggestion(sid, files):
+    return Suggestion(
+        id=sid,
+        title=f"Suggestion {sid}",
+        description="Change",
+        status=SuggestionStatus.ACCEPTED,
+        affected_files=list(files),
+    )
+
+
+class FakeRunner:
+    """Records stage calls; verdicts maps id -> outcomes per attempt (None = retry)."""
+
+    def __init__(self, verdicts=None, gates=None, reject=()):
+        self.verdicts = verdicts or {}
+        self.gates = gates or {}
+        self.reject = set(reject)
+        self.events = []
+        self.started = threading.Event()
+        self._lock = threading.Lock()
+
+    def _log(self, *event):
+        with self._lock:
+            self.events.append(event)
+
+    @staticmethod
+    def _first_iteration(_suggestion):
+        return 1
+
+    def _publish_queue_depth(self, name, depth):
+        pass
+
+    def implement_suggestion(self, suggestion):
+        self._log("implement", suggestion.id, suggestion.iterations)
+        self.started.set()
+        gate = self.gates.get(suggestion.id)
+        if gate is not None:
+            gate.wait(5)
+        if suggestion.id in self.reject:
+            raise BudgetExceededError("Request rejected by budget")
+        return f"logs for {suggestion.id}"
+
+    def judge_implementation(self, suggestion, logs):
+        self._log("judge", suggestion.id, suggestion.iterations)
+        return logs
+
+    def _apply_verdict(self, suggestion, _verdict, attempt):
+        outcomes = self.verdicts.get(suggestion.id, [True])
+        return outcomes[min(attempt, len(outcomes)) - 1]
+
+
+def run_pipeline(runner, suggestions, queue_size=2):
+    finished = []
+    pipeline = SuggestionPipeline(
+        runner,
+        queue_size=queue_size,
+        on_finished=lambda s, ok: finished.append((s.id, ok)),
+    ).start()
+    for suggestion in suggestions:
+        pipeline.submit(suggestion)
+    pipeline.close()
+    pipeline.join()
+    return pipeline, finished
+
+
+class TestSuggestionPipeline:
+    def test_every_suggestion_gets_one_final_verdict(self):
+        runner = FakeRunner(verdicts={"b": [False]})
+        suggestions = [make_suggestion(sid, [f"{sid}.py"]) for sid in "abc"]
+        pipeline, finished = run_pipeline(runner, suggestions)
+
+        assert sorted(finished) == [("a", True), ("b", False), ("c", True)]
+        assert pipeline.error is None
+
+    def test_retry_holds_files_until_final_verdict(self):
+        runner = FakeRunner(verdicts={"a": [None, None, True]})
+        suggestions = [
+            make_suggestion("a", ["shared.py"]),
+            make_suggestion("b", ["shared.py"]),
+            make_suggestion("c", ["other.py"]),
+        ]
+        _, finished = run_pipeline(runner, suggestions)
+
+        implemented = [e for e in runner.events if e[0] == "implement"]
+        assert [e for e in implemented if e[1] == "a"] == [
+            ("implement", "a", 1), ("implement", "a", 2), ("implement", "a", 3),
+        ]
+        # b overlaps a, so it waits for a's last attempt
+        assert implemented.index(("implement", "b", 1)) > implemented.index(("implement", "a", 3))
+        assert sorted(finished) == [("a", True), ("b", True), ("c", True)]
+
+    def test_unknown_footprint_runs_exclusively(self):
+        gate = threading.Event()
+        runner = FakeRunner(gates={"a": gate})
+        pipeline = SuggestionPipeline(runner).start()
+        pipeline.submit(make_suggestion("a", []))
+        pipeline.submit(make_suggestion("b", ["b.py"]))
+        gate.set()
+        pipeline.close()
+        pipeline.join()
+
+        assert runner.events.index(("implement", "b", 1)) > runner.events.index(("judge", "a", 1))
+
+    def test_stop_abandons_unstarted_suggestions(self):
+        gate = threading.Event()
+        runner = FakeRunner(gates={"a": gate})
+        finished = []
+        pipeline = SuggestionPipeline(
+            runner, on_finished=lambda s, ok: finished.append((s.id, ok))
+        ).start()
+        suggestions = [make_suggestion(sid, ["shared.py"]) for sid in "abc"]
+        for suggestion in suggestions:
+            pipeline.submit(suggestion)
+
+        assert runner.started.wait(5)
+        pipeline.stop()
+        pipeline.submit(make_suggestion("late", ["late.py"]))  # Ignored once stopped
+        gate.set()
+        pipeline.join()
+
+        # The in-flight suggestion still reaches its verdict
+        assert finished == [("a", True)]
+        assert [e[1] for e in runner.events if e[0] == "implement"] == ["a"]
+        assert [s.status for s in suggestions[1:]] == [SuggestionStatus.ACCEPTED] * 2
+
+    def test_budget_rejection_stops_pipeline(self):
+        runner = FakeRunner(reject={"a"})
+        suggestions = [make_suggestion("a", ["a.py"]), make_suggestion("b", ["a.py"])]
+        pipeline, finished = run_pipeline(runner, suggestions)
+
+        assert isinstance(pipeline.error, BudgetExceededError)
+        assert finished == []
+        assert [e[1] for e in runner.events if e[0] == "implement"] == ["a"]
@@ -0,0 +1,143 @@
+"""Tests for conflict-aware suggestion scheduling."""
+
+from agent_factory.autonomous.models import Suggestion
+from agent_factory.autonomous.scheduler import (
+    ConflictScheduler,
+    build_conflict_graph,
+    files_conflict,
+    schedule_batches,
+)
+
+
+def make_suggestion(sid, files, priority=5, description="Change"):
+    return Suggestion(
+        id=sid,
+        title=f"Suggestion {sid}",
+        description=description,
+        priority=priority,
+        affected_files=list(files),
+    )
+
+
+def batch_ids(batches):
+    return [[s.id for s in batch] for batch in batches]
+
+
+class TestConflicts:
+    def test_overlapping_footprints_conflict(self):
+        assert files_conflict({"a.py", "b.py"}, {"b.py"})
+        assert not files_conflict({"a.py"}, {"b.py"})
+
+    def test_unknown_footprint_conflicts_with_everything(self):
+        assert files_conflict(set(), {"a.py"})
+        assert files_conflict({"a.py"}, set())
+
+    def test_paths_are_normalized(self):
+        graph = build_conflict_graph([
+            make_suggestion("a", ["./src/app.py"]),
+            make_suggestion("b", ["src\\app.py"]),
+        ])
+        assert graph == {"a": {"b"}, "b": {"a"}}
+
+    def test_files_changed_widen_footprint(self):
+        first = make_suggestion("a", ["a.py"])
+        first.files_changed = ["b.py"]
+        graph = build_conflict_graph([first, make_suggestion("b", ["b.py"])])
+        assert graph["a"] == {"b"}
+
+
+class TestScheduleBatches:
+    def test_batches_never_contain_conflicts(self):
+        suggestions = [
+            make_suggestion("a", ["x.py"]),
+            make_suggestion("b", ["x.py", "y.py"]),
+            make_suggestion("c", ["y.py"]),
+            make_suggestion("d", ["z.py"]),
+        ]
+        graph = build_conflict_graph(suggestions)
+        batches = schedule_batches(suggestions)
+
+        assert sorted(s.id for batch in batches for s in batch) == ["a", "b", "c", "d"]
+        for batch in batches:
+            ids = {s.id for s in batch}
+            for sid in ids:
+                assert not graph[sid] & ids
+
+    def test_highest_priority_runs_first(self):
+        suggestions = [
+            make_suggestion("low", ["x.py"], priority=2),
+            make_suggestion("high", ["x.py"], priority=9),
+        ]
+        assert batch_ids(schedule_batches(suggestions)) == [["high"], ["low"]]
+
+    def test_unknown_footprint_runs_alone(self):
+        suggestions = [
+            make_suggestion("a", ["x.py"]),
+            make_suggestion("any", []),
+            make_suggestion("b", ["y.py"]),
+        ]
+        batches = batch_ids(schedule_batches(suggestions))
+        assert ["any"] in batches
+        assert sorted(map(sorted, batches)) == [["a", "b"], ["any"]]
+
+    def test_costlier_suggestions_start_first_within_a_batch(self):
+        suggestions = [
+            make_suggestion("small", ["a.py"]),
+            make_suggestion("large", ["b.py", "c.py", "d.py"]),
+        ]
+        assert batch_ids(schedule_batches(suggestions)) == [["large", "small"]]
+
+    def test_max_batch_size(self):
+        suggestions = [make_suggestion(str(i), [f"f{i}.py"]) for i in range(5)]
+        batches = schedule_batches(suggestions, max_batch_size=2)
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+class TestConflictScheduler:
+    def test_waits_only_for_conflicting_predecessors(self):
+        suggestions = [
+            make_suggestion("a", ["x.py"], priority=9),
+            make_suggestion("b", ["y.py"], priority=8),
+            make_suggestion("a2", ["x.py"], priority=3),
+            make_suggestion("b2", ["y.py"], priority=2),
+        ]
+        scheduler = ConflictScheduler(suggestions)
+
+        first = scheduler.next_ready()
+        second = scheduler.next_ready()
+        assert {first.id, second.id} == {"a", "b"}
+        assert scheduler.next_ready() is None
+
+        scheduler.mark_done(second)
+        follow_up = scheduler.next_ready()
+        assert follow_up.id == {"a": "a2", "b": "b2"}[second.id]
+        assert scheduler.next_ready() is None
+
+        scheduler.mark_done(first)
+        last = scheduler.next_ready()
+        assert last.id == {"a": "a2", "b": "b2"}[first.id]
+
+        scheduler.mark_done(follow_up)
+        assert not scheduler.finished
+        scheduler.mark_done(last)
+        assert scheduler.finished
+        assert scheduler.next_ready() is None
+
+    def test_dispatches_every_suggestion_once(self):
+        suggestions = [
+            make_suggestion(str(i), [f"f{i % 3}.py"], priority=1 + i % 10) for i in range(12)
+        ]
+        scheduler = ConflictScheduler(suggestions)
+        running = []
+        dispatched = []
+        while not scheduler.finished:
+            suggestion = scheduler.next_ready()
+            if suggestion is None:
+                scheduler.mark_done(running.pop(0))
+                continue
+            running.append(suggestion)
+            dispatched.append(suggestion.id)
+            # Running suggestions never share a file
+            files = [s.affected_files[0] for s in running]
+            assert len(files) == len(set(files))
+        assert sorted(dispatched) == sorted(s.id for s in suggestions)